@@ -24,6 +24,7 @@ class AnalysisFilter(FilterSet):
         keys.discard("page")
         keys.discard("with_simulations")
         keys.discard("order_by")
+        keys -= {"pagination", "cursor", "page_size"}
 
         instance_attributes = set(vars(self)["filters"].keys())
         if bool((keys - instance_attributes) & keys):
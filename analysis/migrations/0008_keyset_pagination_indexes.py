@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("analysis", "0007_workspace"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="analysis",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["user", "-date_updated", "-date_added", "-analysis_id"],
+                name="analysis_user_keyset_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workspace",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["user", "-date_updated", "-date_added", "-workspace_id"],
+                name="workspace_user_keyset_idx",
+            ),
+        ),
+    ]
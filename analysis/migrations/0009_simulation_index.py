@@ -0,0 +1,144 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Every simulation table keeps its simulation_index rows up to date from a row trigger,
+# so inserts, saves, queryset updates and the status updates of the core are all covered.
+# The trigger arguments are the type, the primary key column and the status column.
+SIMULATION_TABLES = [
+    ("strategy_simulation", "STRATEGY", "strategy_simulation_id", "type_status_id"),
+    ("margin_simulation", "MARGIN", "margin_simulation_id", "type_status_id"),
+    ("hedge_simulation", "HEDGE", "hedge_irr_simulation_id", "status_id"),
+]
+
+SYNC_FUNCTION_SQL = """
+CREATE FUNCTION sync_simulation_index() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM simulation_index
+        WHERE simulation_id = (to_jsonb(OLD) ->> TG_ARGV[1])::uuid;
+        RETURN OLD;
+    END IF;
+
+    INSERT INTO simulation_index (
+        simulation_id, analysis_id, type, name, status_id, simulation_status,
+        pin, result_id, date_added, date_updated, is_deleted
+    )
+    VALUES (
+        (to_jsonb(NEW) ->> TG_ARGV[1])::uuid, NEW.analysis_id, TG_ARGV[0], NEW.name,
+        (to_jsonb(NEW) ->> TG_ARGV[2])::uuid, NEW.simulation_status,
+        NEW.pin, NEW.result_id, NEW.date_added, NEW.date_updated, NEW.is_deleted
+    )
+    ON CONFLICT (simulation_id) DO UPDATE SET
+        analysis_id = EXCLUDED.analysis_id,
+        name = EXCLUDED.name,
+        status_id = EXCLUDED.status_id,
+        simulation_status = EXCLUDED.simulation_status,
+        pin = EXCLUDED.pin,
+        result_id = EXCLUDED.result_id,
+        date_updated = EXCLUDED.date_updated,
+        is_deleted = EXCLUDED.is_deleted;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGER_SQL = """
+CREATE TRIGGER {table}_simulation_index
+AFTER INSERT OR UPDATE OR DELETE ON {table}
+FOR EACH ROW EXECUTE FUNCTION sync_simulation_index('{type}', '{pk}', '{status}');
+
+INSERT INTO simulation_index (
+    simulation_id, analysis_id, type, name, status_id, simulation_status,
+    pin, result_id, date_added, date_updated, is_deleted
+)
+SELECT {pk}, analysis_id, '{type}', name, {status}, simulation_status,
+    pin, result_id, date_added, date_updated, is_deleted
+FROM {table};
+"""
+
+DROP_TRIGGER_SQL = "DROP TRIGGER {table}_simulation_index ON {table};"
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api_gateway", "0004_outbox_message"),
+        ("analysis", "0008_keyset_pagination_indexes"),
+        ("strategy_simulation", "0020_keyset_pagination_indexes"),
+        ("margin_simulation", "0009_keyset_pagination_indexes"),
+        ("hedge_simulation", "0008_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SimulationIndex",
+            fields=[
+                (
+                    "simulation_id",
+                    models.UUIDField(editable=False, primary_key=True, serialize=False),
+                ),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("STRATEGY", "STRATEGY"),
+                            ("MARGIN", "MARGIN"),
+                            ("HEDGE", "HEDGE"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("name", models.CharField(max_length=255)),
+                ("simulation_status", models.CharField()),
+                ("pin", models.BooleanField()),
+                ("result_id", models.UUIDField()),
+                ("date_added", models.DateTimeField()),
+                ("date_updated", models.DateTimeField()),
+                ("is_deleted", models.BooleanField()),
+                (
+                    "analysis",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="simulation_index",
+                        to="analysis.analysis",
+                    ),
+                ),
+                (
+                    "status",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        to="api_gateway.typestatus",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "simulation_index",
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("is_deleted", False)),
+                        fields=["analysis", "-pin", "-date_updated", "-simulation_id"],
+                        name="simulation_index_updated_idx",
+                    ),
+                    models.Index(
+                        condition=models.Q(("is_deleted", False)),
+                        fields=["analysis", "-pin", "-date_added", "simulation_id"],
+                        name="simulation_index_added_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunSQL(
+            sql=SYNC_FUNCTION_SQL,
+            reverse_sql="DROP FUNCTION sync_simulation_index();",
+        ),
+        *[
+            migrations.RunSQL(
+                sql=TRIGGER_SQL.format(table=table, type=type, pk=pk, status=status),
+                reverse_sql=DROP_TRIGGER_SQL.format(table=table),
+            )
+            for table, type, pk, status in SIMULATION_TABLES
+        ],
+    ]
@@ -1,6 +1,7 @@
 import uuid
 
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 
 from authentication.models import User
 from api_gateway.models import TypeCurrency
@@ -8,6 +9,39 @@ from analysis.models import TypeCategory
 from django.core.exceptions import ValidationError
 
 
+class AnalysisQuerySet(models.QuerySet):
+    def soft_delete(self) -> int:
+        """
+        Soft deletes the analyses of the queryset with their strategy, margin and hedge
+        simulations and strategy instances. Workspaces keep their links to the analyses
+        and leave deleted analyses out when they are read.
+        Runs a fixed number of statements whatever the number of analyses and simulations.
+        Returns the number of analyses deleted.
+        """
+        from hedge_simulation.models import HedgeSimulation
+        from margin_simulation.models import MarginSimulation
+        from strategy_simulation.models import StrategyInstance, StrategySimulation
+
+        with transaction.atomic():
+            analysis_ids = list(
+                self.filter(is_deleted=False).values_list("analysis_id", flat=True)
+            )
+            if not analysis_ids:
+                return 0
+
+            now = timezone.now()
+            StrategyInstance.objects.filter(
+                strategy_simulation__analysis_id__in=analysis_ids, is_deleted=False
+            ).update(is_deleted=True, date_updated=now)
+            for model in (StrategySimulation, MarginSimulation, HedgeSimulation):
+                model.objects.filter(
+                    analysis_id__in=analysis_ids, is_deleted=False
+                ).update(is_deleted=True, date_updated=now)
+            return Analysis.objects.filter(analysis_id__in=analysis_ids).update(
+                is_deleted=True, date_updated=now
+            )
+
+
 class Analysis(models.Model):
     """Analysis Object to be stored in the database"""
 
@@ -39,18 +73,22 @@ class Analysis(models.Model):
         null=True,
         related_name="analysis",
     )
+    objects = AnalysisQuerySet.as_manager()
 
     class Meta:
         db_table = "analysis"
         ordering = ("date_updated", "date_added")
+        indexes = [
+            models.Index(
+                fields=["user", "-date_updated", "-date_added", "-analysis_id"],
+                name="analysis_user_keyset_idx",
+                condition=models.Q(is_deleted=False),
+            )
+        ]
 
     def delete(self, *args, **kwargs):
+        Analysis.objects.filter(pk=self.pk).soft_delete()
         self.is_deleted = True
-        self.strategy_simulation.update(is_deleted=True)
-        for simulation in self.strategy_simulation.all():
-            simulation.strategy_instance.update(is_deleted=True)
-        self.margin_simulation.update(is_deleted=True)
-        self.save()
 
     def clean(self, *args, **kwargs):
         if self.base_currency == self.foreign_currency:
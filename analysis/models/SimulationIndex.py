@@ -0,0 +1,47 @@
+from django.db import models
+
+
+class SimulationIndex(models.Model):
+    """
+    One narrow row per strategy, margin and hedge simulation, so listings across
+    simulation types read a single table. Rows are written by database triggers on
+    the simulation tables, including the status updates made by the core, and must
+    not be saved from Django.
+    """
+
+    TYPE_CHOICES = (
+        ("STRATEGY", "STRATEGY"),
+        ("MARGIN", "MARGIN"),
+        ("HEDGE", "HEDGE"),
+    )
+
+    simulation_id = models.UUIDField(primary_key=True, editable=False)
+    analysis = models.ForeignKey(
+        "analysis.Analysis", models.DO_NOTHING, related_name="simulation_index"
+    )
+    type = models.CharField(max_length=10, choices=TYPE_CHOICES)
+    name = models.CharField(max_length=255)
+    status = models.ForeignKey(
+        "api_gateway.TypeStatus", models.DO_NOTHING, blank=True, null=True
+    )
+    simulation_status = models.CharField()
+    pin = models.BooleanField()
+    result_id = models.UUIDField()
+    date_added = models.DateTimeField()
+    date_updated = models.DateTimeField()
+    is_deleted = models.BooleanField()
+
+    class Meta:
+        db_table = "simulation_index"
+        indexes = [
+            models.Index(
+                fields=["analysis", "-pin", "-date_updated", "-simulation_id"],
+                name="simulation_index_updated_idx",
+                condition=models.Q(is_deleted=False),
+            ),
+            models.Index(
+                fields=["analysis", "-pin", "-date_added", "simulation_id"],
+                name="simulation_index_added_idx",
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
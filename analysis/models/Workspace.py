@@ -11,6 +11,13 @@ class Workspace(models.Model):
     class Meta:
         db_table = "workspace"
         ordering = ("-date_updated", "-date_added")
+        indexes = [
+            models.Index(
+                fields=["user", "-date_updated", "-date_added", "-workspace_id"],
+                name="workspace_user_keyset_idx",
+                condition=models.Q(is_deleted=False),
+            )
+        ]
 
     workspace_id = models.UUIDField(
         primary_key=True, default=uuid.uuid4, editable=False
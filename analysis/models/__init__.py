@@ -1,5 +1,6 @@
 from .Analysis import Analysis
 from .SimulationEnvironment import SimulationEnviroment
+from .SimulationIndex import SimulationIndex
 from .TypeAnalysisRole import TypeAnalysisRole
 from .TypeCategory import TypeCategory
 from .Workspace import Workspace
@@ -0,0 +1,11 @@
+from rest_framework import serializers
+
+
+class AnalysisBulkDeleteSerializer(serializers.Serializer):
+    """
+    Serializer for the ids of the analyses to delete at once
+    """
+
+    analysis_ids = serializers.ListField(
+        child=serializers.UUIDField(), allow_empty=False, max_length=1000
+    )
@@ -27,3 +27,12 @@ class AnalysisSerializer(serializers.ModelSerializer):
             "foreign_currency",
             "organization",
         ]
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Joins the category, currencies and organization to_representation reads
+        """
+        return queryset.select_related(
+            "type_category", "base_currency", "foreign_currency", "organization"
+        )
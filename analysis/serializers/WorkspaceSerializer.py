@@ -1,5 +1,13 @@
-from rest_framework.serializers import ModelSerializer, PrimaryKeyRelatedField
-from analysis.models import Workspace
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Count, Prefetch, Q, Value
+from rest_framework.serializers import (
+    IntegerField,
+    ListField,
+    ModelSerializer,
+    PrimaryKeyRelatedField,
+    UUIDField,
+)
+from analysis.models import Analysis, Workspace
 from api_gateway.utils.fields import CurrencyField
 from analysis.serializers import AnalysisSerializer
 
@@ -25,3 +33,62 @@ class WorkspaceSerializer(ModelSerializer):
             "analysis",
         )
         extra_kwargs = {"description": {"allow_blank": True, "required": False}}
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Loads the workspaces with their non deleted analyses and everything the analyses
+        show in two queries, whatever the number of workspaces and analyses
+        """
+        return queryset.select_related("base_currency").prefetch_related(
+            Prefetch(
+                "analysis",
+                queryset=AnalysisSerializer.setup_eager_loading(
+                    Analysis.objects.filter(is_deleted=False)
+                ),
+            )
+        )
+
+
+class WorkspaceSummarySerializer(ModelSerializer):
+    """
+    Serializer for the summary of a Workspace.
+    It lists the ids and the number of the workspace analyses instead of the analyses.
+    """
+
+    base_currency = CurrencyField(read_only=True)
+    analysis_count = IntegerField(read_only=True)
+    analysis_ids = ListField(child=UUIDField(), read_only=True)
+
+    class Meta:
+        model = Workspace
+        fields = (
+            "workspace_id",
+            "base_currency",
+            "name",
+            "date_added",
+            "date_updated",
+            "is_deleted",
+            "analysis_count",
+            "analysis_ids",
+        )
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Aggregates the ids and count of the non deleted analyses of every workspace
+        in the workspace query.
+        Meta.ordering is not applied to aggregated queries, so it is set explicitly.
+        """
+        return (
+            queryset.select_related("base_currency")
+            .annotate(
+                analysis_count=Count("analysis", filter=Q(analysis__is_deleted=False)),
+                analysis_ids=ArrayAgg(
+                    "analysis__analysis_id",
+                    filter=Q(analysis__is_deleted=False),
+                    default=Value([]),
+                ),
+            )
+            .order_by(*Workspace._meta.ordering)
+        )
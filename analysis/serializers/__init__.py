@@ -1,3 +1,4 @@
 from .AnalysisSerializer import AnalysisSerializer
+from .AnalysisBulkDeleteSerializer import AnalysisBulkDeleteSerializer
 from .SimulationEnvironmentSerializer import SimulationEnvironmentSerializer
-from .WorkspaceSerializer import WorkspaceSerializer
+from .WorkspaceSerializer import WorkspaceSerializer, WorkspaceSummarySerializer
@@ -3,3 +3,9 @@ from .create_analysis_test import CreateAnalysisTest
 from .delete_analysis_test import DeleteAnalysisTest
 from .detail_analysis_test import DetailAnalysisTest
 from .update_analysis_test import UpdateAnalysisTest
+from .simulation_list_test import SimulationListTest
+from .analysis_with_simulations_test import AnalysisWithSimulationsTest
+from .keyset_pagination_test import KeysetPaginationTest
+from .simulation_index_test import SimulationIndexTest
+from .bulk_delete_analysis_test import BulkDeleteAnalysisTest
+from .workspace_list_test import WorkspaceListTest
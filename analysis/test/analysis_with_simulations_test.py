@@ -0,0 +1,86 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from analysis.factory import AnalysisFactory
+from authentication.factory import UserFactory
+from hedge_simulation.factory import HedgeSimulationFactory
+from margin_simulation.factory import MarginSimulationFactory
+from strategy_simulation.factory import StrategySimulationFactory
+
+
+class AnalysisWithSimulationsTest(APITestCase):
+    """
+    Test case for listing analyses with their latest simulations.
+    It is designed to check the latest simulations of a page of analyses are loaded with a fixed number of queries
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating a verified user instance
+        2. Create two analyses with strategy, margin and hedge simulations
+        """
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.analyses = [AnalysisFactory(user=self.user) for _ in range(2)]
+        self.simulations = {
+            analysis.pk: self._create_simulations(analysis)
+            for analysis in self.analyses
+        }
+
+    def test_latest_simulations_of_every_analysis(self):
+        """
+        Test every analysis lists its two latest non deleted simulations across the simulation types
+        """
+        response = self._list(with_simulations=2)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = {
+            analysis["analysis_id"]: analysis for analysis in response.data["results"]
+        }
+        for analysis in self.analyses:
+            strategy, margin, hedge = self.simulations[analysis.pk]
+            simulations = results[str(analysis.pk)]["simulations"]
+            self.assertEqual(
+                [(simulation["type"], simulation["id"]) for simulation in simulations],
+                [("HEDGE", str(hedge.pk)), ("MARGIN", str(margin.pk))],
+            )
+
+        response = self._list(with_simulations=5)
+        for analysis in response.data["results"]:
+            self.assertEqual(
+                [simulation["type"] for simulation in analysis["simulations"]],
+                ["HEDGE", "MARGIN", "STRATEGY"],
+            )
+
+    def test_query_count_is_constant(self):
+        """
+        Test listing six analyses costs as many queries as listing two
+        """
+        baseline = self._count_queries()
+        for _ in range(4):
+            self._create_simulations(AnalysisFactory(user=self.user))
+        self.assertEqual(self._count_queries(), baseline)
+
+    def _create_simulations(self, analysis):
+        strategy = StrategySimulationFactory(analysis=analysis)
+        margin = MarginSimulationFactory(
+            analysis=analysis, strategy_simulation=strategy
+        )
+        hedge = HedgeSimulationFactory(analysis=analysis)
+        hedge.simulation_environment.save()
+        hedge.save()
+        StrategySimulationFactory(analysis=analysis, is_deleted=True)
+        return strategy, margin, hedge
+
+    def _list(self, **params):
+        return self.client.get(reverse("analysis-list"), params)
+
+    def _count_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self._list(with_simulations=3)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(queries)
@@ -0,0 +1,129 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from analysis.factory import AnalysisFactory, WorkspaceFactory
+from analysis.models import Analysis
+from authentication.factory import UserFactory
+from hedge_simulation.factory import HedgeSimulationFactory
+from hedge_simulation.models import HedgeSimulation
+from margin_simulation.factory import MarginSimulationFactory
+from margin_simulation.models import MarginSimulation
+from strategy_simulation.factory import (
+    StrategyInstanceFactory,
+    StrategySimulationFactory,
+)
+from strategy_simulation.models import StrategyInstance, StrategySimulation
+
+
+class BulkDeleteAnalysisTest(APITestCase):
+    """
+    Test case for the cascading soft delete of analyses.
+    It is designed to check that analyses are deleted with every simulation and instance in a fixed number of queries
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating two verified user instances
+        2. Create two analyses of user one, each with strategy, margin and hedge simulations
+        3. Create an analysis of user two and add every analysis to a workspace
+        """
+        self.user_one = UserFactory()
+        self.user_two = UserFactory()
+        self.client.force_authenticate(user=self.user_one)
+
+        self.analyses = [AnalysisFactory(user=self.user_one) for _ in range(2)]
+        for analysis in self.analyses:
+            self._add_simulations(analysis, 1)
+        self.other_analysis = AnalysisFactory(user=self.user_two)
+        self._add_simulations(self.other_analysis, 1)
+
+        self.workspace = WorkspaceFactory(user=self.user_one)
+        self.workspace.analysis.add(*self.analyses, self.other_analysis)
+
+    def test_bulk_delete(self):
+        """
+        Test the analyses are soft deleted with their simulations and instances, keeping their workspace links
+        """
+        response = self._bulk_delete(self.analyses)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        deleted_ids = [analysis.pk for analysis in self.analyses]
+        self.assertFalse(
+            Analysis.objects.filter(pk__in=deleted_ids, is_deleted=False).exists()
+        )
+        for model in (StrategySimulation, MarginSimulation, HedgeSimulation):
+            self.assertFalse(
+                model.objects.filter(
+                    analysis_id__in=deleted_ids, is_deleted=False
+                ).exists()
+            )
+            self.assertFalse(model.objects.get(analysis=self.other_analysis).is_deleted)
+        self.assertFalse(
+            StrategyInstance.objects.filter(
+                strategy_simulation__analysis_id__in=deleted_ids, is_deleted=False
+            ).exists()
+        )
+        self.assertEqual(
+            set(self.workspace.analysis.all()), {*self.analyses, self.other_analysis}
+        )
+
+    def test_bulk_delete_other_user_analysis(self):
+        """
+        Test nothing is deleted when one of the analyses does not belong to the user
+        """
+        response = self._bulk_delete([*self.analyses, self.other_analysis])
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Analysis.objects.filter(is_deleted=True).exists())
+
+    def test_bulk_delete_validation(self):
+        """
+        Test an empty list of analyses is rejected
+        """
+        response = self.client.post(
+            reverse("analysis-bulk-delete"), {"analysis_ids": []}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_query_count_does_not_grow(self):
+        """
+        Test deleting an analysis with many simulations runs as many queries as one with a single simulation
+        """
+        small, large = AnalysisFactory(user=self.user_one), AnalysisFactory(
+            user=self.user_one
+        )
+        self._add_simulations(small, 1)
+        self._add_simulations(large, 10)
+
+        with CaptureQueriesContext(connection) as small_queries:
+            small.delete()
+        with CaptureQueriesContext(connection) as large_queries:
+            large.delete()
+
+        self.assertEqual(len(small_queries), len(large_queries))
+        self.assertEqual(
+            StrategyInstance.objects.filter(
+                strategy_simulation__analysis=large, is_deleted=False
+            ).count(),
+            0,
+        )
+
+    def _add_simulations(self, analysis, count):
+        for _ in range(count):
+            strategy = StrategySimulationFactory(analysis=analysis)
+            StrategyInstanceFactory(strategy_simulation=strategy, instance_group=1)
+            MarginSimulationFactory(analysis=analysis, strategy_simulation=strategy)
+            hedge = HedgeSimulationFactory(analysis=analysis)
+            hedge.simulation_environment.save()
+            hedge.save()
+
+    def _bulk_delete(self, analyses):
+        return self.client.post(
+            reverse("analysis-bulk-delete"),
+            {"analysis_ids": [str(analysis.pk) for analysis in analyses]},
+            format="json",
+        )
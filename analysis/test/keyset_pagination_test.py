@@ -0,0 +1,191 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from analysis.factory import AnalysisFactory, WorkspaceFactory
+from analysis.models import Analysis, Workspace
+from api_gateway.utils.pagination import KeysetPagination
+from authentication.factory import UserFactory
+from hedge_simulation.factory import HedgeSimulationFactory
+from margin_simulation.factory import MarginSimulationFactory
+from strategy_simulation.factory import StrategySimulationFactory
+from strategy_simulation.models import StrategySimulation
+
+
+class KeysetPaginationTest(APITestCase):
+    """
+    Test case for the cursor pagination of the analysis, workspace and simulation lists.
+    It is designed to check that walking the pages with the next links returns every row once, in order
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating one verified user instance
+        2. Create five analyses and four workspaces
+        3. Create strategy, margin and hedge simulations on the first analysis, one of them pinned
+        """
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.analyses = [AnalysisFactory(user=self.user) for _ in range(5)]
+        self.workspaces = [WorkspaceFactory(user=self.user) for _ in range(4)]
+
+        self.analysis = self.analyses[0]
+        self.strategies = [
+            StrategySimulationFactory(analysis=self.analysis, name=name)
+            for name in ["echo", "Bravo", "alpha"]
+        ]
+        self.margin = MarginSimulationFactory(
+            analysis=self.analysis,
+            strategy_simulation=self.strategies[0],
+            name="delta",
+            pin=True,
+        )
+        self.hedge = HedgeSimulationFactory(analysis=self.analysis, name="Charlie")
+        self.hedge.simulation_environment.save()
+        self.hedge.save()
+        StrategySimulationFactory(analysis=self.analysis, is_deleted=True)
+
+    def test_analysis_pages(self):
+        """
+        Test the analyses are walked in the order of the page mode, oldest first, without a count
+        """
+        pages = self._walk(reverse("analysis-list"), page_size=2)
+
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        walked = [analysis["analysis_id"] for page in pages for analysis in page]
+        self.assertEqual(
+            walked,
+            [
+                str(pk)
+                for pk in Analysis.objects.filter(user=self.user)
+                .order_by("date_updated", "date_added", "pk")
+                .values_list("pk", flat=True)
+            ],
+        )
+        response = self.client.get(reverse("analysis-list"), {"page_size": 10})
+        self.assertEqual(
+            [analysis["analysis_id"] for analysis in response.data["results"]], walked
+        )
+
+    def test_workspace_pages(self):
+        """
+        Test the workspaces are walked newest first
+        """
+        pages = self._walk(reverse("list-create-workspace"), page_size=3)
+
+        self.assertEqual(
+            [workspace["workspace_id"] for page in pages for workspace in page],
+            [
+                str(pk)
+                for pk in Workspace.objects.filter(user=self.user)
+                .order_by("-date_updated", "-date_added", "-pk")
+                .values_list("pk", flat=True)
+            ],
+        )
+
+    def test_strategy_simulation_pages(self):
+        """
+        Test the strategy simulations of an analysis are walked pin first, newest first
+        """
+        self.strategies[1].pin = True
+        self.strategies[1].save(new_result=False)
+        pages = self._walk(
+            reverse(
+                "strategy-simulation-list", kwargs={"analysis_id": self.analysis.pk}
+            ),
+            page_size=1,
+        )
+
+        self.assertEqual(
+            [
+                simulation["strategy_simulation_id"]
+                for page in pages
+                for simulation in page
+            ],
+            [
+                pk
+                for pk in StrategySimulation.objects.filter(
+                    analysis=self.analysis, is_deleted=False
+                )
+                .order_by("-pin", "-date_updated", "-pk")
+                .values_list("pk", flat=True)
+            ],
+        )
+        self.assertEqual(pages[0][0]["strategy_simulation_id"], self.strategies[1].pk)
+
+    def test_simulation_list_pages_match_offset_pages(self):
+        """
+        Test the cursor pages of the combined simulation list follow the page number ordering
+        """
+        url = reverse("simulation-list", kwargs={"analysis_id": self.analysis.pk})
+        for order_by in ["name", "date_added", "date_updated"]:
+            expected = self.client.get(url, {"order_by": order_by, "page_size": 10})
+            pages = self._walk(url, page_size=2, order_by=order_by)
+
+            self.assertEqual([len(page) for page in pages], [2, 2, 1])
+            self.assertEqual(
+                [simulation["id"] for page in pages for simulation in page],
+                [simulation["id"] for simulation in expected.data["results"]],
+            )
+        self.assertEqual(pages[0][0]["id"], str(self.margin.pk))
+
+    def test_deep_page_query_count(self):
+        """
+        Test a later page costs the same number of queries as the first one
+        """
+        url = reverse("simulation-list", kwargs={"analysis_id": self.analysis.pk})
+        first = self.client.get(url, {"pagination": "cursor", "page_size": 1})
+        with self.assertNumQueries(2):
+            second = self.client.get(first.data["next"])
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(first.data["results"], second.data["results"])
+
+    def test_invalid_cursor(self):
+        """
+        Test an undecodable cursor is rejected
+        """
+        response = self.client.get(reverse("analysis-list"), {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_with_invalid_values(self):
+        """
+        Test a decodable cursor holding values its sort key does not accept is rejected
+        """
+        for url, position in [
+            (reverse("analysis-list"), ["not-a-date", "not-a-date", "not-a-uuid"]),
+            (reverse("list-create-workspace"), [None, None, None]),
+            (
+                reverse("simulation-list", kwargs={"analysis_id": self.analysis.pk}),
+                [{"pin": True}, "2024-01-01T00:00:00", "not-a-uuid"],
+            ),
+        ]:
+            with self.subTest(url):
+                response = self.client.get(
+                    url, {"cursor": KeysetPagination.encode_cursor(position)}
+                )
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_order_by_with_cursor_is_rejected(self):
+        """
+        Test requesting another order than the cursor's is rejected rather than ignored
+        """
+        response = self.client.get(
+            reverse("analysis-list"), {"pagination": "cursor", "order_by": "name"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(reverse("analysis-list"), {"order_by": "name"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def _walk(self, url, **params):
+        pages = []
+        response = self.client.get(url, {"pagination": "cursor", **params})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            pages.append(response.data["results"])
+            if response.data["next"] is None:
+                return pages
+            response = self.client.get(response.data["next"])
@@ -0,0 +1,84 @@
+from django.test import TestCase
+
+from analysis.factory import AnalysisFactory
+from analysis.models import SimulationIndex
+from api_gateway.models import TypeStatus
+from authentication.factory import UserFactory
+from hedge_simulation.factory import HedgeSimulationFactory
+from hedge_simulation.models import HedgeSimulation
+from margin_simulation.factory import MarginSimulationFactory
+from strategy_simulation.factory import StrategySimulationFactory
+from strategy_simulation.models import StrategySimulation
+
+
+class SimulationIndexTest(TestCase):
+    """
+    Test case for the simulation_index table.
+    It is designed to check that the triggers keep one row per simulation in sync with every kind of write
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating one verified user instance with an analysis
+        2. Create a strategy, a margin and a hedge simulation on the analysis
+        """
+        self.analysis = AnalysisFactory(user=UserFactory())
+        self.strategy = StrategySimulationFactory(analysis=self.analysis, name="alpha")
+        self.margin = MarginSimulationFactory(
+            analysis=self.analysis, strategy_simulation=self.strategy
+        )
+        self.hedge = HedgeSimulationFactory(analysis=self.analysis)
+        self.hedge.simulation_environment.save()
+        self.hedge.save()
+
+    def test_rows_are_inserted(self):
+        """
+        Test every new simulation gets a row with its type, status and dates
+        """
+        rows = {row.simulation_id: row for row in SimulationIndex.objects.all()}
+
+        self.assertEqual(
+            {pk: row.type for pk, row in rows.items()},
+            {
+                self.strategy.pk: "STRATEGY",
+                self.margin.pk: "MARGIN",
+                self.hedge.pk: "HEDGE",
+            },
+        )
+        row = rows[self.strategy.pk]
+        self.strategy.refresh_from_db()
+        self.assertEqual(row.analysis_id, self.analysis.pk)
+        self.assertEqual(row.name, "alpha")
+        self.assertEqual(row.status_id, self.strategy.type_status_id)
+        self.assertEqual(row.result_id, self.strategy.result_id)
+        self.assertEqual(row.date_updated, self.strategy.date_updated)
+        self.assertEqual(str(rows[self.hedge.pk].status_id), str(self.hedge.status_id))
+
+    def test_saves_and_updates_are_synced(self):
+        """
+        Test model saves and queryset updates, as made by the core, reach the index
+        """
+        self.strategy.name = "renamed"
+        self.strategy.pin = True
+        self.strategy.save(new_result=False)
+        status = TypeStatus.objects.exclude(pk=self.strategy.type_status_id).first()
+        StrategySimulation.objects.filter(pk=self.strategy.pk).update(
+            simulation_status="COMPLETED", type_status=status
+        )
+
+        row = SimulationIndex.objects.get(pk=self.strategy.pk)
+        self.assertEqual(row.name, "renamed")
+        self.assertTrue(row.pin)
+        self.assertEqual(row.simulation_status, "COMPLETED")
+        self.assertEqual(row.status_id, status.pk)
+
+    def test_deletes_are_synced(self):
+        """
+        Test soft deleted simulations are flagged and hard deleted ones are removed
+        """
+        self.margin.delete()
+        HedgeSimulation.objects.filter(pk=self.hedge.pk).delete()
+
+        self.assertTrue(SimulationIndex.objects.get(pk=self.margin.pk).is_deleted)
+        self.assertFalse(SimulationIndex.objects.filter(pk=self.hedge.pk).exists())
@@ -0,0 +1,145 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from analysis.factory import AnalysisFactory
+from analysis.utils import SimulationListHelper
+from api_gateway.models import TypeStatus
+from authentication.factory import UserFactory
+from hedge_simulation.factory import HedgeSimulationFactory
+from margin_simulation.factory import MarginSimulationFactory
+from strategy_simulation.factory import StrategySimulationFactory
+from strategy_simulation.models import StrategySimulation
+
+
+class SimulationListTest(APITestCase):
+    """
+    Test case for listing the simulations of an analysis.
+    It is designed to check that strategy, margin and hedge simulations are filtered, sorted and paginated together
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating one verified user instance
+        2. Create an analysis with two strategy, one margin and one hedge simulation
+        3. Pin the margin simulation and delete another strategy simulation
+        """
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.analysis = AnalysisFactory(user=self.user)
+        self.first_status, self.second_status = TypeStatus.objects.order_by("name")[:2]
+
+        self.strategy_one = StrategySimulationFactory(
+            analysis=self.analysis, name="beta", type_status=self.first_status
+        )
+        self.strategy_two = StrategySimulationFactory(
+            analysis=self.analysis, name="Alpha", type_status=self.second_status
+        )
+        self.margin = MarginSimulationFactory(
+            analysis=self.analysis,
+            strategy_simulation=self.strategy_one,
+            name="delta",
+            type_status=self.first_status,
+            pin=True,
+        )
+        self.hedge = HedgeSimulationFactory(analysis=self.analysis, name="Gamma")
+        self.hedge.status = self.second_status
+        self.hedge.simulation_environment.save()
+        self.hedge.save()
+        StrategySimulationFactory(analysis=self.analysis, is_deleted=True)
+
+    def test_list_pinned_first_newest_first(self):
+        """
+        Test the non deleted simulations of every type are listed pin first, newest first
+        """
+        response = self._list(page_size=10)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 4)
+        self.assertEqual(
+            [simulation["id"] for simulation in response.data["results"]],
+            [
+                str(self.margin.pk),
+                str(self.hedge.pk),
+                str(self.strategy_two.pk),
+                str(self.strategy_one.pk),
+            ],
+        )
+        self.assertEqual(
+            [simulation["type"] for simulation in response.data["results"]],
+            ["MARGIN", "HEDGE", "STRATEGY", "STRATEGY"],
+        )
+
+    def test_default_order_is_latest_update(self):
+        """
+        Test the helper defaults to the simulation models' ordering, pin first and latest
+        update first, with ties broken like the simulation_index index
+        """
+        self.strategy_one.save(new_result=False)
+        simulations = SimulationListHelper.simulation_queryset(self.analysis)
+        self.assertEqual(
+            [simulation["simulation_id"] for simulation in simulations],
+            [self.margin.pk, self.strategy_one.pk, self.hedge.pk, self.strategy_two.pk],
+        )
+
+        StrategySimulation.objects.filter(
+            pk__in=[self.strategy_one.pk, self.strategy_two.pk]
+        ).update(date_updated=self.hedge.date_updated)
+        tied = sorted([self.strategy_one.pk, self.strategy_two.pk, self.hedge.pk])
+        self.assertEqual(
+            [simulation["simulation_id"] for simulation in simulations.all()],
+            [self.margin.pk, *reversed(tied)],
+        )
+
+    def test_pages_are_sliced_in_postgres(self):
+        """
+        Test a page is loaded with one query and the last page holds the remaining simulations
+        """
+        simulations = SimulationListHelper.simulation_queryset(self.analysis)
+        with self.assertNumQueries(1):
+            self.assertEqual(len(list(simulations[2:4])), 2)
+
+        response = self._list(page_size=3, page=2)
+        self.assertEqual(response.data["count"], 4)
+        self.assertEqual(
+            [simulation["id"] for simulation in response.data["results"]],
+            [str(self.strategy_one.pk)],
+        )
+
+    def test_filter_by_type_and_status_ordered_by_name(self):
+        """
+        Test the type and status filters with the case insensitive name ordering
+        """
+        response = self._list(
+            page_size=10,
+            order_by="name",
+            status=self.second_status.name,
+        )
+        self.assertEqual(
+            [simulation["name"] for simulation in response.data["results"]],
+            ["Alpha", "Gamma"],
+        )
+
+        response = self._list(
+            page_size=10,
+            order_by="name",
+            type="Strategy Simulation,Margin Simulation",
+        )
+        self.assertEqual(
+            [simulation["name"] for simulation in response.data["results"]],
+            ["delta", "Alpha", "beta"],
+        )
+
+    def test_invalid_order(self):
+        """
+        Test an unsupported order_by is rejected
+        """
+        response = self._list(order_by="notional")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def _list(self, **params):
+        return self.client.get(
+            reverse("simulation-list", kwargs={"analysis_id": self.analysis.pk}),
+            params,
+        )
@@ -0,0 +1,120 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from analysis.factory import AnalysisFactory, WorkspaceFactory
+from analysis.models import Analysis
+from authentication.factory import UserFactory
+from organization.factory import OrganizationFactory
+
+
+class WorkspaceListTest(APITestCase):
+    """
+    Test case for listing workspaces with their analyses.
+    It is designed to check that workspaces are loaded in a fixed number of queries and summarized on request
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating one verified user instance
+        2. Create two workspaces with two analyses of an organization and one empty workspace
+        """
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        organization = OrganizationFactory()
+        self.workspaces = [WorkspaceFactory(user=self.user) for _ in range(2)]
+        self.analyses = {}
+        for workspace in self.workspaces:
+            analyses = [
+                AnalysisFactory(user=self.user, organization=organization)
+                for _ in range(2)
+            ]
+            workspace.analysis.add(*analyses)
+            self.analyses[str(workspace.pk)] = analyses
+        self.empty_workspace = WorkspaceFactory(user=self.user)
+
+    def test_query_count_does_not_grow(self):
+        """
+        Test listing more workspaces and analyses does not run more queries
+        """
+        with CaptureQueriesContext(connection) as small:
+            response = self._list()
+        self.assertEqual(
+            [len(workspace["analysis"]) for workspace in response.data["results"]],
+            [0, 2, 2],
+        )
+
+        for workspace in [WorkspaceFactory(user=self.user) for _ in range(2)]:
+            workspace.analysis.add(*[AnalysisFactory(user=self.user) for _ in range(3)])
+        with CaptureQueriesContext(connection) as large:
+            response = self._list(page_size=10)
+
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertEqual(len(small), len(large))
+
+    def test_summary(self):
+        """
+        Test the summary lists the analysis ids and count of every workspace
+        """
+        response = self._list(view="summary")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        summaries = {
+            workspace["workspace_id"]: workspace
+            for workspace in response.data["results"]
+        }
+        for workspace in self.workspaces:
+            summary = summaries[str(workspace.pk)]
+            self.assertNotIn("analysis", summary)
+            self.assertEqual(summary["analysis_count"], 2)
+            self.assertCountEqual(
+                summary["analysis_ids"],
+                [str(analysis.pk) for analysis in self.analyses[str(workspace.pk)]],
+            )
+        self.assertEqual(summaries[str(self.empty_workspace.pk)]["analysis_count"], 0)
+        self.assertEqual(summaries[str(self.empty_workspace.pk)]["analysis_ids"], [])
+
+    def test_retrieve_summary(self):
+        """
+        Test a single workspace can be summarized too
+        """
+        workspace = self.workspaces[0]
+        response = self.client.get(
+            reverse("retrieve-update-workspace", kwargs={"workspace_id": workspace.pk}),
+            {"view": "summary"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["analysis_count"], 2)
+
+    def test_deleted_analyses_are_hidden(self):
+        """
+        Test a soft deleted analysis stays linked to its workspace but is left out of the full and summary views
+        """
+        workspace = self.workspaces[0]
+        deleted, kept = self.analyses[str(workspace.pk)]
+        Analysis.objects.filter(pk=deleted.pk).soft_delete()
+        self.assertIn(deleted, workspace.analysis.all())
+
+        workspaces = {
+            item["workspace_id"]: item for item in self._list().data["results"]
+        }
+        self.assertEqual(
+            [
+                str(item["analysis_id"])
+                for item in workspaces[str(workspace.pk)]["analysis"]
+            ],
+            [str(kept.pk)],
+        )
+        summaries = {
+            item["workspace_id"]: item
+            for item in self._list(view="summary").data["results"]
+        }
+        self.assertEqual(summaries[str(workspace.pk)]["analysis_count"], 1)
+        self.assertEqual(summaries[str(workspace.pk)]["analysis_ids"], [str(kept.pk)])
+
+    def _list(self, **params):
+        return self.client.get(reverse("list-create-workspace"), params)
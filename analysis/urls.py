@@ -8,6 +8,11 @@ from strategy_simulation.views import *
 urlpatterns = [
     # analysis
     path("", AnalysisListCreateAPIView.as_view(), name="analysis-list"),
+    path(
+        "bulk-delete/",
+        AnalysisBulkDeleteAPIView.as_view(),
+        name="analysis-bulk-delete",
+    ),
     path("<uuid:analysis_id>/", AnalysisApiView.as_view(), name="analysis-detail"),
     path(
         "<uuid:analysis_id>/simulations",
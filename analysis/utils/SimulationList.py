@@ -1,6 +1,11 @@
+from django.db import connection
+from django.db.models.functions import Lower
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
+from analysis.models import SimulationIndex
+from api_gateway.utils.pagination import KeysetPagination
 from hedge_simulation.models import HedgeSimulation
 from margin_simulation.models import MarginSimulation
 from strategy_simulation.models import StrategySimulation
@@ -35,101 +40,142 @@ class SimulationListHelper:
         simulation.pin = not simulation.pin
         simulation.save(new_result=False)
 
+    # Sort expressions of the supported order_by values, pinned simulations come first.
+    # The date orderings follow the directions of the simulation_index indexes
+    ORDERINGS = {
+        "name": ["-pin", "sort_name", "simulation_id"],
+        "date_added": ["-pin", "-date_added", "simulation_id"],
+        "date_updated": ["-pin", "-date_updated", "-simulation_id"],
+    }
+    # The ordering of the simulation models
+    DEFAULT_ORDER = "date_updated"
+    COLUMNS = [
+        "date_added",
+        "date_updated",
+        "name",
+        "simulation_status",
+        "pin",
+        "result_id",
+        "simulation_id",
+        "type",
+        "sort_name",
+    ]
+
+    # simulation_index types of the type filter labels
+    TYPES = {
+        "Strategy Simulation": "STRATEGY",
+        "Margin Simulation": "MARGIN",
+        "Hedge IRR": "HEDGE",
+    }
+
     @staticmethod
-    def to_representation(
+    def simulation_queryset(
         instance,
-        request,
         simulation_order=None,
         simulation_type=None,
         simulation_status=None,
     ):
-        combined_results = []
-        pagination = CustomPagination()
-        simulation_instances = []
-        if (
-            "Strategy Simulation" in process_parameter(simulation_type)
-            or simulation_type is None
-        ):
-            simulation_instances.extend(
-                StrategySimulation.objects.filter(
-                    analysis_id=instance.analysis_id,
-                    is_deleted=False,
-                ).order_by(simulation_order)
-                if simulation_order
-                else StrategySimulation.objects.filter(analysis_id=instance.analysis_id)
-            )
-
-        if (
-            "Margin Simulation" in process_parameter(simulation_type)
-            or simulation_type is None
-        ):
-            simulation_instances.extend(
-                MarginSimulation.objects.filter(
-                    analysis_id=instance.analysis_id,
-                    is_deleted=False,
-                ).order_by(simulation_order)
-                if simulation_order
-                else MarginSimulation.objects.filter(analysis_id=instance.analysis_id)
+        """
+        Returns the non deleted simulations of every requested type from the
+        simulation_index table, filtered by status name and sorted pin first in Postgres
+        """
+        ordering = SimulationListHelper.ORDERINGS.get(
+            simulation_order or SimulationListHelper.DEFAULT_ORDER
+        )
+        if ordering is None:
+            raise ValidationError(
+                {
+                    "order_by": f"Must be one of {', '.join(SimulationListHelper.ORDERINGS)}"
+                }
             )
 
-        if "Hedge IRR" in process_parameter(simulation_type) or simulation_type is None:
-            simulation_instances.extend(
-                HedgeSimulation.objects.filter(
-                    analysis_id=instance.analysis_id,
-                    is_deleted=False,
-                ).order_by(simulation_order)
-                if simulation_order
-                else HedgeSimulation.objects.filter(analysis_id=instance.analysis_id)
+        queryset = SimulationIndex.objects.filter(
+            analysis_id=instance.analysis_id, is_deleted=False
+        )
+        if simulation_type is not None:
+            queryset = queryset.filter(
+                type__in=[
+                    SimulationListHelper.TYPES[label]
+                    for label in process_parameter(simulation_type)
+                    if label in SimulationListHelper.TYPES
+                ]
             )
-
         if simulation_status:
-            simulation_instances = [
-                simulation
-                for simulation in simulation_instances
-                if getattr(
-                    simulation,
-                    (
-                        "status"
-                        if isinstance(simulation, HedgeSimulation)
-                        else "type_status"
-                    ),
-                ).name
-                in process_parameter(simulation_status)
-            ]
-
-        if simulation_order:
-            reverse = simulation_order.lower() == "name"
-            simulation_instances.sort(
-                key=lambda x: (
-                    getattr(x, simulation_order).lower()
-                    if reverse
-                    else getattr(x, simulation_order)
-                ),
-                reverse=not reverse,
+            queryset = queryset.filter(
+                status__name__in=process_parameter(simulation_status)
             )
+        return (
+            queryset.annotate(sort_name=Lower("name"))
+            .values(*SimulationListHelper.COLUMNS)
+            .order_by(*ordering)
+        )
 
-        if simulation_instances:
-            paginated_instances = pagination.paginate_queryset(
-                simulation_instances, request
+    @staticmethod
+    def latest_simulation_ids(analysis_ids, take):
+        """
+        Returns the (analysis_id, type, simulation_id) of the `take` most recently updated
+        non deleted simulations of every analysis, newest first, ranked with one
+        ROW_NUMBER() window over the simulation_index table
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT analysis_id, type, simulation_id
+                FROM (
+                    SELECT
+                        analysis_id,
+                        type,
+                        simulation_id,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY analysis_id
+                            ORDER BY date_updated DESC, simulation_id DESC
+                        ) AS position
+                    FROM simulation_index
+                    WHERE analysis_id = ANY(%(analysis_ids)s::uuid[]) AND NOT is_deleted
+                ) AS ranked
+                WHERE position <= %(take)s
+                ORDER BY analysis_id, position
+                """,
+                {"analysis_ids": [str(pk) for pk in analysis_ids], "take": take},
             )
+            return cursor.fetchall()
 
-            for simulation in paginated_instances:
-                combined_results.append(
-                    {
-                        "id": str(simulation.pk),
-                        "type": simulation.type,
-                        "date_updated": simulation.date_updated,
-                        "name": simulation.name,
-                        "simulation_status": simulation.simulation_status,
-                        "pin": simulation.pin,
-                        "result_id": simulation.result_id,
-                    }
-                )
-
-            combined_results.sort(key=lambda x: (x["pin"]), reverse=True)
-
-        return (
-            pagination.get_paginated_response(combined_results[:3])
-            if combined_results
-            else Response([])
+    @staticmethod
+    def to_representation(
+        instance,
+        request,
+        simulation_order=None,
+        simulation_type=None,
+        simulation_status=None,
+    ):
+        simulations = SimulationListHelper.simulation_queryset(
+            instance, simulation_order, simulation_type, simulation_status
+        )
+        if KeysetPagination.requested(request):
+            pagination = KeysetPagination(
+                SimulationListHelper.ORDERINGS[
+                    simulation_order or SimulationListHelper.DEFAULT_ORDER
+                ],
+                CustomPagination.page_size,
+            )
+            paginated_simulations = pagination.paginate_queryset(simulations, request)
+        else:
+            pagination = CustomPagination()
+            paginated_simulations = pagination.paginate_queryset(simulations, request)
+            if not paginated_simulations:
+                return Response([])
+
+        return pagination.get_paginated_response(
+            [
+                {
+                    "id": str(simulation["simulation_id"]),
+                    "type": simulation["type"],
+                    "date_updated": simulation["date_updated"],
+                    "name": simulation["name"],
+                    "simulation_status": simulation["simulation_status"],
+                    "pin": simulation["pin"],
+                    "result_id": simulation["result_id"],
+                }
+                for simulation in paginated_simulations
+            ]
         )
@@ -1,4 +1,8 @@
-from .analysis import AnalysisListCreateAPIView, AnalysisApiView
+from .analysis import (
+    AnalysisApiView,
+    AnalysisBulkDeleteAPIView,
+    AnalysisListCreateAPIView,
+)
 from .workspace import (
     ListCreateWorkspaceAPIView,
     RetrieveUpdateDestroyWorkspaceAPIView,
@@ -2,12 +2,16 @@
 from django.utils.decorators import method_decorator
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg.utils import swagger_auto_schema
-from rest_framework import generics
+from rest_framework import generics, serializers, status
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from analysis.models import Analysis
-from analysis.serializers import AnalysisSerializer
-from api_gateway.utils.mixins import NonDeletedQuerySetMixin
+from analysis.serializers import AnalysisBulkDeleteSerializer, AnalysisSerializer
+from analysis.utils import SimulationListHelper
+from api_gateway.exceptions import GenericAPIError
+from api_gateway.utils.mixins import KeysetPaginationMixin, NonDeletedQuerySetMixin
+from api_gateway.utils.pagination import KeysetPagination
 from authentication.mixins import UserQuerySetMixin
 from hedge_simulation.models import HedgeSimulation
 from hedge_simulation.serializer import HedgeIRRSerializer
@@ -21,18 +25,28 @@ from ..filters import AnalysisFilter
 @method_decorator(swagger_auto_schema(tags=["Analysis"]), "get")
 @method_decorator(swagger_auto_schema(tags=["Analysis"]), "post")
 class AnalysisListCreateAPIView(
-    NonDeletedQuerySetMixin, UserQuerySetMixin, generics.ListCreateAPIView
+    KeysetPaginationMixin,
+    NonDeletedQuerySetMixin,
+    UserQuerySetMixin,
+    generics.ListCreateAPIView,
 ):
     """API view for retrieving list of analyses created by authenticated user"""
 
     queryset = Analysis.objects.filter()
+    # Meta.ordering with the primary key to break ties
+    keyset_ordering = ["date_updated", "date_added", "pk"]
     serializer_class = AnalysisSerializer
     filterset_class = AnalysisFilter
     filter_backends = [DjangoFilterBackend]
 
     def get_queryset(self):
         analysis_order = self.request.query_params.get("order_by")
-        queryset = super().get_queryset()
+        if analysis_order and KeysetPagination.requested(self.request):
+            # The cursor is keyed on keyset_ordering, it can not follow another order
+            raise serializers.ValidationError(
+                {"order_by": "order_by can not be combined with cursor pagination"}
+            )
+        queryset = AnalysisSerializer.setup_eager_loading(super().get_queryset())
         if analysis_order:
             queryset = queryset.order_by(analysis_order)
 
@@ -45,37 +59,68 @@ class AnalysisListCreateAPIView(
         page = self.request.query_params.get("page")
         analyses_with_simulation = []
         if withSimulations != None and withSimulations.isnumeric():
-            take = int(withSimulations)
-            for analysis in analyses:
-                strategy_instances = StrategySimulation.objects.filter(
-                    analysis_id=analysis["analysis_id"]
-                ).order_by("-date_updated")[:take]
-                margin_instances = MarginSimulation.objects.filter(
-                    analysis_id=analysis["analysis_id"]
-                ).order_by("-date_updated")[:take]
-                hedge_instances = HedgeSimulation.objects.filter(
-                    analysis_id=analysis["analysis_id"]
-                ).order_by("-date_updated")[:take]
-                strategy_simulations = StrategySimulationSerializer(
-                    strategy_instances, many=True
-                ).data
-                margin_simulations = MarginSimulationSerializer(
-                    margin_instances, many=True
-                ).data
-                hedge_simulations = HedgeIRRSerializer(hedge_instances, many=True).data
-                simulations = (
-                    strategy_simulations + margin_simulations + hedge_simulations
-                )
-                simulations.sort(
-                    key=lambda simulation: str(simulation["date_updated"]), reverse=True
-                )
-                analyses_with_simulation.append(
-                    {**analysis, "simulations": simulations[:take]}
-                )
+            simulations = self.latest_simulations(
+                [analysis["analysis_id"] for analysis in analyses],
+                int(withSimulations),
+            )
+            analyses_with_simulation = [
+                {
+                    **analysis,
+                    "simulations": simulations.get(str(analysis["analysis_id"]), []),
+                }
+                for analysis in analyses
+            ]
         data = analyses_with_simulation if analyses_with_simulation else analyses
         response = self.get_paginated_response(data)
         return response
 
+    def latest_simulations(self, analysis_ids, take):
+        """
+        Serializes the `take` latest simulations of every analysis, newest first, keyed by analysis id.
+        The simulations are ranked with one query and loaded with one query per simulation type.
+        """
+        ranked = SimulationListHelper.latest_simulation_ids(analysis_ids, take)
+        simulation_types = {
+            "STRATEGY": (
+                StrategySimulationSerializer.setup_eager_loading(
+                    StrategySimulation.objects.all()
+                ),
+                StrategySimulationSerializer,
+            ),
+            "MARGIN": (
+                MarginSimulation.objects.select_related(
+                    "type_status", "strategy_simulation__type_status"
+                ),
+                MarginSimulationSerializer,
+            ),
+            "HEDGE": (
+                HedgeSimulation.objects.select_related("simulation_environment"),
+                HedgeIRRSerializer,
+            ),
+        }
+
+        serialized = {}
+        for simulation_type, (queryset, serializer_class) in simulation_types.items():
+            simulation_ids = [
+                simulation_id
+                for _, ranked_type, simulation_id in ranked
+                if ranked_type == simulation_type
+            ]
+            if not simulation_ids:
+                continue
+            instances = list(queryset.filter(pk__in=simulation_ids))
+            for instance, data in zip(
+                instances, serializer_class(instances, many=True).data
+            ):
+                serialized[(simulation_type, instance.pk)] = data
+
+        simulations = {}
+        for analysis_id, simulation_type, simulation_id in ranked:
+            simulations.setdefault(str(analysis_id), []).append(
+                serialized[(simulation_type, simulation_id)]
+            )
+        return simulations
+
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
@@ -92,3 +137,25 @@ class AnalysisApiView(
     queryset = Analysis.objects.all()
     serializer_class = AnalysisSerializer
     lookup_field = "analysis_id"
+
+
+@method_decorator(
+    swagger_auto_schema(tags=["Analysis"], request_body=AnalysisBulkDeleteSerializer),
+    "post",
+)
+class AnalysisBulkDeleteAPIView(APIView):
+    """API view for soft deleting many analyses of the authenticated user at once"""
+
+    def post(self, request):
+        serializer = AnalysisBulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        analysis_ids = set(serializer.validated_data["analysis_ids"])
+
+        analyses = Analysis.objects.filter(
+            analysis_id__in=analysis_ids, user=request.user, is_deleted=False
+        )
+        # Delete all of them or none
+        if analyses.count() != len(analysis_ids):
+            raise GenericAPIError("Object not found", code=status.HTTP_404_NOT_FOUND)
+        analyses.soft_delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
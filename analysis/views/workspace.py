@@ -2,11 +2,12 @@ from typing import Literal
 
 from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
+from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
 from analysis.models import Workspace, Analysis
-from analysis.serializers import WorkspaceSerializer
-from api_gateway.utils.mixins import NonDeletedQuerySetMixin
+from analysis.serializers import WorkspaceSerializer, WorkspaceSummarySerializer
+from api_gateway.utils.mixins import KeysetPaginationMixin, NonDeletedQuerySetMixin
 from authentication.mixins import UserQuerySetMixin
 from api_gateway.exceptions import GenericAPIError
 from rest_framework.views import APIView
@@ -15,23 +16,60 @@ from rest_framework.generics import get_object_or_404
 from typing import Literal
 
 
-@method_decorator(swagger_auto_schema(tags=["Analysis"]), "get")
+WORKSPACE_VIEW = openapi.Parameter(
+    "view",
+    openapi.IN_QUERY,
+    type=openapi.TYPE_STRING,
+    enum=["summary"],
+    description="Set to summary to list the analysis ids and count instead of the analyses",
+    required=False,
+)
+
+
+class WorkspaceSerializerMixin:
+    """
+    Serializes workspaces with their analyses loaded in a fixed number of queries,
+    or read with ?view=summary with only the ids and count of their analyses.
+    """
+
+    def get_serializer_class(self):
+        if (
+            self.request.method == "GET"
+            and self.request.query_params.get("view") == "summary"
+        ):
+            return WorkspaceSummarySerializer
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        return self.get_serializer_class().setup_eager_loading(super().get_queryset())
+
+
+@method_decorator(
+    swagger_auto_schema(tags=["Analysis"], manual_parameters=[WORKSPACE_VIEW]), "get"
+)
 @method_decorator(swagger_auto_schema(tags=["Analysis"]), "post")
 class ListCreateWorkspaceAPIView(
-    NonDeletedQuerySetMixin, UserQuerySetMixin, ListCreateAPIView
+    WorkspaceSerializerMixin,
+    KeysetPaginationMixin,
+    NonDeletedQuerySetMixin,
+    UserQuerySetMixin,
+    ListCreateAPIView,
 ):
     """
     API view to list and create workspaces.
 
-    Inherits from ListCreateAPIView, NonDeletedQuerySetMixin, and UserQuerySetMixin.
+    Inherits from ListCreateAPIView, WorkspaceSerializerMixin, KeysetPaginationMixin,
+    NonDeletedQuerySetMixin, and UserQuerySetMixin.
 
     Attributes:
         queryset (QuerySet): The queryset of all workspaces.
         serializer_class (Serializer): The serializer class for workspace objects.
+        keyset_ordering (list): The sort key of the keyset pagination.
     """
 
     queryset = Workspace.objects.all()
     serializer_class = WorkspaceSerializer
+    keyset_ordering = ["-date_updated", "-date_added", "-pk"]
 
     def perform_create(self, serializer):
         """
@@ -43,17 +81,23 @@ class ListCreateWorkspaceAPIView(
         serializer.save(user=self.request.user)
 
 
-@method_decorator(swagger_auto_schema(tags=["Analysis"]), "get")
+@method_decorator(
+    swagger_auto_schema(tags=["Analysis"], manual_parameters=[WORKSPACE_VIEW]), "get"
+)
 @method_decorator(swagger_auto_schema(tags=["Analysis"]), "patch")
 @method_decorator(swagger_auto_schema(tags=["Analysis"]), "delete")
 @method_decorator(swagger_auto_schema(tags=["Analysis"]), "put")
 class RetrieveUpdateDestroyWorkspaceAPIView(
-    NonDeletedQuerySetMixin, UserQuerySetMixin, RetrieveUpdateDestroyAPIView
+    WorkspaceSerializerMixin,
+    NonDeletedQuerySetMixin,
+    UserQuerySetMixin,
+    RetrieveUpdateDestroyAPIView,
 ):
     """
     API view to retrieve, update, and destroy a workspace.
 
-    Inherits from RetrieveUpdateDestroyAPIView, NonDeletedQuerySetMixin, and UserQuerySetMixin.
+    Inherits from RetrieveUpdateDestroyAPIView, WorkspaceSerializerMixin, NonDeletedQuerySetMixin,
+    and UserQuerySetMixin.
 
     Attributes:
         queryset (QuerySet): The queryset of all workspaces.
@@ -2,7 +2,7 @@ import boto3
 
 from .s3 import S3
 from .ses import SES
-from .sqs import SQS
+from .sqs import SQS, LocalSQS
 from .ssm import SSM
 
 
@@ -31,7 +31,8 @@ class AWSManager:
         bucket_name: str,
         environment: str,
         ci: bool,
+        testing: bool = False,
     ):
         self.ses = SES(self.client, system_email, environment, ci)
-        self.sqs = SQS(self.client, queue_url)
+        self.sqs = LocalSQS() if testing else SQS(self.client, queue_url)
         self.s3 = S3(self.client, bucket_name)
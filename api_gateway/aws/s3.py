@@ -20,6 +20,14 @@ class S3:
         self.client.upload_fileobj(file, s3_bucket, path)
         self.logger.info(f"Uploaded file to s3://{s3_bucket}/{path}")
 
+    def open(self, path: str, bucket_name: str | None = None):
+        """
+        Open a streaming, file-like body of an S3 object
+        """
+        s3_bucket = bucket_name if bucket_name else self.bucket_name
+        self.logger.info(f"Streaming file from s3://{s3_bucket}/{path}")
+        return self.client.get_object(Bucket=s3_bucket, Key=path)["Body"]
+
     def download(
         self, s3_object_path: str, output_path: str, bucket_name: str | None = None
     ):
@@ -1,8 +1,8 @@
-import json
 from boto3 import Session
 from logging import getLogger
 
-from api_gateway.exceptions import GenericAPIError
+# send_message_batch rejects batches larger than 256 KiB, leave room for the attributes
+MAX_BATCH_BYTES = 250 * 1024
 
 
 class SQS:
@@ -12,14 +12,65 @@ class SQS:
         self.client = session.client("sqs")
         self.queue_url = queue_url
 
-    def enqueue(self, data: dict, message_group_id: str) -> bool:
-        try:
-            _data = json.dumps(data)
-            response = self.client.send_message(
+    def enqueue_batch(self, messages: list[dict]) -> dict:
+        """
+        Sends up to 10 encoded messages with as few send_message_batch calls as the
+        256 KiB batch size limit allows. Each message is a dict with an id, its body,
+        message attributes and message_group_id.
+        Returns the error of every message SQS did not accept, by id.
+        """
+        failed = {}
+        for batch in self.split_batch(messages):
+            response = self.client.send_message_batch(
                 QueueUrl=self.queue_url,
-                MessageBody=_data,
-                MessageGroupId=message_group_id,
+                Entries=[
+                    {
+                        "Id": str(message["id"]),
+                        "MessageBody": message["body"],
+                        "MessageGroupId": message["message_group_id"],
+                        "MessageAttributes": {
+                            name: {"DataType": "String", "StringValue": value}
+                            for name, value in message["attributes"].items()
+                        },
+                    }
+                    for message in batch
+                ],
             )
-            return response["ResponseMetadata"]["HTTPStatusCode"] == 200
-        except Exception as e:
-            raise GenericAPIError(f"Failed to enqueue message: {e}", code=500)
+            failed.update(
+                {
+                    entry["Id"]: entry.get("Message", entry["Code"])
+                    for entry in response.get("Failed", [])
+                }
+            )
+        return failed
+
+    @staticmethod
+    def split_batch(messages: list[dict], max_bytes: int = MAX_BATCH_BYTES):
+        batch, size = [], 0
+        for message in messages:
+            message_size = len(message["body"].encode())
+            if batch and size + message_size > max_bytes:
+                yield batch
+                batch, size = [], 0
+            batch.append(message)
+            size += message_size
+        if batch:
+            yield batch
+
+
+class LocalSQS:
+    """In-memory stand-in for the simulation queue, used while testing"""
+
+    def __init__(self):
+        self.messages = []
+
+    def enqueue_batch(self, messages: list[dict]) -> dict:
+        for message in messages:
+            self.messages.append(
+                {
+                    "body": message["body"],
+                    "attributes": message["attributes"],
+                    "message_group_id": message["message_group_id"],
+                }
+            )
+        return {}
@@ -1,4 +1,40 @@
+import hashlib
+import json
+
+
 class CoreAdapter:
+    # Identify the request rather than the simulated inputs
+    IDENTITY_KEYS = ("user_id", "result_id", "simulation_id")
+
+    @staticmethod
+    def input_hash(payload: dict) -> str:
+        """
+        SHA-256 of a core payload without the user, result and simulation ids
+        nor the environment creation date, so identical inputs hash the same
+        whoever and whatever submits them
+        """
+        inputs = {
+            key: value
+            for key, value in payload.items()
+            if key not in CoreAdapter.IDENTITY_KEYS
+        }
+        data = dict(inputs.get("data", {}))
+        # The simulation id is also sent as the simulation name
+        if data.get("name") == payload.get("simulation_id"):
+            data.pop("name")
+        # Every simulation gets its own environment, added at a different time
+        if "simulation_environment" in data:
+            data["simulation_environment"] = {
+                key: value
+                for key, value in data["simulation_environment"].items()
+                if key != "date_added"
+            }
+        inputs["data"] = data
+        canonical = json.dumps(
+            inputs, sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
     @staticmethod
     def strategy_simulation(user_id: str, result_id: str, data: dict) -> dict:
         return {
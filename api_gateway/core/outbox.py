@@ -0,0 +1,140 @@
+from datetime import timedelta
+from logging import getLogger
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from api_gateway.core.payload import encode_payload
+from api_gateway.models import OutboxMessage
+
+logger = getLogger()
+
+# send_message_batch accepts at most 10 entries
+BATCH_SIZE = 10
+MAX_ATTEMPTS = 8
+MAX_BACKOFF = timedelta(minutes=10)
+# Simulations a message can be sent for, by payload type
+SIMULATION_MODELS = {
+    "STRATEGY": "strategy_simulation.StrategySimulation",
+    "MARGIN": "margin_simulation.MarginSimulation",
+    "HEDGE": "hedge_simulation.HedgeSimulation",
+}
+
+
+def enqueue_message(data: dict, message_group_id: str) -> OutboxMessage:
+    """
+    Writes a message to the outbox in the current transaction.
+    It is only sent once committed, so a rollback never leaves a message behind.
+    """
+    return OutboxMessage.objects.create(body=data, message_group_id=message_group_id)
+
+
+def pending_messages():
+    return OutboxMessage.objects.filter(
+        date_sent__isnull=True,
+        next_attempt__lte=timezone.now(),
+        attempts__lt=MAX_ATTEMPTS,
+    ).order_by("outbox_message_id")
+
+
+def flush_outbox(
+    sqs=None, s3=None, version: int | None = None, limit: int | None = None
+) -> int:
+    """
+    Sends the pending outbox messages to SQS in batches of 10 and returns how many were sent.
+    Batches are claimed with SKIP LOCKED so several flushers can run side by side.
+    Bodies are encoded with the payload `version`, large ones being offloaded to `s3`.
+    Failed messages are retried with an exponential backoff, up to MAX_ATTEMPTS
+    after which the simulations waiting for them are marked FAILED.
+    """
+    from api_gateway.settings import AWS, CORE_PAYLOAD_VERSION
+
+    sqs = sqs or AWS.sqs
+    s3 = s3 or AWS.s3
+    version = version or CORE_PAYLOAD_VERSION
+
+    sent = 0
+    while limit is None or sent < limit:
+        with transaction.atomic():
+            batch = list(
+                pending_messages().select_for_update(skip_locked=True)[:BATCH_SIZE]
+            )
+            if not batch:
+                break
+
+            failed, encoded = {}, []
+            for message in batch:
+                try:
+                    body, attributes = encode_payload(message.body, version, s3)
+                except Exception as e:
+                    failed[str(message.pk)] = str(e)
+                    continue
+                encoded.append(
+                    {
+                        "id": message.pk,
+                        "body": body,
+                        "attributes": attributes,
+                        "message_group_id": message.message_group_id,
+                    }
+                )
+
+            try:
+                if encoded:
+                    failed.update(sqs.enqueue_batch(encoded))
+            except Exception as e:
+                failed.update({str(message["id"]): str(e) for message in encoded})
+
+            now = timezone.now()
+            delivered = [
+                message.pk for message in batch if str(message.pk) not in failed
+            ]
+            OutboxMessage.objects.filter(pk__in=delivered).update(
+                date_sent=now, attempts=F("attempts") + 1
+            )
+            for message in batch:
+                if str(message.pk) in failed:
+                    retry_message(message, failed[str(message.pk)], now)
+            sent += len(delivered)
+
+        if not delivered:
+            # Leave the failed batch to its backoff instead of spinning on it
+            break
+    return sent
+
+
+def retry_message(message: OutboxMessage, error: str, now):
+    message.attempts += 1
+    message.last_error = error
+    message.next_attempt = now + min(
+        timedelta(seconds=2**message.attempts), MAX_BACKOFF
+    )
+    message.save(update_fields=["attempts", "last_error", "next_attempt"])
+    if message.attempts < MAX_ATTEMPTS:
+        logger.warning(
+            f"Failed to send outbox message {message.pk} "
+            f"(attempt {message.attempts}): {error}"
+        )
+        return
+
+    failed = fail_simulations(message.body)
+    logger.error(
+        f"Gave up sending outbox message {message.pk} after {message.attempts} "
+        f"attempts, {failed} simulations marked FAILED: {error}"
+    )
+
+
+def fail_simulations(body: dict) -> int:
+    """
+    Marks the simulations still waiting for the result of a message body as FAILED
+    and returns how many were
+    """
+    model = SIMULATION_MODELS.get(body.get("type"))
+    if model is None or "result_id" not in body:
+        return 0
+    return (
+        apps.get_model(model)
+        .objects.filter(result_id=body["result_id"], simulation_status="ENQUEUED")
+        .update(simulation_status="FAILED")
+    )
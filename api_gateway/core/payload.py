@@ -0,0 +1,54 @@
+import base64
+import gzip
+import io
+import json
+from datetime import date
+from uuid import uuid4
+
+# Plain JSON payload, the original message format
+PLAIN = 1
+# Envelope with the gzip compressed payload inline or claim-checked in S3
+ENVELOPE = 2
+# SQS rejects messages larger than 256 KiB, leave room for the attributes
+MAX_MESSAGE_BYTES = 250 * 1024
+# Compressed payloads larger than this are stored in S3 and sent as a pointer
+CLAIM_CHECK_BYTES = 64 * 1024
+PAYLOAD_PREFIX = "core-payloads"
+
+
+def encode_payload(data: dict, version: int = PLAIN, s3=None) -> tuple[str, dict]:
+    """
+    Encodes a core payload into an SQS message body and its message attributes.
+    The payload_version attribute tells the core how to decode the body:
+    - 1: the payload as plain JSON
+    - 2: {"version": 2, "encoding": "gzip"} with either the base64 compressed payload
+      as "body" or, above CLAIM_CHECK_BYTES, the "bucket" and "key" of the S3 object
+    Plain payloads too large for SQS are sent as version 2.
+    """
+    body = json.dumps(data)
+    if version == PLAIN and len(body.encode()) <= MAX_MESSAGE_BYTES:
+        return body, {"payload_version": str(PLAIN)}
+
+    compressed = gzip.compress(body.encode())
+    envelope = {"version": ENVELOPE, "encoding": "gzip"}
+    if len(compressed) > CLAIM_CHECK_BYTES:
+        key = f"{PAYLOAD_PREFIX}/{date.today():%Y/%m/%d}/{uuid4()}.json.gz"
+        s3.upload(io.BytesIO(compressed), key)
+        envelope.update(bucket=s3.bucket_name, key=key)
+    else:
+        envelope["body"] = base64.b64encode(compressed).decode()
+    return json.dumps(envelope), {"payload_version": str(ENVELOPE)}
+
+
+def decode_payload(body: str, s3=None) -> dict:
+    """
+    Decodes a message body written by encode_payload, as the core does
+    """
+    data = json.loads(body)
+    if data.get("version") != ENVELOPE:
+        return data
+    if "key" in data:
+        compressed = s3.open(data["key"], bucket_name=data["bucket"]).read()
+    else:
+        compressed = base64.b64decode(data["body"])
+    return json.loads(gzip.decompress(compressed))
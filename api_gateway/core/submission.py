@@ -0,0 +1,32 @@
+from api_gateway.core.adapter import CoreAdapter
+from api_gateway.core.outbox import enqueue_message
+
+# Only finished results are reused: the core updates the status of the simulation
+# it was sent for, a pending result copied onto another simulation would never move on
+REUSABLE_STATUSES = ["COMPLETED"]
+
+
+def submit_simulation(queryset, simulation_id, payload: dict, message_group_id: str):
+    """
+    Queues a simulation for the core through the outbox unless a simulation of
+    `queryset` already completed with the same inputs, in which case its result is reused.
+    Requests still queued or in progress are not shared and the inputs are simulated again.
+
+    The input hash, result id and status are stored on the simulation and
+    the result id and status are returned for the response.
+    """
+    input_hash = CoreAdapter.input_hash(payload)
+    result = (
+        queryset.filter(input_hash=input_hash, simulation_status__in=REUSABLE_STATUSES)
+        .exclude(pk=simulation_id)
+        .order_by("-date_updated")
+        .values("result_id", "simulation_status")
+        .first()
+    )
+
+    if result is None:
+        enqueue_message(payload, message_group_id=message_group_id)
+        result = {"result_id": payload["result_id"], "simulation_status": "ENQUEUED"}
+
+    queryset.filter(pk=simulation_id).update(input_hash=input_hash, **result)
+    return result
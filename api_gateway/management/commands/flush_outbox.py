@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api_gateway.core.outbox import flush_outbox
+
+
+class Command(BaseCommand):
+    help = (
+        "Send the pending outbox messages to the simulation queue in batches of 10, "
+        "once or every --interval seconds"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Seconds to wait between flushes, defaults to 0 to flush once and exit",
+        )
+
+    def handle(self, *args, **options):
+        if options["interval"] < 0:
+            raise CommandError("--interval must be zero or positive")
+
+        while True:
+            sent = flush_outbox()
+            if sent:
+                self.stdout.write(f"Sent {sent} outbox messages")
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
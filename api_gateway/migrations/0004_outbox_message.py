@@ -0,0 +1,42 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:38
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api_gateway", "0003_alter_typecurrency_options"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxMessage",
+            fields=[
+                (
+                    "outbox_message_id",
+                    models.BigAutoField(primary_key=True, serialize=False),
+                ),
+                ("date_added", models.DateTimeField(auto_now_add=True)),
+                ("message_group_id", models.CharField(max_length=128)),
+                ("body", models.JSONField()),
+                ("attempts", models.IntegerField(default=0)),
+                (
+                    "next_attempt",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("date_sent", models.DateTimeField(blank=True, null=True)),
+                ("last_error", models.TextField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "outbox_message",
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("date_sent__isnull", True)),
+                        fields=["next_attempt"],
+                        name="outbox_message_pending_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import models
+from django.utils import timezone
+
+
+class OutboxMessage(models.Model):
+    """
+    Queue message written in the transaction that enqueues it and sent to SQS
+    by the outbox flusher once committed
+    """
+
+    outbox_message_id = models.BigAutoField(primary_key=True)
+    date_added = models.DateTimeField(auto_now_add=True)
+    message_group_id = models.CharField(max_length=128)
+    body = models.JSONField()
+    attempts = models.IntegerField(default=0)
+    next_attempt = models.DateTimeField(default=timezone.now)
+    date_sent = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True, null=True)
+
+    class Meta:
+        db_table = "outbox_message"
+        indexes = [
+            models.Index(
+                fields=["next_attempt"],
+                name="outbox_message_pending_idx",
+                condition=models.Q(date_sent__isnull=True),
+            )
+        ]
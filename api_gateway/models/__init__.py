@@ -2,3 +2,4 @@ from .ServiceLogCore import ServiceLogCore
 from .TypeCurrency import TypeCurrency
 from .TypeStatus import TypeStatus
 from .TypeTool import TypeTool
+from .OutboxMessage import OutboxMessage
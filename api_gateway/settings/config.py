@@ -32,6 +32,12 @@ DJANGO_DEBUG = bool(eval(get_env_var("DEBUG", "False")))
 DJANGO_TESTING = "test" in sys.argv
 ENVIRONMENT = get_env_var("ENVIRONMENT", required=True)
 CI = bool(eval(get_env_var("CI", "False")))
+SPOT_RATE_CACHE_TTL = int(
+    get_env_var("SPOT_RATE_CACHE_TTL", "60")
+)  # Seconds between checks for newly ingested spot history dates
+CORE_PAYLOAD_VERSION = int(
+    get_env_var("CORE_PAYLOAD_VERSION", "1")
+)  # Message format sent to the core, see api_gateway.core.payload
 
 if ENVIRONMENT not in ["dev", "staging", "prod", "demo"]:
     raise ValueError(
@@ -75,7 +81,9 @@ SIMULATION_QUEUE_URL = SETTINGS_STORE[
 BUCKET_NAME = SETTINGS_STORE["BUCKET_NAME"]
 
 # AWS Utilities setup
-AWS.configure(SYSTEM_EMAIL, SIMULATION_QUEUE_URL, BUCKET_NAME, ENVIRONMENT, CI)
+AWS.configure(
+    SYSTEM_EMAIL, SIMULATION_QUEUE_URL, BUCKET_NAME, ENVIRONMENT, CI, DJANGO_TESTING
+)
 
 # LinkedIn OAuth Parameters
 LINKEDIN_CLIENT_ID = SETTINGS_STORE["LINKEDIN_CLIENT_ID"]
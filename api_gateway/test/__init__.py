@@ -0,0 +1,3 @@
+from .core_payload_test import CorePayloadTest
+from .outbox_test import OutboxTest
+from .query_plan_test import QueryPlanTest
@@ -0,0 +1,92 @@
+import io
+import json
+
+from django.test import SimpleTestCase
+
+from api_gateway.aws.sqs import SQS
+from api_gateway.core.payload import (
+    CLAIM_CHECK_BYTES,
+    ENVELOPE,
+    MAX_MESSAGE_BYTES,
+    PLAIN,
+    decode_payload,
+    encode_payload,
+)
+
+
+class LocalS3:
+    """In-memory stand-in for the S3 bucket"""
+
+    bucket_name = "bucket"
+
+    def __init__(self):
+        self.objects = {}
+
+    def upload(self, file, path, bucket_name=None):
+        self.objects[path] = file.read()
+
+    def open(self, path, bucket_name=None):
+        return io.BytesIO(self.objects[path])
+
+
+class CorePayloadTest(SimpleTestCase):
+    """
+    Test case for encoding core payloads into SQS messages.
+    It is designed to check the payload versions, compression and S3 claim checks
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating an in-memory S3 bucket
+        2. Building a small payload and a hedge payload with a large harvest
+        """
+        self.s3 = LocalS3()
+        self.payload = {"user_id": "user", "data": {"notional": 1000.0}}
+        self.large_payload = {
+            "user_id": "user",
+            "data": {
+                "harvest": [
+                    [index, index * 1.5, "2024-01-01"] for index in range(20_000)
+                ]
+            },
+        }
+
+    def test_plain_payload(self):
+        """
+        Test version 1 sends small payloads as plain JSON
+        """
+        body, attributes = encode_payload(self.payload, PLAIN, self.s3)
+        self.assertEqual(json.loads(body), self.payload)
+        self.assertEqual(attributes, {"payload_version": "1"})
+
+    def test_compressed_payload(self):
+        """
+        Test version 2 sends small payloads compressed inline
+        """
+        body, attributes = encode_payload(self.payload, ENVELOPE, self.s3)
+        self.assertEqual(attributes, {"payload_version": "2"})
+        self.assertEqual(json.loads(body)["encoding"], "gzip")
+        self.assertEqual(decode_payload(body, self.s3), self.payload)
+        self.assertEqual(self.s3.objects, {})
+
+    def test_large_payload_is_claim_checked(self):
+        """
+        Test a payload too large for SQS is stored in S3 and sent as a pointer, even with version 1
+        """
+        self.assertGreater(len(json.dumps(self.large_payload)), MAX_MESSAGE_BYTES)
+
+        body, attributes = encode_payload(self.large_payload, PLAIN, self.s3)
+        envelope = json.loads(body)
+        self.assertEqual(attributes, {"payload_version": "2"})
+        self.assertEqual(envelope["bucket"], "bucket")
+        self.assertGreater(len(self.s3.objects[envelope["key"]]), CLAIM_CHECK_BYTES)
+        self.assertLess(len(body), 1024)
+        self.assertEqual(decode_payload(body, self.s3), self.large_payload)
+
+    def test_batches_are_split_by_size(self):
+        """
+        Test batches are split so their bodies stay under the SQS batch size limit
+        """
+        messages = [{"body": "x" * 100 * 1024} for _ in range(5)]
+        self.assertEqual([len(batch) for batch in SQS.split_batch(messages)], [2, 2, 1])
@@ -0,0 +1,125 @@
+import json
+
+from django.test import TestCase
+from django.utils import timezone
+
+from analysis.factory import AnalysisFactory
+from api_gateway.aws.sqs import LocalSQS
+from api_gateway.core.outbox import (
+    MAX_ATTEMPTS,
+    enqueue_message,
+    flush_outbox,
+    pending_messages,
+)
+from api_gateway.models import OutboxMessage
+from authentication.factory import UserFactory
+from strategy_simulation.factory import StrategySimulationFactory
+from strategy_simulation.models import StrategySimulation
+
+
+class RecordingSQS(LocalSQS):
+    """In-memory queue recording the size of every batch and rejecting some messages"""
+
+    def __init__(self, rejected=()):
+        super().__init__()
+        self.batches = []
+        self.rejected = set(rejected)
+
+    def enqueue_batch(self, messages):
+        self.batches.append(len(messages))
+        rejected = [m for m in messages if self.index(m) in self.rejected]
+        super().enqueue_batch([m for m in messages if m not in rejected])
+        return {str(m["id"]): "Throttled" for m in rejected}
+
+    @staticmethod
+    def index(message):
+        return json.loads(message["body"])["index"]
+
+
+class OutboxTest(TestCase):
+    """
+    Test case for the simulation outbox.
+    It is designed to check that queued messages are sent in batches of 10 and failed ones retried later
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Writing 23 messages to the outbox
+        """
+        for index in range(23):
+            enqueue_message({"index": index}, message_group_id=f"group-{index % 3}")
+
+    def test_flush_sends_batches_of_ten(self):
+        """
+        Test every pending message is sent once, in order, with batches of at most 10
+        """
+        sqs = RecordingSQS()
+        self.assertEqual(flush_outbox(sqs), 23)
+
+        self.assertEqual(sqs.batches, [10, 10, 3])
+        self.assertEqual(
+            [sqs.index(message) for message in sqs.messages], list(range(23))
+        )
+        self.assertEqual(sqs.messages[0]["attributes"], {"payload_version": "1"})
+        self.assertFalse(OutboxMessage.objects.filter(date_sent__isnull=True).exists())
+        self.assertEqual(flush_outbox(sqs), 0)
+
+    def test_failed_messages_are_retried_later(self):
+        """
+        Test a rejected message is kept with its error and postponed while the others are sent
+        """
+        sqs = RecordingSQS(rejected={4})
+        self.assertEqual(flush_outbox(sqs), 22)
+
+        failed = OutboxMessage.objects.get(date_sent__isnull=True)
+        self.assertEqual(failed.body, {"index": 4})
+        self.assertEqual(failed.attempts, 1)
+        self.assertEqual(failed.last_error, "Throttled")
+        self.assertGreater(failed.next_attempt, timezone.now())
+
+        # Not due yet
+        self.assertEqual(flush_outbox(RecordingSQS()), 0)
+        OutboxMessage.objects.filter(pk=failed.pk).update(next_attempt=timezone.now())
+        self.assertEqual(flush_outbox(RecordingSQS()), 1)
+
+    def test_unreachable_queue_keeps_messages(self):
+        """
+        Test an error sending the batch leaves all of its messages pending
+        """
+
+        class UnreachableSQS(LocalSQS):
+            def enqueue_batch(self, messages):
+                raise ConnectionError("Unable to reach the queue")
+
+        self.assertEqual(flush_outbox(UnreachableSQS()), 0)
+        self.assertEqual(OutboxMessage.objects.filter(attempts=1).count(), 10)
+        self.assertFalse(OutboxMessage.objects.filter(date_sent__isnull=False).exists())
+
+    def test_last_failed_attempt_fails_simulation(self):
+        """
+        Test a message failing its last attempt marks the simulation waiting for it FAILED
+        """
+        OutboxMessage.objects.update(date_sent=timezone.now())
+        simulation = StrategySimulationFactory(
+            analysis=AnalysisFactory(user=UserFactory())
+        )
+        StrategySimulation.objects.filter(pk=simulation.pk).update(
+            simulation_status="ENQUEUED"
+        )
+        message = enqueue_message(
+            {"type": "STRATEGY", "result_id": str(simulation.result_id), "index": 0},
+            message_group_id=str(simulation.pk),
+        )
+        OutboxMessage.objects.filter(pk=message.pk).update(attempts=MAX_ATTEMPTS - 2)
+
+        self.assertEqual(flush_outbox(RecordingSQS(rejected={0})), 0)
+        simulation.refresh_from_db()
+        self.assertEqual(simulation.simulation_status, "ENQUEUED")
+
+        OutboxMessage.objects.filter(pk=message.pk).update(next_attempt=timezone.now())
+        with self.assertLogs(level="ERROR"):
+            self.assertEqual(flush_outbox(RecordingSQS(rejected={0})), 0)
+        simulation.refresh_from_db()
+        self.assertEqual(simulation.simulation_status, "FAILED")
+        self.assertFalse(pending_messages().exists())
@@ -0,0 +1,244 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from analysis.factory import (
+    AnalysisFactory,
+    SimulationEnvironmentFactory,
+    WorkspaceFactory,
+)
+from analysis.models import Analysis, SimulationEnviroment, TypeCategory, Workspace
+from api_gateway.models import TypeCurrency, TypeStatus
+from authentication.factory import UserFactory
+from hedge_simulation.factory import HedgeSimulationFactory
+from hedge_simulation.models import HedgeSimulation
+from margin_simulation.factory import MarginSimulationFactory
+from margin_simulation.models import MarginSimulation
+from market.factory import FwdEfficiencyFactory, FxMovementFactory, SpotHistoryFactory
+from market.models import FxMovement
+from organization.factory import OrganizationFactory
+from strategy_simulation.factory import StrategySimulationFactory
+from strategy_simulation.models import StrategySimulation
+
+
+USERS = 20
+# Analyses per user, a quarter as many workspaces and market objects
+ROWS_PER_USER = 200
+SIMULATIONS_PER_ANALYSIS = 50
+
+
+class QueryPlanTest(APITestCase):
+    """
+    Test case for the query plans of the list endpoints.
+    It is designed to check that the page query of every list endpoint is answered from its partial index,
+    so dropping or breaking an index fails here before it slows production down
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up the test environment by:
+        1. Creating twenty verified user instances and five organizations
+        2. Bulk create analyses, workspaces and market objects for every user, a fifth of them deleted
+        3. Bulk create strategy, margin and hedge simulations on twenty analyses of the first user
+        4. Refresh the planner statistics
+        """
+        cls.users = [UserFactory() for _ in range(USERS)]
+        cls.user = cls.users[0]
+        organizations = [OrganizationFactory() for _ in range(5)]
+        cls.organization = organizations[1]
+        currencies = list(TypeCurrency.objects.all())
+        category = TypeCategory.objects.first()
+        type_status = TypeStatus.objects.first()
+
+        analyses = Analysis.objects.bulk_create(
+            AnalysisFactory.build(
+                user=user,
+                organization=organizations[index % len(organizations)],
+                type_category=category,
+                base_currency=currencies[index % len(currencies)],
+                foreign_currency=currencies[(index + 1) % len(currencies)],
+                is_deleted=index % 5 == 0,
+            )
+            for user in cls.users
+            for index in range(ROWS_PER_USER)
+        )
+        Workspace.objects.bulk_create(
+            WorkspaceFactory.build(
+                user=user,
+                base_currency=currencies[index % len(currencies)],
+                is_deleted=index % 5 == 0,
+            )
+            for user in cls.users
+            for index in range(ROWS_PER_USER // 4)
+        )
+        for factory in (FwdEfficiencyFactory, SpotHistoryFactory):
+            factory._meta.model.objects.bulk_create(
+                factory.build(
+                    user=user,
+                    base_currency=currencies[index % len(currencies)],
+                    foreign_currency=currencies[(index + 1) % len(currencies)],
+                    is_deleted=index % 5 == 0,
+                )
+                for user in cls.users
+                for index in range(ROWS_PER_USER // 4)
+            )
+        FxMovement.objects.bulk_create(
+            FxMovementFactory.build(user=user, is_deleted=index % 5 == 0)
+            for user in cls.users
+            for index in range(ROWS_PER_USER // 4)
+        )
+
+        simulated = [
+            analysis
+            for analysis in analyses
+            if analysis.user == cls.user and not analysis.is_deleted
+        ][:20]
+        cls.analysis = simulated[0]
+        environments = SimulationEnviroment.objects.bulk_create(
+            SimulationEnvironmentFactory.build_batch(
+                2 * len(simulated) * SIMULATIONS_PER_ANALYSIS
+            )
+        )
+        strategies = StrategySimulation.objects.bulk_create(
+            StrategySimulationFactory.build(
+                analysis=analysis,
+                simulation_environment=environments.pop(),
+                type_status=type_status,
+                is_deleted=index % 5 == 0,
+            )
+            for analysis in simulated
+            for index in range(SIMULATIONS_PER_ANALYSIS)
+        )
+        MarginSimulation.objects.bulk_create(
+            MarginSimulationFactory.build(
+                analysis=strategy.analysis,
+                strategy_simulation=strategy,
+                type_status=type_status,
+            )
+            for strategy in strategies
+        )
+        HedgeSimulation.objects.bulk_create(
+            HedgeSimulationFactory.build(
+                analysis=analysis, simulation_environment=environments.pop()
+            )
+            for analysis in simulated
+            for _ in range(SIMULATIONS_PER_ANALYSIS)
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+
+    def test_analysis_list(self):
+        """
+        Test the analysis list pages on the user partial index
+        """
+        self.assertPageUsesIndex(
+            reverse("analysis-list"), "analysis", "analysis_user_keyset_idx"
+        )
+        self.assertPageUsesIndex(
+            reverse("analysis-list"),
+            "analysis",
+            "analysis_user_keyset_idx",
+            pagination="cursor",
+        )
+
+    def test_analysis_list_by_organization(self):
+        """
+        Test the organization name filter still pages on the user partial index,
+        organizations being joined by primary key
+        """
+        self.assertPageUsesIndex(
+            reverse("analysis-list"),
+            "analysis",
+            "analysis_user_keyset_idx",
+            organization=self.organization.name.upper(),
+        )
+
+    def test_workspace_list(self):
+        """
+        Test the workspace list pages on the user partial index
+        """
+        self.assertPageUsesIndex(
+            reverse("list-create-workspace"), "workspace", "workspace_user_keyset_idx"
+        )
+
+    def test_simulation_lists(self):
+        """
+        Test the per type and combined simulation lists page on their partial indexes
+        """
+        kwargs = {"analysis_id": self.analysis.pk}
+        for url_name, table, index_name in [
+            (
+                "strategy-simulation-list",
+                "strategy_simulation",
+                "strategy_sim_keyset_idx",
+            ),
+            ("margin-simulation-list", "margin_simulation", "margin_sim_keyset_idx"),
+            ("hedge-irr-list-create", "hedge_simulation", "hedge_sim_keyset_idx"),
+        ]:
+            with self.subTest(url_name):
+                self.assertPageUsesIndex(
+                    reverse(url_name, kwargs=kwargs), table, index_name
+                )
+
+        url = reverse("simulation-list", kwargs=kwargs)
+        self.assertPageUsesIndex(url, "simulation_index", "simulation_index_added_idx")
+        self.assertPageUsesIndex(
+            url,
+            "simulation_index",
+            "simulation_index_updated_idx",
+            order_by="date_updated",
+        )
+
+    def test_market_lists(self):
+        """
+        Test the market lists page on their user partial indexes
+        """
+        for url_name, table in [
+            ("fwd-efficiency-list", "fwd_efficiency"),
+            ("fx-movement-list", "fx_movement"),
+            ("spot-history-list", "spot_history"),
+        ]:
+            with self.subTest(url_name):
+                self.assertPageUsesIndex(reverse(url_name), table, f"{table}_user_idx")
+
+    def assertPageUsesIndex(self, url, table, index_name, **params):
+        """
+        Requests `url` and asserts the plan of its paginated query on `table` reads `index_name`
+        in the requested order, without sorting, explained with the default planner settings
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        page_queries = [
+            query["sql"]
+            for query in queries
+            if f'FROM "{table}"' in query["sql"] and "LIMIT" in query["sql"]
+        ]
+        self.assertTrue(page_queries, f"No paginated query on {table}")
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {page_queries[0]}")
+            plan = cursor.fetchone()[0]
+        nodes = plan_nodes(plan[0]["Plan"])
+        self.assertIn(index_name, {node.get("Index Name") for node in nodes}, plan)
+        self.assertFalse(
+            {"Sort", "Incremental Sort"} & {node["Node Type"] for node in nodes}, plan
+        )
+
+
+def plan_nodes(node) -> list:
+    """
+    Returns an EXPLAIN (FORMAT JSON) plan node and all of the nodes below it
+    """
+    nodes = [node]
+    for child in node.get("Plans", []):
+        nodes.extend(plan_nodes(child))
+    return nodes
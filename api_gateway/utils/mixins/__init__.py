@@ -1,2 +1,3 @@
 from .default_permissions_mixin import DefaultPermissionsMixin
 from .NonDeletedQuerySet import NonDeletedQuerySetMixin
+from .keyset_pagination_mixin import KeysetPaginationMixin
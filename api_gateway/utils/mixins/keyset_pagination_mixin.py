@@ -0,0 +1,16 @@
+from api_gateway.utils.pagination import KeysetPagination
+
+
+class KeysetPaginationMixin:
+    """
+    Switches a list view to keyset pagination on `keyset_ordering`
+    when the request asks for it with ?pagination=cursor
+    """
+
+    keyset_ordering = ["-pin", "-date_updated", "-pk"]
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator") and KeysetPagination.requested(self.request):
+            self._paginator = KeysetPagination(self.keyset_ordering)
+        return super().paginator
@@ -0,0 +1,166 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opt-in keyset pagination, requested with ?pagination=cursor.
+    A page is selected with a WHERE on the sort key of the last row of the previous page
+    instead of an OFFSET, so every page costs the same as the first one.
+    The response only links the next page, without a count.
+    """
+
+    mode_query_param = "pagination"
+    mode = "cursor"
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def __init__(self, ordering, page_size=None):
+        # (field, descending) pairs, the last field must be unique
+        self.ordering = [
+            (field.lstrip("-"), field.startswith("-")) for field in ordering
+        ]
+        self.page_size = page_size or api_settings.PAGE_SIZE
+        self.request = None
+        self.next_position = None
+
+    @classmethod
+    def requested(cls, request) -> bool:
+        return (
+            request.query_params.get(cls.mode_query_param) == cls.mode
+            or cls.cursor_query_param in request.query_params
+        )
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_position(self, request):
+        """
+        Decodes the sort key values of the last row of the previous page from the cursor
+        """
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise NotFound("Invalid cursor")
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound("Invalid cursor")
+        return position
+
+    def clean_position(self, queryset, position) -> list:
+        """
+        Converts the cursor values with the fields of the sort key,
+        a value a field does not accept is an invalid cursor
+        """
+        cleaned = []
+        for (field, _), value in zip(self.ordering, position):
+            try:
+                if value is None:
+                    raise ValidationError("Missing value")
+                cleaned.append(self.sort_field(queryset, field).to_python(value))
+            except (ValidationError, TypeError, ValueError):
+                raise NotFound("Invalid cursor")
+        return cleaned
+
+    @staticmethod
+    def sort_field(queryset, field):
+        if field in queryset.query.annotations:
+            return queryset.query.annotations[field].output_field
+        opts = queryset.model._meta
+        return opts.pk if field == "pk" else opts.get_field(field)
+
+    @staticmethod
+    def encode_cursor(position) -> str:
+        return base64.urlsafe_b64encode(
+            json.dumps(
+                position,
+                default=lambda value: value.isoformat()
+                if hasattr(value, "isoformat")
+                else str(value),
+            ).encode()
+        ).decode()
+
+    def order_by(self) -> list:
+        return [
+            f"-{field}" if descending else field for field, descending in self.ordering
+        ]
+
+    def keyset_filter(self, position) -> Q:
+        """
+        Rows sorted after `position`: (a, b, c) > (x, y, z) expanded to
+        a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z), with < on descending fields
+        """
+        condition = Q()
+        for index, (field, descending) in enumerate(self.ordering):
+            equal = {
+                previous: value
+                for (previous, _), value in zip(self.ordering[:index], position)
+            }
+            lookup = "lt" if descending else "gt"
+            condition |= Q(**equal, **{f"{field}__{lookup}": position[index]})
+        return condition
+
+    def paginate_queryset(self, queryset, request, view=None):
+        position = self.get_position(request)
+        if position is not None:
+            position = self.clean_position(queryset, position)
+            queryset = queryset.filter(self.keyset_filter(position))
+        return self.paginate_rows(queryset.order_by(*self.order_by()), request)
+
+    def paginate_rows(self, queryset, request) -> list:
+        """
+        Fetches one row more than the page size of an already filtered and sorted queryset
+        to know whether there is a next page
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        rows = list(queryset[: page_size + 1])
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            self.next_position = [
+                row[field] if isinstance(row, dict) else getattr(row, field)
+                for row in rows[-1:]
+                for field, _ in self.ordering
+            ]
+        else:
+            self.next_position = None
+        return rows
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(self.next_position),
+        )
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
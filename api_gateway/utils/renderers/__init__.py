@@ -0,0 +1,2 @@
+from .columnar_renderer import ColumnarRenderer, parse_columnar
+from .streaming_renderers import CSVRenderer, NDJSONRenderer, StreamingRenderer
@@ -0,0 +1,54 @@
+import json
+
+import numpy as np
+from django.core.serializers.json import DjangoJSONEncoder
+from djangorestframework_camel_case.util import camelize
+from rest_framework.renderers import BaseRenderer
+
+
+class ColumnarRenderer(BaseRenderer):
+    """
+    Renders numeric time series as packed little-endian columns:
+
+        magic     4 bytes   b"TSC1"
+        length    uint32    number of points n
+        dates     n int32   days since 1970-01-01, ascending
+        values    n float64
+
+    Views pass the (dates, values) arrays they already hold to `render_arrays`,
+    while `render` falls back to JSON for regular responses such as validation errors.
+    """
+
+    media_type = "application/vnd.timeseries.columnar"
+    format = "columnar"
+    charset = None
+    render_style = "binary"
+    magic = b"TSC1"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return json.dumps(camelize(data), cls=DjangoJSONEncoder).encode("utf-8")
+
+    def render_arrays(self, dates: np.ndarray, values: np.ndarray) -> bytes:
+        days = dates.astype("datetime64[D]").astype("<i4")
+        return b"".join(
+            [
+                self.magic,
+                np.uint32(len(days)).astype("<u4").tobytes(),
+                days.tobytes(),
+                values.astype("<f8").tobytes(),
+            ]
+        )
+
+
+def parse_columnar(content: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reads a ColumnarRenderer payload back into (datetime64[D] dates, float64 values)
+    """
+    if content[:4] != ColumnarRenderer.magic:
+        raise ValueError("Not a columnar time series payload")
+    length = int(np.frombuffer(content, dtype="<u4", count=1, offset=4)[0])
+    days = np.frombuffer(content, dtype="<i4", count=length, offset=8)
+    values = np.frombuffer(content, dtype="<f8", count=length, offset=8 + 4 * length)
+    return days.astype("datetime64[D]"), values
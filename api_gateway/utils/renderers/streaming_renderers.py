@@ -0,0 +1,68 @@
+import csv
+import json
+from io import StringIO
+
+from django.core.serializers.json import DjangoJSONEncoder
+from djangorestframework_camel_case.util import camelize
+from rest_framework.renderers import BaseRenderer
+
+
+class StreamingRenderer(BaseRenderer):
+    """
+    Renderer for row-oriented formats that can be written one row at a time.
+    Views pass an iterable of rows to `stream` to build a StreamingHttpResponse,
+    while `render` still handles regular responses such as validation errors.
+    """
+
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        rows = data if isinstance(data, list) else [data]
+        return "".join(self.stream(rows)).encode(self.charset)
+
+    def stream(self, rows):
+        raise NotImplementedError("Streaming renderers must implement stream()")
+
+
+class NDJSONRenderer(StreamingRenderer):
+    """
+    Renders rows as newline delimited camel cased JSON objects
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def stream(self, rows):
+        for row in rows:
+            yield json.dumps(camelize(row), cls=DjangoJSONEncoder) + "\n"
+
+
+class CSVRenderer(StreamingRenderer):
+    """
+    Renders rows as CSV with a camel cased header taken from the first row
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+
+    def stream(self, rows):
+        buffer = StringIO()
+        writer = None
+        for row in rows:
+            row = camelize(row)
+            if writer is None:
+                writer = csv.DictWriter(buffer, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(
+                {
+                    key: json.dumps(value, cls=DjangoJSONEncoder)
+                    if isinstance(value, (dict, list))
+                    else value
+                    for key, value in row.items()
+                }
+            )
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
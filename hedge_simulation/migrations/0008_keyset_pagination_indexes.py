@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hedge_simulation", "0007_hedgesimulation_input_hash"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="hedgesimulation",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=[
+                    "analysis",
+                    "-pin",
+                    "-date_updated",
+                    "-hedge_irr_simulation_id",
+                ],
+                name="hedge_sim_keyset_idx",
+            ),
+        ),
+    ]
@@ -9,6 +9,18 @@ class HedgeSimulation(models.Model):
     class Meta:
         db_table = "hedge_simulation"
         ordering = ["-pin", "-date_updated"]
+        indexes = [
+            models.Index(
+                fields=[
+                    "analysis",
+                    "-pin",
+                    "-date_updated",
+                    "-hedge_irr_simulation_id",
+                ],
+                name="hedge_sim_keyset_idx",
+                condition=models.Q(is_deleted=False),
+            )
+        ]
 
     SIMULATION_STATUS_CHOICES = (
         ("ENQUEUED", "ENQUEUED"),
@@ -54,6 +66,8 @@ class HedgeSimulation(models.Model):
     simulation_status = models.CharField(
         choices=SIMULATION_STATUS_CHOICES, default="ENQUEUED"
     )
+    # SHA-256 of the core payload, simulations with the same hash share a result
+    input_hash = models.CharField(max_length=64, blank=True, null=True, db_index=True)
 
     @property
     def file_path(self):
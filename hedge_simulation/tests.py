@@ -3,9 +3,10 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 
 from analysis.factory import AnalysisFactory
-from api_gateway.models import TypeStatus
+from api_gateway.models import OutboxMessage, TypeStatus
 from authentication.factory import UserFactory
 from .factory import HedgeSimulationFactory
+from .models import HedgeSimulation
 from .serializer import HedgeIRRSerializer
 
 
@@ -149,3 +150,97 @@ class HedgeSimulationTest(APITestCase):
         }
         response = self.client.patch(url, data=data, format="json")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class HedgeResultReuseTest(APITestCase):
+    """
+    Test cases for reusing the results of hedge simulations submitted with identical inputs
+    """
+
+    def setUp(self):
+        """
+        Setup for HedgeResultReuseTest
+
+        """
+        self.user = UserFactory()
+        self.analysis = AnalysisFactory(user=self.user)
+        self.client.force_authenticate(user=self.user)
+        self.request = {
+            "name": "Hedge Simulation 1",
+            "simulation_environment": {
+                "name": "Environment Test",
+                "volatility": 0.076,
+                "skew": 0,
+                "appreciation_percent": 0.074,
+            },
+            "fwd_rates": [[1, 2, 3], [4, 5, 6], [7, 8, 9]],
+            "harvest": [
+                ("2015-10-01", -30600000),
+                ("2016-01-01", -30600000),
+                ("2018-10-03", 252146833),
+                ("2019-01-01", 254900212),
+            ],
+        }
+
+    def test_identical_inputs_reuse_result(self):
+        """
+        Test submitting identical inputs again reuses the completed result without enqueuing it
+        """
+        completed = self._complete(self._post(self.request))
+        response = self._post({**self.request, "name": "Hedge Simulation 2"})
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(str(response.data["result_id"]), str(completed.result_id))
+        self.assertEqual(response.data["simulation_status"], "COMPLETED")
+        simulation = HedgeSimulation.objects.get(pk=response.data["id"])
+        self.assertEqual(simulation.result_id, completed.result_id)
+        self.assertEqual(simulation.simulation_status, "COMPLETED")
+        self.assertEqual(simulation.input_hash, completed.input_hash)
+        self.assertEqual(OutboxMessage.objects.count(), 1)
+
+    def test_changed_inputs_are_queued(self):
+        """
+        Test submitting changed inputs enqueues a new result
+        """
+        completed = self._complete(self._post(self.request))
+        environment = {**self.request["simulation_environment"], "volatility": 0.1}
+        response = self._post({**self.request, "simulation_environment": environment})
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotEqual(str(response.data["result_id"]), str(completed.result_id))
+        self.assertEqual(response.data["simulation_status"], "ENQUEUED")
+        self.assertEqual(OutboxMessage.objects.count(), 2)
+
+    def test_pending_result_is_not_reused(self):
+        """
+        Test identical inputs whose result is not completed yet are enqueued again
+        """
+        pending = self._post(self.request)
+        response = self._post(self.request)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotEqual(response.data["result_id"], pending.data["result_id"])
+        self.assertEqual(response.data["simulation_status"], "ENQUEUED")
+        self.assertEqual(
+            HedgeSimulation.objects.get(pk=pending.data["id"]).input_hash,
+            HedgeSimulation.objects.get(pk=response.data["id"]).input_hash,
+        )
+        self.assertEqual(OutboxMessage.objects.count(), 2)
+
+    def _post(self, data):
+        return self.client.post(
+            reverse(
+                "hedge-irr-list-create",
+                kwargs={"analysis_id": self.analysis.analysis_id},
+            ),
+            data,
+            format="json",
+        )
+
+    def _complete(self, response):
+        # The core marks the simulation it was sent completed
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        simulation = HedgeSimulation.objects.get(pk=response.data["id"])
+        simulation.simulation_status = "COMPLETED"
+        simulation.save(new_result=False)
+        return simulation
@@ -10,8 +10,9 @@ from rest_framework.request import Request
 from rest_framework.test import APIClient
 
 from api_gateway.core.adapter import CoreAdapter
+from api_gateway.core.submission import submit_simulation
 from api_gateway.exceptions import GenericAPIError
-from api_gateway.settings import AWS
+from api_gateway.utils.mixins import KeysetPaginationMixin
 from .models import HedgeSimulation
 from .serializer import HedgeIRRSerializer
 from uuid import uuid4
@@ -28,15 +29,14 @@ def send_hedge_to_core(request: Request, serializer: HedgeIRRSerializer, **kwarg
         serializer (HedgeIRRSerializer): Serializer instance for the HedgeSimulation data.
         **kwargs: Additional keyword arguments.
 
-    Raises:
-        GenericAPIError: Raised if there's an issue with enqueuing the simulation.
-
     Details:
         - Saves the HedgeSimulation instance.
         - Authenticates the user for the core API.
         - Sends a POST request to the core API with simulation details.
         - Constructs a payload for the CoreAdapter.
-        - Enqueues the payload to AWS SQS with the simulation ID as the message group ID.
+        - Writes the payload to the outbox, sent to AWS SQS with the simulation ID as the
+          message group ID once committed, unless a simulation of the user with the same
+          inputs already has a result to reuse.
 
     """
     with transaction.atomic():
@@ -80,14 +80,21 @@ def send_hedge_to_core(request: Request, serializer: HedgeIRRSerializer, **kwarg
                 "harvest": request.data["harvest"],
             },
         )
-        simulation_sent = AWS.sqs.enqueue(payload, message_group_id=str(instance.pk))
-        if not simulation_sent:
-            raise GenericAPIError("Failed to enqueue simulation", code=500)
+        result = submit_simulation(
+            HedgeSimulation.objects.filter(
+                analysis__user=request.user, is_deleted=False
+            ),
+            instance.pk,
+            payload,
+            message_group_id=str(instance.pk),
+        )
+        for key, value in result.items():
+            setattr(instance, key, value)
 
 
 @method_decorator(swagger_auto_schema(tags=["Hedge Simulation"]), "post")
 @method_decorator(swagger_auto_schema(tags=["Hedge Simulation"]), "get")
-class HedgeIRRListCreateView(ListCreateAPIView):
+class HedgeIRRListCreateView(KeysetPaginationMixin, ListCreateAPIView):
     """
     List and create HedgeSimulation instances for a specific analysis.
 
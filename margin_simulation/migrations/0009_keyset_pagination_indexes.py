@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("margin_simulation", "0008_marginsimulation_input_hash"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="marginsimulation",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["analysis", "-pin", "-date_updated", "-margin_simulation_id"],
+                name="margin_sim_keyset_idx",
+            ),
+        ),
+    ]
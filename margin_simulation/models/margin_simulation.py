@@ -47,10 +47,19 @@ class MarginSimulation(models.Model):
     simulation_status = models.CharField(
         choices=SIMULATION_STATUS_CHOICES, default="ENQUEUED"
     )
+    # SHA-256 of the core payload, simulations with the same hash share a result
+    input_hash = models.CharField(max_length=64, blank=True, null=True, db_index=True)
 
     class Meta:
         db_table = "margin_simulation"
         ordering = ["-pin", "-date_updated"]
+        indexes = [
+            models.Index(
+                fields=["analysis", "-pin", "-date_updated", "-margin_simulation_id"],
+                name="margin_sim_keyset_idx",
+                condition=models.Q(is_deleted=False),
+            )
+        ]
 
     @property
     def type(self):
@@ -3,3 +3,4 @@ from .create_margin_simulation_test import CreateMarginSimulationTest
 from .delete_margin_simulation_test import DeleteMarginSimulationTest
 from .detail_margin_simulation_test import DetailMarginSimulationTest
 from .update_margin_simulation_test import UpdateMarginSimulationTest
+from .margin_result_reuse_test import MarginResultReuseTest
@@ -0,0 +1,106 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from analysis.factory import AnalysisFactory
+from api_gateway.models import OutboxMessage
+from authentication.factory import UserFactory
+from margin_simulation.models import MarginSimulation
+from strategy_simulation.factory import StrategySimulationFactory
+
+
+class MarginResultReuseTest(APITestCase):
+    """
+    Test case for reusing the results of margin simulations submitted with identical inputs.
+    It is designed to check a resubmitted simulation points to a completed result instead of being enqueued
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating a verified user instance
+        2. Create an analysis with a strategy simulation
+        3. Build a margin simulation request
+        """
+        self.user = UserFactory()
+        self.analysis = AnalysisFactory(user=self.user)
+        strategy_simulation = StrategySimulationFactory(analysis=self.analysis)
+        self.request = {
+            "name": "Margin Simulation 1",
+            "strategy_simulation_id": str(strategy_simulation.strategy_simulation_id),
+            "status": "In Progress",
+            "minimum_transfer_amount": 10000.00,
+            "initial_margin_percentage": 0.55,
+            "variation_margin_percentage": 0.67,
+        }
+        self.client.force_authenticate(user=self.user)
+
+    def test_identical_inputs_reuse_result(self):
+        """
+        Test submitting identical inputs again reuses the completed result without enqueuing it
+        """
+        completed = self._complete(self._post(self.request))
+        response = self._post({**self.request, "name": "Margin Simulation 2"})
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(str(response.data["result_id"]), str(completed.result_id))
+        self.assertEqual(response.data["simulation_status"], "COMPLETED")
+        simulation = MarginSimulation.objects.get(
+            pk=response.data["margin_simulation_id"]
+        )
+        self.assertEqual(simulation.result_id, completed.result_id)
+        self.assertEqual(simulation.simulation_status, "COMPLETED")
+        self.assertEqual(simulation.input_hash, completed.input_hash)
+        self.assertEqual(OutboxMessage.objects.count(), 1)
+
+    def test_changed_inputs_are_queued(self):
+        """
+        Test submitting changed inputs enqueues a new result
+        """
+        completed = self._complete(self._post(self.request))
+        response = self._post({**self.request, "initial_margin_percentage": 0.2})
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotEqual(str(response.data["result_id"]), str(completed.result_id))
+        self.assertEqual(response.data["simulation_status"], "ENQUEUED")
+        self.assertEqual(OutboxMessage.objects.count(), 2)
+
+    def test_pending_result_is_not_reused(self):
+        """
+        Test identical inputs whose result is not completed yet are enqueued again
+        """
+        pending = self._post(self.request)
+        response = self._post(self.request)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotEqual(response.data["result_id"], pending.data["result_id"])
+        self.assertEqual(response.data["simulation_status"], "ENQUEUED")
+        self.assertEqual(
+            MarginSimulation.objects.get(
+                pk=pending.data["margin_simulation_id"]
+            ).input_hash,
+            MarginSimulation.objects.get(
+                pk=response.data["margin_simulation_id"]
+            ).input_hash,
+        )
+        self.assertEqual(OutboxMessage.objects.count(), 2)
+
+    def _post(self, data):
+        return self.client.post(
+            reverse(
+                "margin-simulation-list",
+                kwargs={"analysis_id": self.analysis.analysis_id},
+            ),
+            data,
+            format="json",
+        )
+
+    def _complete(self, response):
+        # The core marks the simulation it was sent completed
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        simulation = MarginSimulation.objects.get(
+            pk=response.data["margin_simulation_id"]
+        )
+        simulation.simulation_status = "COMPLETED"
+        simulation.save(new_result=False)
+        return simulation
@@ -8,19 +8,24 @@ from rest_framework.response import Response
 
 from analysis.models import Analysis
 from api_gateway.core.adapter import CoreAdapter
+from api_gateway.core.submission import submit_simulation
 from api_gateway.exceptions import GenericAPIError
-from api_gateway.settings.config import AWS
-from api_gateway.utils.mixins import NonDeletedQuerySetMixin
+from api_gateway.utils.mixins import KeysetPaginationMixin, NonDeletedQuerySetMixin
 from margin_simulation.models import MarginSimulation
 from margin_simulation.serializers import MarginSimulationSerializer
 from strategy_simulation.models import StrategySimulation
 
 
+def user_margin_simulations(user):
+    # Margin simulations whose results can be reused for the user
+    return MarginSimulation.objects.filter(analysis__user=user, is_deleted=False)
+
+
 @method_decorator(swagger_auto_schema(tags=["Margin Simulation"]), "get")
 @method_decorator(swagger_auto_schema(tags=["Margin Simulation"]), "post")
 # TODO: Admin might have the option to view all
 class MarginSimulationListCreateAPIView(
-    NonDeletedQuerySetMixin, generics.ListCreateAPIView
+    KeysetPaginationMixin, NonDeletedQuerySetMixin, generics.ListCreateAPIView
 ):
     """API view for retrieving list of margin simulations created by authenticated user"""
 
@@ -70,15 +75,17 @@ class MarginSimulationListCreateAPIView(
                     request.user.user_id, instance.result_id, serializer.data
                 )
 
-                simulation_sent = AWS.sqs.enqueue(
-                    core_payload, message_group_id=core_payload["data"]["strategy_id"]
+                result = submit_simulation(
+                    user_margin_simulations(self.request.user),
+                    instance.pk,
+                    core_payload,
+                    message_group_id=core_payload["data"]["strategy_id"],
                 )
 
-                if not simulation_sent:
-                    raise GenericAPIError("Failed to enqueue simulation", code=500)
-
                 return Response(
-                    serializer.data, status=status.HTTP_201_CREATED, headers=headers
+                    {**serializer.data, **result},
+                    status=status.HTTP_201_CREATED,
+                    headers=headers,
                 )
             except ObjectDoesNotExist:
                 raise GenericAPIError(
@@ -120,11 +127,13 @@ class MarginSimulationRetrieveUpdateDestroyAPIView(
                 "margin_simulation_id": kwargs.get("margin_simulation_id"),
             },
         )
-        simulation_sent = AWS.sqs.enqueue(
-            core_payload, message_group_id=core_payload["data"]["strategy_id"]
+        result = submit_simulation(
+            user_margin_simulations(request.user),
+            kwargs.get("margin_simulation_id"),
+            core_payload,
+            message_group_id=core_payload["data"]["strategy_id"],
         )
-        if not simulation_sent:
-            raise GenericAPIError("Failed to enqueue simulation", code=500)
+        simulation.data.update(result)
         return simulation
 
     def perform_update(self, serializer):
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("market", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="fwdefficiency",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["user", "-date_updated", "-date_added"],
+                name="fwd_efficiency_user_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="fxmovement",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["user", "-date_updated", "-date_added"],
+                name="fx_movement_user_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="spothistory",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["user", "-date_updated", "-date_added"],
+                name="spot_history_user_idx",
+            ),
+        ),
+    ]
@@ -35,6 +35,13 @@ class FwdEfficiency(models.Model):
     class Meta:
         db_table = "fwd_efficiency"
         ordering = ("-date_updated", "-date_added")
+        indexes = [
+            models.Index(
+                fields=["user", "-date_updated", "-date_added"],
+                name="fwd_efficiency_user_idx",
+                condition=models.Q(is_deleted=False),
+            )
+        ]
 
     def delete(self, *args, **kwargs):
         self.is_deleted = True
@@ -27,3 +27,10 @@ class FxMovement(models.Model):
     class Meta:
         db_table = "fx_movement"
         ordering = ("-date_updated", "-date_added")
+        indexes = [
+            models.Index(
+                fields=["user", "-date_updated", "-date_added"],
+                name="fx_movement_user_idx",
+                condition=models.Q(is_deleted=False),
+            )
+        ]
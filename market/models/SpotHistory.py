@@ -36,3 +36,10 @@ class SpotHistory(models.Model):
     class Meta:
         db_table = "spot_history"
         ordering = ("-date_updated", "-date_added")
+        indexes = [
+            models.Index(
+                fields=["user", "-date_updated", "-date_added"],
+                name="spot_history_user_idx",
+                condition=models.Q(is_deleted=False),
+            )
+        ]
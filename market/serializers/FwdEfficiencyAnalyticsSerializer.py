@@ -0,0 +1,59 @@
+from rest_framework import serializers
+
+from api_gateway.serializers import CurrencySerializer
+from market.models import FwdEfficiency
+from time_series.utils.forward_efficiency import forward_efficiency
+
+
+class ForwardEfficiencyPointSerializer(serializers.Serializer):
+    date = serializers.DateField()
+    maturity = serializers.DateField()
+    spot_rate = serializers.FloatField()
+    forward_rate = serializers.FloatField()
+    realized_rate = serializers.FloatField()
+    forward_points = serializers.FloatField()
+    realized_move = serializers.FloatField()
+    difference_percent = serializers.FloatField()
+
+
+class FwdEfficiencyAnalyticsSerializer(serializers.ModelSerializer):
+    base_currency = CurrencySerializer(read_only=True)
+    foreign_currency = CurrencySerializer(read_only=True)
+    duration_months = serializers.IntegerField(source="duration")
+    observations = serializers.SerializerMethodField()
+    mean_difference_percent = serializers.SerializerMethodField()
+    above_forward_ratio = serializers.SerializerMethodField()
+    series = serializers.SerializerMethodField()
+
+    class Meta:
+        model = FwdEfficiency
+        fields = [
+            "name",
+            "fwd_efficiency_id",
+            "base_currency",
+            "foreign_currency",
+            "duration_months",
+            "observations",
+            "mean_difference_percent",
+            "above_forward_ratio",
+            "series",
+        ]
+
+    def efficiency(self, obj):
+        return forward_efficiency(
+            obj.base_currency.code, obj.foreign_currency.code, obj.duration
+        )
+
+    def get_observations(self, obj):
+        return self.efficiency(obj)["observations"]
+
+    def get_mean_difference_percent(self, obj):
+        return self.efficiency(obj)["mean_difference_percent"]
+
+    def get_above_forward_ratio(self, obj):
+        return self.efficiency(obj)["above_forward_ratio"]
+
+    def get_series(self, obj):
+        return ForwardEfficiencyPointSerializer(
+            self.efficiency(obj)["series"], many=True
+        ).data
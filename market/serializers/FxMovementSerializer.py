@@ -4,6 +4,7 @@ from rest_framework import serializers
 
 from market.models import FxMovement
 from market.serializers.FxCurrencyPairSerializer import FxCurrencyPairSerializer
+from time_series.utils.spot_rate_cache import spot_rate_cache
 
 
 class FxMovementSerializer(serializers.ModelSerializer):
@@ -23,6 +24,14 @@ class FxMovementSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         self.context["duration"] = instance.duration
+        # Load the history of every currency of the heatmap in one query
+        spot_rate_cache.prefetch(
+            {
+                currency.code
+                for pair in instance.currency_pairs.all()
+                for currency in (pair.base_currency, pair.foreign_currency)
+            }
+        )
         return super().to_representation(instance)
 
     def create(self, validated_data):
@@ -0,0 +1,72 @@
+from django.utils import timezone
+from rest_framework import serializers
+
+from api_gateway.serializers import CurrencySerializer
+from market.models import FxMovement
+from time_series.utils.fx_statistics import spot_rate_statistics
+from time_series.utils.spot_rate_cache import spot_rate_cache
+
+
+class FxPairStatisticsSerializer(serializers.Serializer):
+    base_currency = CurrencySerializer()
+    foreign_currency = CurrencySerializer()
+    observations = serializers.IntegerField()
+    percent_change = serializers.FloatField(allow_null=True)
+    annualized_volatility = serializers.FloatField(allow_null=True)
+    max_drawdown = serializers.FloatField(allow_null=True)
+    z_score = serializers.FloatField(allow_null=True)
+
+    class Meta:
+        fields = [
+            "base_currency",
+            "foreign_currency",
+            "observations",
+            "percent_change",
+            "annualized_volatility",
+            "max_drawdown",
+            "z_score",
+        ]
+
+
+class FxMovementStatisticsSerializer(serializers.ModelSerializer):
+    duration_months = serializers.IntegerField(source="duration")
+    as_of_date = serializers.SerializerMethodField()
+    currency_pairs = serializers.SerializerMethodField()
+
+    class Meta:
+        model = FxMovement
+        fields = [
+            "name",
+            "fx_movement_id",
+            "duration_months",
+            "as_of_date",
+            "currency_pairs",
+        ]
+
+    def get_as_of_date(self, obj):
+        return self.context.get("as_of_date") or timezone.now().date()
+
+    def get_currency_pairs(self, obj):
+        as_of_date = self.get_as_of_date(obj)
+        pairs = obj.currency_pairs.all()
+        spot_rate_cache.prefetch(
+            {
+                currency.code
+                for pair in pairs
+                for currency in (pair.base_currency, pair.foreign_currency)
+            }
+        )
+        statistics = [
+            {
+                "base_currency": pair.base_currency,
+                "foreign_currency": pair.foreign_currency,
+                **spot_rate_statistics(
+                    pair.base_currency.code,
+                    pair.foreign_currency.code,
+                    obj.duration,
+                    as_of_date,
+                ),
+            }
+            for pair in pairs
+        ]
+        return FxPairStatisticsSerializer(statistics, many=True).data
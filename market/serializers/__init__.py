@@ -1,5 +1,13 @@
 from .FwdEfficiencySerializer import FwdEfficiencySerializer
+from .FwdEfficiencyAnalyticsSerializer import (
+    FwdEfficiencyAnalyticsSerializer,
+    ForwardEfficiencyPointSerializer,
+)
 from .FxMovementSerializer import FxMovementSerializer
+from .FxMovementStatisticsSerializer import (
+    FxMovementStatisticsSerializer,
+    FxPairStatisticsSerializer,
+)
 from .PricingSerializer import (
     SpotRateRequestSerializer,
     SpotRateResponseSerializer,
@@ -0,0 +1,106 @@
+from datetime import date, timedelta
+
+import numpy as np
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from api_gateway.models import TypeCurrency
+from authentication.factory import UserFactory
+from market.factory import FwdEfficiencyFactory
+from time_series.models import ForwardRateHistoryData, SpotHistoryData
+from time_series.utils.forward_efficiency import add_months
+from time_series.utils.spot_rate_cache import spot_rate_cache
+
+
+class FwdEfficiencyAnalyticsTest(APITestCase):
+    """
+    Test case for handling fwd efficiency analytics in an API view.
+    It is designed to test captured forward rates are compared with the spot rates realized at maturity
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Create verified user instances
+        2. Create a one month USD/EUR fwd efficiency for user one
+        3. Creating daily USD and EUR spot history for January and February 2024
+        4. Creating forward quotes for 2024-01-02, 2024-01-31 and 2024-02-15 where the last one is not matured
+        """
+        spot_rate_cache.invalidate()
+        self.user_one = UserFactory()
+        self.user_two = UserFactory()
+        self.fwd_efficiency = FwdEfficiencyFactory(
+            user=self.user_one,
+            base_currency=TypeCurrency.objects.filter(code="USD").first(),
+            foreign_currency=TypeCurrency.objects.filter(code="EUR").first(),
+            duration=1,
+        )
+        rows = []
+        for day in range(60):
+            current_date = date(2024, 1, 1) + timedelta(days=day)
+            rows.append(SpotHistoryData(date=current_date, currency="USD", rate=1))
+            rows.append(SpotHistoryData(date=current_date, currency="EUR", rate=day))
+        SpotHistoryData.objects.bulk_create(rows)
+        ForwardRateHistoryData.objects.bulk_create(
+            [
+                ForwardRateHistoryData(
+                    date=quote_date,
+                    base_currency="USD",
+                    foreign_currency="EUR",
+                    duration=1,
+                    spot_rate=spot_rate,
+                    forward_rate=32,
+                )
+                for quote_date, spot_rate in [
+                    (date(2024, 1, 2), 1),
+                    (date(2024, 1, 31), 30),
+                    (date(2024, 2, 15), 45),
+                ]
+            ]
+        )
+
+    def test_fwd_efficiency_analytics_user_one(self):
+        """
+        Test matured quotes are compared with the spot rate on the business day of their maturity
+        """
+        response = self._get(self.user_one)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["observations"], 2)
+        first, second = response.data["series"]
+        # 2024-02-02 is a Friday, 2024-02-29 a Thursday
+        self.assertEqual(first["maturity"], "2024-02-02")
+        self.assertEqual(first["realized_rate"], 32.0)
+        self.assertEqual(first["forward_points"], 31.0)
+        self.assertEqual(second["maturity"], "2024-02-29")
+        self.assertEqual(second["realized_rate"], 59.0)
+        self.assertEqual(response.data["above_forward_ratio"], 0.5)
+
+    def test_fwd_efficiency_analytics_user_two(self):
+        """
+        Test user two cannot read the analytics of user one's fwd efficiency
+        """
+        response = self._get(self.user_two)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_add_months_clips_to_month_end(self):
+        """
+        Test adding months clips the day to the end of shorter months
+        """
+        dates = np.array(
+            ["2024-01-31", "2024-03-15", "2023-12-31"], dtype="datetime64[D]"
+        )
+        self.assertEqual(
+            add_months(dates, 2).tolist(),
+            [date(2024, 3, 31), date(2024, 5, 15), date(2024, 2, 29)],
+        )
+
+    def _get(self, user):
+        self.client.force_authenticate(user=user)
+        return self.client.get(
+            reverse(
+                "fwd-efficiency-analytics",
+                kwargs={"fwd_efficiency_id": self.fwd_efficiency.fwd_efficiency_id},
+            )
+        )
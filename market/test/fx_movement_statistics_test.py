@@ -0,0 +1,100 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from api_gateway.models import TypeCurrency
+from authentication.factory import UserFactory
+from market.factory import FxMovementFactory
+from market.models import FxCurrencyPair
+from time_series.models import SpotHistoryData
+from time_series.utils.fx_statistics import compute_statistics
+from time_series.utils.spot_rate_cache import spot_rate_cache
+
+
+class FxMovementStatisticsTest(APITestCase):
+    """
+    Test case for handling fx movement statistics in an API view.
+    It is designed to test the movement statistics computed for the pairs of a user's fx movement
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Create verified user instances
+        2. Create a one month fx movement with a USD/EUR pair for user one
+        3. Creating USD and EUR spot history where EUR rises, falls then recovers
+        """
+        spot_rate_cache.invalidate()
+        self.user_one = UserFactory()
+        self.user_two = UserFactory()
+        self.as_of_date = date(2024, 1, 31)
+        self.fx_movement = FxMovementFactory(
+            user=self.user_one, duration=1, add_random_currency_pairs=1
+        )
+        self.fx_movement.currency_pairs.set(
+            [
+                FxCurrencyPair.objects.get_or_create(
+                    base_currency=TypeCurrency.objects.filter(code="USD").first(),
+                    foreign_currency=TypeCurrency.objects.filter(code="EUR").first(),
+                )[0]
+            ]
+        )
+        self.rates = [1.0, 1.1, 1.2, 0.9, 1.0, 1.05]
+        rows = []
+        for day, rate in enumerate(self.rates):
+            current_date = self.as_of_date - timedelta(days=len(self.rates) - 1 - day)
+            rows.append(SpotHistoryData(date=current_date, currency="USD", rate=1))
+            rows.append(SpotHistoryData(date=current_date, currency="EUR", rate=rate))
+        SpotHistoryData.objects.bulk_create(rows)
+
+    def test_fx_movement_statistics_user_one(self):
+        """
+        Test the statistics of every pair are computed over the fx movement duration
+        """
+        response = self._get(self.user_one, as_of=self.as_of_date.isoformat())
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["as_of_date"], self.as_of_date)
+        pair = response.data["currency_pairs"][0]
+        self.assertEqual(pair["base_currency"]["code"], "USD")
+        self.assertEqual(pair["observations"], 6)
+        self.assertAlmostEqual(pair["percent_change"], 5.0)
+        self.assertAlmostEqual(pair["max_drawdown"], -25.0)
+        self.assertGreater(pair["annualized_volatility"], 0)
+
+    def test_fx_movement_statistics_user_two(self):
+        """
+        Test user two cannot read the statistics of user one's fx movement
+        """
+        response = self._get(self.user_two)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_fx_movement_statistics_invalid_as_of(self):
+        """
+        Test an invalid as_of date is rejected
+        """
+        response = self._get(self.user_one, as_of="not-a-date")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_statistics_without_history(self):
+        """
+        Test statistics of an empty window are null instead of failing
+        """
+        statistics = compute_statistics(np.array([1.0]))
+        self.assertEqual(statistics["observations"], 1)
+        self.assertIsNone(statistics["percent_change"])
+        self.assertIsNone(statistics["annualized_volatility"])
+
+    def _get(self, user, **params):
+        self.client.force_authenticate(user=user)
+        return self.client.get(
+            reverse(
+                "fx-movement-statistics",
+                kwargs={"fx_movement_id": self.fx_movement.fx_movement_id},
+            ),
+            params,
+        )
@@ -14,6 +14,11 @@ urlpatterns = [
         FwdEfficiencyRetrieveUpdateDestroyAPIView.as_view(),
         name="fwd-efficiency-detail",
     ),
+    path(
+        "fwd-efficiency/<uuid:fwd_efficiency_id>/analytics/",
+        FwdEfficiencyAnalyticsAPIView.as_view(),
+        name="fwd-efficiency-analytics",
+    ),
     # Spot History
     path(
         "spot-history/",
@@ -37,6 +42,11 @@ urlpatterns = [
         FxMovementRetrieveUpdateDestroyAPIView.as_view(),
         name="fx-movement-detail",
     ),
+    path(
+        "fx-movement/<uuid:fx_movement_id>/statistics/",
+        FxMovementStatisticsAPIView.as_view(),
+        name="fx-movement-statistics",
+    ),
     path(
         "",
         DefaultMarketView.as_view(),
@@ -1,10 +1,12 @@
 from .fwd_efficiency import (
     FwdEfficiencyListCreateAPIView,
     FwdEfficiencyRetrieveUpdateDestroyAPIView,
+    FwdEfficiencyAnalyticsAPIView,
 )
 from .fx_movement import (
     FxMovementListCreateAPIView,
     FxMovementRetrieveUpdateDestroyAPIView,
+    FxMovementStatisticsAPIView,
 )
 from .spot_history import (
     SpotHistoryListCreateAPIView,
@@ -7,7 +7,7 @@ from django.core.exceptions import ValidationError
 from api_gateway.utils.mixins import NonDeletedQuerySetMixin
 from authentication.mixins import UserQuerySetMixin
 from market.models import FwdEfficiency
-from market.serializers import FwdEfficiencySerializer
+from market.serializers import FwdEfficiencySerializer, FwdEfficiencyAnalyticsSerializer
 
 
 @method_decorator(swagger_auto_schema(tags=["Fwd Efficiency"]), "get")
@@ -48,3 +48,14 @@ class FwdEfficiencyRetrieveUpdateDestroyAPIView(
 
     def perform_destroy(self, instance):
         instance.delete()
+
+
+@method_decorator(swagger_auto_schema(tags=["Fwd Efficiency"]), "get")
+class FwdEfficiencyAnalyticsAPIView(
+    NonDeletedQuerySetMixin, UserQuerySetMixin, generics.RetrieveAPIView
+):
+    """API view comparing the captured forward rates of a fwd efficiency with the spot rates realized at maturity"""
+
+    queryset = FwdEfficiency.objects.select_related("base_currency", "foreign_currency")
+    serializer_class = FwdEfficiencyAnalyticsSerializer
+    lookup_field = "fwd_efficiency_id"
@@ -3,11 +3,13 @@ from drf_yasg.utils import swagger_auto_schema
 from rest_framework import generics
 from rest_framework.request import Request
 from django.core.exceptions import ValidationError
+from drf_yasg import openapi
+from rest_framework import serializers
 
 from api_gateway.utils.mixins import NonDeletedQuerySetMixin
 from authentication.mixins import UserQuerySetMixin
 from market.models import FxMovement
-from market.serializers import FxMovementSerializer
+from market.serializers import FxMovementSerializer, FxMovementStatisticsSerializer
 
 
 @method_decorator(swagger_auto_schema(tags=["Fx Movement"]), "get")
@@ -48,3 +50,40 @@ class FxMovementRetrieveUpdateDestroyAPIView(
 
     def perform_destroy(self, instance):
         instance.delete()
+
+
+@method_decorator(
+    swagger_auto_schema(
+        tags=["Fx Movement"],
+        manual_parameters=[
+            openapi.Parameter(
+                "as_of",
+                openapi.IN_QUERY,
+                description="Last date of the window, defaults to today",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATE,
+            )
+        ],
+    ),
+    "get",
+)
+class FxMovementStatisticsAPIView(
+    NonDeletedQuerySetMixin, UserQuerySetMixin, generics.RetrieveAPIView
+):
+    """API view computing the movement statistics of every pair of an fx movement over its duration"""
+
+    queryset = FxMovement.objects.prefetch_related(
+        "currency_pairs__base_currency", "currency_pairs__foreign_currency"
+    )
+    serializer_class = FxMovementStatisticsSerializer
+    lookup_field = "fx_movement_id"
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        as_of = self.request.query_params.get("as_of")
+        if as_of:
+            try:
+                context["as_of_date"] = serializers.DateField().to_internal_value(as_of)
+            except serializers.ValidationError as e:
+                raise serializers.ValidationError({"as_of": e.detail})
+        return context
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("strategy_simulation", "0018_strategysimulation_simulation_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="strategysimulation",
+            name="input_hash",
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+    ]
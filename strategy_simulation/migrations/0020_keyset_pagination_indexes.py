@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("strategy_simulation", "0019_strategysimulation_input_hash"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="strategysimulation",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["analysis", "-pin", "-date_updated", "-strategy_simulation_id"],
+                name="strategy_sim_keyset_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("strategy_simulation", "0020_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="strategyinstance",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["strategy_simulation", "instance_group"],
+                name="strategy_instance_active_idx",
+            ),
+        ),
+    ]
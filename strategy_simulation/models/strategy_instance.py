@@ -46,3 +46,10 @@ class StrategyInstance(models.Model):
 
     class Meta:
         db_table = "strategy_instance"
+        indexes = [
+            models.Index(
+                fields=["strategy_simulation", "instance_group"],
+                name="strategy_instance_active_idx",
+                condition=models.Q(is_deleted=False),
+            )
+        ]
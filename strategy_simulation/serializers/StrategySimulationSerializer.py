@@ -1,18 +1,19 @@
 from datetime import date
 from dateutil import relativedelta
+from django.db.models import Prefetch
 from rest_framework import serializers
 
 from analysis.serializers import SimulationEnvironmentSerializer
 from api_gateway.models import TypeStatus
 from api_gateway.utils.fields import ForeignKeyCharField
 from api_gateway.serializers import CurrencySerializer
-from strategy_simulation.models import StrategySimulation
+from strategy_simulation.models import StrategyInstance, StrategySimulation
 from strategy_simulation.serializers import (
     StrategyInstanceSerializer,
     StrategyInstanceMasterSerializer,
 )
 from time_series.serializers import SpotHistoryDataSerializer
-from time_series.utils import SpotHistoryDataHelper
+from time_series.utils import spot_history_window
 
 
 class StrategySimulationSerializer(serializers.ModelSerializer):
@@ -57,6 +58,27 @@ class StrategySimulationSerializer(serializers.ModelSerializer):
             "simulation_status",
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Loads everything to_representation touches with a fixed number of queries:
+        the environment, status and analysis currencies are joined to the simulations
+        and the instances are prefetched with their leg and strategy in one query
+        """
+        return queryset.select_related(
+            "simulation_environment",
+            "type_status",
+            "analysis__base_currency",
+            "analysis__foreign_currency",
+        ).prefetch_related(
+            Prefetch(
+                "strategy_instance",
+                queryset=StrategyInstance.objects.select_related(
+                    "strategy_leg__strategy"
+                ).order_by("instance_group", "pk"),
+            )
+        )
+
     def to_representation(self, instance):
         data = {}
         data["strategy_simulation_id"] = instance.pk
@@ -80,28 +102,38 @@ class StrategySimulationSerializer(serializers.ModelSerializer):
         data["pin"] = instance.pin
         data["simulation_status"] = instance.simulation_status
 
-        if instance.start_date <= date.today():
-            date_to = instance.start_date
-            date_from = instance.start_date - relativedelta.relativedelta(months=12)
-            base_currency = (
-                instance.analysis.foreign_currency.code
-                if instance.is_base_sold
-                else instance.analysis.base_currency.code
-            )
-            foreign_currency = (
-                instance.analysis.base_currency.code
-                if instance.is_base_sold
-                else instance.analysis.foreign_currency.code
-            )
-            data["spot_history_data"] = SpotHistoryDataHelper(
-                base_currency=base_currency,
-                foreign_currency=foreign_currency,
-                date_from=date_from,
-                date_to=date_to,
-            ).serializer_spot_history_date()
+        if self.include_spot_history() and instance.start_date <= date.today():
+            data["spot_history_data"] = self.get_spot_history_data(instance)
 
         return data
 
+    def include_spot_history(self):
+        """
+        The spot history chart is only embedded when requested with ?include=spot_history
+        """
+        request = self.context.get("request")
+        if request is None:
+            return False
+        return "spot_history" in request.query_params.get("include", "").split(",")
+
+    def get_spot_history_data(self, obj):
+        base_currency = (
+            obj.analysis.foreign_currency.code
+            if obj.is_base_sold
+            else obj.analysis.base_currency.code
+        )
+        foreign_currency = (
+            obj.analysis.base_currency.code
+            if obj.is_base_sold
+            else obj.analysis.foreign_currency.code
+        )
+        return spot_history_window(
+            base_currency=base_currency,
+            foreign_currency=foreign_currency,
+            date_from=obj.start_date - relativedelta.relativedelta(months=12),
+            date_to=obj.start_date,
+        )
+
     def get_strategy_instance(self, obj):
         group = {}
         global_name_counter = {}
@@ -110,7 +142,7 @@ class StrategySimulationSerializer(serializers.ModelSerializer):
         for instance in obj.strategy_instance.all():
             if instance.strategy_leg:
                 strategy = instance.strategy_leg.strategy
-                is_custom = True if strategy.created_by_user is not None else False
+                is_custom = strategy.created_by_user_id is not None
 
                 # Group the strategy and leg with overrides
                 if instance.instance_group not in group.keys():
@@ -9,3 +9,8 @@ from .create_strategy_simulation_test import CreateStrategySimulationTest
 from .delete_strategy_simulation_test import DeleteStrategySimulationTest
 from .detail_strategy_simulation_test import DetailStrategySimulationTest
 from .update_strategy_simulation_test import UpdateStrategySimulationTest
+from .strategy_simulation_query_count_test import StrategySimulationQueryCountTest
+from .strategy_simulation_spot_history_test import StrategySimulationSpotHistoryTest
+from .strategy_instance_bulk_create_test import StrategyInstanceBulkCreateTest
+from .strategy_simulation_diff_update_test import StrategySimulationDiffUpdateTest
+from .simulation_result_reuse_test import SimulationResultReuseTest
@@ -0,0 +1,131 @@
+import datetime
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from analysis.factory import AnalysisFactory
+from api_gateway.models import OutboxMessage
+from authentication.factory import UserFactory
+from strategy_simulation.factory import StrategyFactory
+from strategy_simulation.models import StrategySimulation
+
+
+class SimulationResultReuseTest(APITestCase):
+    """
+    Test case for reusing the results of strategy simulations submitted with identical inputs.
+    It is designed to check a resubmitted simulation points to a completed result instead of being enqueued
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating a verified user instance
+        2. Create an analysis and a default strategy
+        3. Build a strategy simulation request
+        """
+        self.user = UserFactory()
+        self.analysis = AnalysisFactory(user=self.user)
+        strategy = StrategyFactory()
+        self.request = {
+            "name": "Strategy Simulation 1",
+            "status": "In Progress",
+            "simulation_environment": {
+                "name": "Environment Test",
+                "volatility": 0.076,
+                "skew": 0,
+                "appreciation_percent": 0.074,
+            },
+            "start_date": datetime.date(2023, 12, 15),
+            "end_date": datetime.date(2024, 12, 15),
+            "is_base_sold": True,
+            "notional": 12345.67,
+            "initial_spot_rate": 5.5,
+            "initial_forward_rate": 4.3,
+            "spread": 0.0,
+            "strategy_instance": [
+                {
+                    "strategy_id": str(strategy.strategy_id),
+                    "legs": [
+                        {
+                            "strategy_leg_id": str(strategy_leg.strategy_leg_id),
+                            "premium_override": 0.1,
+                            "leverage_override": 0.2,
+                            "strike_override": 0.3,
+                        }
+                        for strategy_leg in strategy.strategy_leg.all()
+                    ],
+                }
+            ],
+        }
+        self.client.force_authenticate(user=self.user)
+
+    def test_identical_inputs_reuse_result(self):
+        """
+        Test submitting identical inputs again reuses the completed result without enqueuing it
+        """
+        completed = self._complete(self._post(self.request))
+        response = self._post({**self.request, "name": "Strategy Simulation 2"})
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(str(response.data["result_id"]), str(completed.result_id))
+        self.assertEqual(response.data["simulation_status"], "COMPLETED")
+        simulation = StrategySimulation.objects.get(
+            pk=response.data["strategy_simulation_id"]
+        )
+        self.assertEqual(simulation.result_id, completed.result_id)
+        self.assertEqual(simulation.simulation_status, "COMPLETED")
+        self.assertEqual(simulation.input_hash, completed.input_hash)
+        self.assertEqual(OutboxMessage.objects.count(), 1)
+
+    def test_changed_inputs_are_queued(self):
+        """
+        Test submitting changed inputs enqueues a new result
+        """
+        completed = self._complete(self._post(self.request))
+        response = self._post({**self.request, "notional": 54321})
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotEqual(str(response.data["result_id"]), str(completed.result_id))
+        self.assertEqual(response.data["simulation_status"], "ENQUEUED")
+        self.assertEqual(OutboxMessage.objects.count(), 2)
+
+    def test_pending_result_is_not_reused(self):
+        """
+        Test identical inputs whose result is not completed yet are enqueued again
+        """
+        pending = self._post(self.request)
+        response = self._post(self.request)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotEqual(response.data["result_id"], pending.data["result_id"])
+        self.assertEqual(response.data["simulation_status"], "ENQUEUED")
+        self.assertEqual(
+            StrategySimulation.objects.get(
+                pk=pending.data["strategy_simulation_id"]
+            ).input_hash,
+            StrategySimulation.objects.get(
+                pk=response.data["strategy_simulation_id"]
+            ).input_hash,
+        )
+        self.assertEqual(OutboxMessage.objects.count(), 2)
+
+    def _post(self, data):
+        return self.client.post(
+            reverse(
+                "strategy-simulation-list",
+                kwargs={"analysis_id": self.analysis.analysis_id},
+            ),
+            data,
+            format="json",
+        )
+
+    def _complete(self, response):
+        # The core marks the simulation it was sent completed
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        simulation = StrategySimulation.objects.get(
+            pk=response.data["strategy_simulation_id"]
+        )
+        simulation.simulation_status = "COMPLETED"
+        simulation.save(new_result=False)
+        return simulation
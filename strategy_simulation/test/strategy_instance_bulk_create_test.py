@@ -0,0 +1,121 @@
+from types import SimpleNamespace
+
+from django.test import TestCase
+from rest_framework.exceptions import ValidationError
+
+from analysis.factory import AnalysisFactory
+from authentication.factory import UserFactory
+from strategy_simulation.factory import StrategyFactory, StrategySimulationFactory
+from strategy_simulation.models import StrategyInstance, StrategyLeg
+from strategy_simulation.views.strategy_simulation import (
+    StrategySimulationViewHelper,
+)
+
+
+class StrategyInstanceBulkCreateTest(TestCase):
+    """
+    Test case for validating and bulk creating the strategy instances of a simulation.
+    It is designed to check every strategy and leg is resolved up front with a fixed number of queries
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating a verified user instance
+        2. Create a strategy simulation
+        3. Create two default strategies with their legs
+        """
+        self.user = UserFactory()
+        self.strategy_simulation = StrategySimulationFactory(
+            analysis=AnalysisFactory(user=self.user)
+        )
+        self.strategies = [StrategyFactory(), StrategyFactory()]
+        self.helper = StrategySimulationViewHelper(user=self.user)
+
+    def test_instances_are_resolved_and_created_in_bulk(self):
+        """
+        Test every leg of every strategy is resolved with two queries and inserted with one
+        """
+        request = self._request(self.strategies * 3)
+        with self.assertNumQueries(2):
+            strategy_instances = self.helper.build_strategy_instances(request)
+        with self.assertNumQueries(1):
+            self.helper.create_strategy_instances(
+                self.strategy_simulation, strategy_instances
+            )
+
+        leg_count = sum(strategy.strategy_leg.count() for strategy in self.strategies)
+        self.assertEqual(
+            self.strategy_simulation.strategy_instance.count(), leg_count * 3
+        )
+        self.assertEqual(
+            set(
+                self.strategy_simulation.strategy_instance.values_list(
+                    "instance_group", flat=True
+                )
+            ),
+            set(range(1, 7)),
+        )
+
+    def test_missing_leg_is_rejected_before_saving(self):
+        """
+        Test a deleted leg fails validation and nothing is created
+        """
+        request = self._request(self.strategies)
+        StrategyLeg.objects.filter(strategy=self.strategies[1]).update(is_deleted=True)
+
+        with self.assertRaises(ValidationError):
+            self.helper.build_strategy_instances(request)
+        self.assertFalse(StrategyInstance.objects.exists())
+
+    def test_leg_of_another_strategy_is_rejected(self):
+        """
+        Test a leg sent under a strategy it does not belong to fails validation
+        """
+        request = self._request(self.strategies)
+        legs = request.data["strategy_instance"]
+        legs[0]["legs"], legs[1]["legs"] = legs[1]["legs"], legs[0]["legs"]
+
+        with self.assertRaises(ValidationError):
+            self.helper.build_strategy_instances(request)
+
+    def test_ids_are_matched_whatever_their_format(self):
+        """
+        Test upper case and unhyphenated ids resolve to the same strategies and legs
+        """
+        request = SimpleNamespace(
+            data={
+                "strategy_instance": [
+                    {
+                        "strategy_id": str(strategy.strategy_id).upper(),
+                        "legs": [
+                            {"strategy_leg_id": leg.strategy_leg_id.hex}
+                            for leg in strategy.strategy_leg.all()
+                        ],
+                    }
+                    for strategy in self.strategies
+                ]
+            }
+        )
+
+        strategy_instances = self.helper.build_strategy_instances(request)
+        self.assertEqual(
+            len(strategy_instances),
+            sum(strategy.strategy_leg.count() for strategy in self.strategies),
+        )
+
+    def _request(self, strategies):
+        return SimpleNamespace(
+            data={
+                "strategy_instance": [
+                    {
+                        "strategy_id": str(strategy.strategy_id),
+                        "legs": [
+                            {"strategy_leg_id": str(leg.strategy_leg_id)}
+                            for leg in strategy.strategy_leg.all()
+                        ],
+                    }
+                    for strategy in strategies
+                ]
+            }
+        )
@@ -0,0 +1,233 @@
+from types import SimpleNamespace
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from analysis.factory import AnalysisFactory
+from api_gateway.core.adapter import CoreAdapter
+from api_gateway.models import OutboxMessage
+from authentication.factory import UserFactory
+from strategy_simulation.factory import (
+    StrategyFactory,
+    StrategyInstanceFactory,
+    StrategySimulationFactory,
+)
+from strategy_simulation.models import StrategyInstance, StrategySimulation
+from strategy_simulation.serializers import StrategySimulationSerializer
+from strategy_simulation.views.strategy_simulation import (
+    StrategySimulationViewHelper,
+)
+
+
+class StrategySimulationDiffUpdateTest(APITestCase):
+    """
+    Test case for updating strategy simulations without rewriting unchanged legs.
+    It is designed to check that edits which are not simulation inputs keep the result and the leg rows
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating a verified user instance
+        2. Create a strategy simulation with the legs of a default strategy
+        3. Store the input hash of its core payload, as when it was submitted
+        4. Build a request matching the stored simulation
+        """
+        self.user = UserFactory()
+        self.analysis = AnalysisFactory(user=self.user)
+        self.strategy_simulation = StrategySimulationFactory(analysis=self.analysis)
+        self.strategy = StrategyFactory()
+        for strategy_leg in self.strategy.strategy_leg.all():
+            StrategyInstanceFactory(
+                strategy_simulation=self.strategy_simulation,
+                strategy_leg=strategy_leg,
+                instance_group=1,
+            )
+        self.strategy_simulation.refresh_from_db()
+        self.helper = StrategySimulationViewHelper(user=self.user)
+        self.strategy_simulation.input_hash = CoreAdapter.input_hash(
+            self.helper.core_payload(
+                self.analysis,
+                self.strategy_simulation.result_id,
+                StrategySimulationSerializer(self.strategy_simulation).data,
+            )
+        )
+        self.strategy_simulation.save(new_result=False)
+
+        simulation = self.strategy_simulation
+        environment = simulation.simulation_environment
+        self.request = {
+            "name": simulation.name,
+            "status": simulation.type_status.name,
+            "simulation_environment": {
+                "name": environment.name,
+                "volatility": environment.volatility,
+                "skew": environment.skew,
+                "appreciation_percent": environment.appreciation_percent,
+            },
+            "start_date": simulation.start_date,
+            "end_date": simulation.end_date,
+            "is_base_sold": simulation.is_base_sold,
+            "notional": str(simulation.notional),
+            "initial_spot_rate": simulation.initial_spot_rate,
+            "initial_forward_rate": simulation.initial_forward_rate,
+            "spread": simulation.spread,
+            "strategy_instance": [
+                {
+                    "strategy_id": str(self.strategy.strategy_id),
+                    "legs": [
+                        {
+                            "strategy_leg_id": str(instance.strategy_leg_id),
+                            "premium_override": str(instance.premium_override),
+                            "leverage_override": instance.leverage_override,
+                            "strike_override": instance.strike_override,
+                        }
+                        for instance in simulation.strategy_instance.order_by("pk")
+                    ],
+                }
+            ],
+        }
+
+    def test_rename_keeps_result_and_legs(self):
+        """
+        Test renaming and pinning neither rewrites the legs nor requests a new simulation result
+        """
+        stored = self._stored_instances()
+        self.client.force_authenticate(user=self.user)
+        response = self._put({**self.request, "name": "Renamed", "pin": True})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        db_object = StrategySimulation.objects.get(pk=self.strategy_simulation.pk)
+        self.assertEqual(db_object.name, "Renamed")
+        self.assertTrue(db_object.pin)
+        self.assertEqual(db_object.result_id, self.strategy_simulation.result_id)
+        self.assertEqual(self._stored_instances(), stored)
+        self.assertEqual(
+            len(response.data["strategy_instance"][0]["legs"]), len(stored)
+        )
+
+    def test_inputs_not_sent_to_the_core_keep_result(self):
+        """
+        Test changing the spread, which the core does not receive, keeps the simulation result
+        """
+        self.client.force_authenticate(user=self.user)
+        response = self._put({**self.request, "spread": 0.25})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        db_object = StrategySimulation.objects.get(pk=self.strategy_simulation.pk)
+        self.assertEqual(db_object.spread, 0.25)
+        self.assertEqual(db_object.result_id, self.strategy_simulation.result_id)
+
+    def test_environment_name_requests_new_result(self):
+        """
+        Test renaming the simulation environment, which is sent to the core, requests a new result
+        """
+        environment = {**self.request["simulation_environment"], "name": "Renamed"}
+        self.client.force_authenticate(user=self.user)
+        response = self._put({**self.request, "simulation_environment": environment})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        db_object = StrategySimulation.objects.get(pk=self.strategy_simulation.pk)
+        self.assertNotEqual(db_object.result_id, self.strategy_simulation.result_id)
+        self.assertEqual(db_object.simulation_status, "ENQUEUED")
+        self.assertNotEqual(db_object.input_hash, self.strategy_simulation.input_hash)
+
+    def test_failed_simulation_is_resubmitted(self):
+        """
+        Test saving a failed simulation with unchanged inputs enqueues it again under a new result
+        """
+        self.strategy_simulation.simulation_status = "FAILED"
+        self.strategy_simulation.save(new_result=False)
+        self.client.force_authenticate(user=self.user)
+        response = self._put(self.request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        db_object = StrategySimulation.objects.get(pk=self.strategy_simulation.pk)
+        self.assertNotEqual(db_object.result_id, self.strategy_simulation.result_id)
+        self.assertEqual(db_object.simulation_status, "ENQUEUED")
+        self.assertEqual(db_object.input_hash, self.strategy_simulation.input_hash)
+        self.assertEqual(OutboxMessage.objects.count(), 1)
+
+    def test_sync_writes_only_changed_legs(self):
+        """
+        Test a changed override is updated in place, a dropped leg deleted and a new group inserted
+        """
+        stored = self._stored_instances()
+        legs = self.request["strategy_instance"][0]["legs"]
+        legs[0]["strike_override"] = 12.5
+        other_strategy = StrategyFactory()
+        self.request["strategy_instance"].append(
+            {
+                "strategy_id": str(other_strategy.strategy_id),
+                "legs": [
+                    {"strategy_leg_id": str(strategy_leg.strategy_leg_id)}
+                    for strategy_leg in other_strategy.strategy_leg.all()
+                ],
+            }
+        )
+        dropped = legs.pop() if len(legs) > 1 else None
+
+        strategy_instances = self.helper.build_strategy_instances(
+            SimpleNamespace(data=self.request)
+        )
+        self.assertTrue(
+            self.helper.sync_strategy_instances(
+                self.strategy_simulation, strategy_instances
+            )
+        )
+
+        instances = StrategyInstance.objects.filter(
+            strategy_simulation=self.strategy_simulation
+        )
+        first = instances.get(strategy_leg_id=legs[0]["strategy_leg_id"])
+        self.assertEqual(first.pk, stored[0][0])
+        self.assertEqual(first.strike_override, 12.5)
+        for pk, _ in stored[1 : len(legs)]:
+            self.assertTrue(instances.filter(pk=pk).exists())
+        if dropped:
+            self.assertFalse(
+                instances.filter(strategy_leg_id=dropped["strategy_leg_id"]).exists()
+            )
+        self.assertEqual(
+            instances.filter(instance_group=2).count(),
+            other_strategy.strategy_leg.count(),
+        )
+
+    def test_sync_without_changes_writes_nothing(self):
+        """
+        Test syncing the stored legs again reports no change and runs no write query
+        """
+        strategy_instances = self.helper.build_strategy_instances(
+            SimpleNamespace(data=self.request)
+        )
+        simulation = StrategySimulation.objects.prefetch_related(
+            "strategy_instance"
+        ).get(pk=self.strategy_simulation.pk)
+        with self.assertNumQueries(0):
+            changed = self.helper.sync_strategy_instances(
+                simulation, strategy_instances
+            )
+        self.assertFalse(changed)
+
+    def _put(self, data):
+        return self.client.put(
+            reverse(
+                "strategy-simulation-detail",
+                kwargs={
+                    "analysis_id": self.analysis.analysis_id,
+                    "strategy_simulation_id": self.strategy_simulation.strategy_simulation_id,
+                },
+            ),
+            data,
+            format="json",
+        )
+
+    def _stored_instances(self):
+        return list(
+            StrategyInstance.objects.filter(
+                strategy_simulation=self.strategy_simulation
+            )
+            .order_by("pk")
+            .values_list("pk", "date_updated")
+        )
@@ -0,0 +1,86 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from analysis.factory import AnalysisFactory
+from authentication.factory import UserFactory
+from strategy_simulation.factory import (
+    StrategyFactory,
+    StrategyInstanceFactory,
+    StrategySimulationFactory,
+)
+
+
+class StrategySimulationQueryCountTest(APITestCase):
+    """
+    Test case for the number of queries issued by the strategy simulation API views.
+    It is designed to check the list and detail views load a simulation's graph with a fixed number of queries
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating a verified user instance
+        2. Create an analysis instance
+        3. Create a strategy simulation with two legs of a default strategy
+        """
+        self.user = UserFactory()
+        self.analysis = AnalysisFactory(user=self.user)
+        self.strategy = StrategyFactory()
+        self.strategy_simulation = self._create_simulation(legs=2)
+
+    def test_detail_query_count_is_constant(self):
+        """
+        Test retrieving a simulation with twenty legs costs as many queries as one with two legs
+        """
+        url = reverse(
+            "strategy-simulation-detail",
+            kwargs={
+                "analysis_id": self.analysis.analysis_id,
+                "strategy_simulation_id": self.strategy_simulation.strategy_simulation_id,
+            },
+        )
+        baseline = self._count_queries(url)
+
+        for group in range(2, 11):
+            self._create_instances(self.strategy_simulation, legs=2, group=group)
+        self.assertEqual(self._count_queries(url), baseline)
+
+    def test_list_query_count_is_constant(self):
+        """
+        Test listing five simulations costs as many queries as listing one
+        """
+        url = reverse(
+            "strategy-simulation-list",
+            kwargs={"analysis_id": self.analysis.analysis_id},
+        )
+        baseline = self._count_queries(url)
+
+        for _ in range(4):
+            self._create_simulation(legs=5)
+        self.assertEqual(self._count_queries(url), baseline)
+
+    def _create_simulation(self, legs):
+        strategy_simulation = StrategySimulationFactory(analysis=self.analysis)
+        self._create_instances(strategy_simulation, legs=legs, group=1)
+        return strategy_simulation
+
+    def _create_instances(self, strategy_simulation, legs, group):
+        strategy_leg = self.strategy.strategy_leg.first()
+        for _ in range(legs):
+            StrategyInstanceFactory(
+                strategy_simulation=strategy_simulation,
+                strategy_leg=strategy_leg,
+                instance_group=group,
+            )
+
+    def _count_queries(self, url):
+        self.client.force_authenticate(user=self.user)
+        # Warm up per-process caches such as the spot rate cache before counting
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(queries)
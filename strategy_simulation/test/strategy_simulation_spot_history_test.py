@@ -0,0 +1,80 @@
+from datetime import date, timedelta
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from analysis.factory import AnalysisFactory
+from authentication.factory import UserFactory
+from strategy_simulation.factory import StrategySimulationFactory
+from time_series.models import SpotHistoryData
+from time_series.utils.serialize_spot_history_data import _spot_history_window
+from time_series.utils.spot_rate_cache import spot_rate_cache
+
+
+class StrategySimulationSpotHistoryTest(APITestCase):
+    """
+    Test case for the spot history embedded in strategy simulation responses.
+    It is designed to check the history is only embedded with ?include=spot_history and is cached per pair and start date
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating a verified user instance
+        2. Create an analysis instance
+        3. Create two strategy simulations starting today
+        4. Creating a week of spot history for the analysis currencies
+        """
+        spot_rate_cache.invalidate()
+        self.user = UserFactory()
+        self.analysis = AnalysisFactory(user=self.user)
+        StrategySimulationFactory(analysis=self.analysis, is_base_sold=False)
+        StrategySimulationFactory(analysis=self.analysis, is_base_sold=False)
+        rows = []
+        for day in range(7):
+            current_date = date.today() - timedelta(days=day)
+            rows.append(
+                SpotHistoryData(
+                    date=current_date,
+                    currency=self.analysis.base_currency.code,
+                    rate=1,
+                )
+            )
+            rows.append(
+                SpotHistoryData(
+                    date=current_date,
+                    currency=self.analysis.foreign_currency.code,
+                    rate=2,
+                )
+            )
+        SpotHistoryData.objects.bulk_create(rows, ignore_conflicts=True)
+        self.url = reverse(
+            "strategy-simulation-list",
+            kwargs={"analysis_id": self.analysis.analysis_id},
+        )
+
+    def test_spot_history_not_embedded_by_default(self):
+        """
+        Test list responses leave the spot history out unless it is requested
+        """
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(self.url, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for simulation in response.data["results"]:
+            self.assertNotIn("spot_history_data", simulation)
+
+    def test_spot_history_included_and_cached(self):
+        """
+        Test ?include=spot_history embeds the history and simulations of the same pair and start date share it
+        """
+        self.client.force_authenticate(user=self.user)
+        misses = _spot_history_window.cache_info().misses
+        response = self.client.get(self.url, {"include": "spot_history"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        first, second = response.data["results"]
+        self.assertEqual(len(first["spot_history_data"]), 7)
+        self.assertEqual(first["spot_history_data"], second["spot_history_data"])
+        self.assertEqual(_spot_history_window.cache_info().misses, misses + 1)
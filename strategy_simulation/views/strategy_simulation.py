@@ -2,7 +2,9 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from django.db.models import Q
 from django.http import Http404
+from django.utils import timezone
 from django.utils.decorators import method_decorator
+from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import generics, serializers, status
 from rest_framework.exceptions import NotFound
@@ -11,12 +13,13 @@ from rest_framework.response import Response
 from analysis.models import Analysis, SimulationEnviroment
 from analysis.serializers import SimulationEnvironmentSerializer
 from api_gateway.core.adapter import CoreAdapter
+from api_gateway.core.submission import submit_simulation
 from api_gateway.exceptions import GenericAPIError
 from api_gateway.serializers import CurrencySerializer
-from api_gateway.settings import AWS
-from api_gateway.utils.mixins import NonDeletedQuerySetMixin
+from api_gateway.utils.mixins import KeysetPaginationMixin, NonDeletedQuerySetMixin
 from strategy_simulation.models import (
     StrategyInstance,
+    StrategyLeg,
     StrategySimulation,
     Strategy,
 )
@@ -25,12 +28,25 @@ from strategy_simulation.serializers import (
     StrategySimulationSerializer,
 )
 
+INCLUDE_SPOT_HISTORY = openapi.Parameter(
+    "include",
+    openapi.IN_QUERY,
+    type=openapi.TYPE_STRING,
+    description="Set to spot_history to embed the 12 months of spot history before the start date",
+    required=False,
+)
+
 
-@method_decorator(swagger_auto_schema(tags=["Strategy Simulation"]), "get")
+@method_decorator(
+    swagger_auto_schema(
+        tags=["Strategy Simulation"], manual_parameters=[INCLUDE_SPOT_HISTORY]
+    ),
+    "get",
+)
 @method_decorator(swagger_auto_schema(tags=["Strategy Simulation"]), "post")
 # This would need to be further filtered by user
 class StrategySimulationListAPIView(
-    NonDeletedQuerySetMixin, generics.ListCreateAPIView
+    KeysetPaginationMixin, NonDeletedQuerySetMixin, generics.ListCreateAPIView
 ):
     """API view for retrieving list of strategy simulations created by the authenticated user"""
 
@@ -44,7 +60,9 @@ class StrategySimulationListAPIView(
             analysis = Analysis.objects.get(
                 pk=analysis_id, user=self.request.user, is_deleted=False
             )
-            return queryset.filter(analysis=analysis)
+            return StrategySimulationSerializer.setup_eager_loading(
+                queryset.filter(analysis=analysis)
+            )
         except ObjectDoesNotExist:
             raise GenericAPIError("Object not found", code=status.HTTP_404_NOT_FOUND)
 
@@ -64,6 +82,8 @@ class StrategySimulationListAPIView(
 
                 serializer = self.get_serializer(data=request.data)
                 serializer.is_valid(raise_exception=True)
+                # Validate the leg instances before saving anything
+                strategy_instances = helper.build_strategy_instances(request)
 
                 strategy_simulation_data = serializer.validated_data
                 strategy_simulation_data.pop("strategy_instance", None)
@@ -78,47 +98,41 @@ class StrategySimulationListAPIView(
                     "simulation_environment"
                 ] = simulation_environment.save()
 
-                # TODO: fix the validation before we start saving things, we should only save after EVERYTHING is validated
                 # Create Strategy Simulation with associated Analysis
                 strategy_simulation = StrategySimulation.objects.create(
                     analysis=analysis,
                     **strategy_simulation_data,
                 )
 
-                helper.map_strategy_instance(request, strategy_simulation)
+                helper.create_strategy_instances(
+                    strategy_simulation, strategy_instances
+                )
+                strategy_simulation = StrategySimulationSerializer.setup_eager_loading(
+                    StrategySimulation.objects.all()
+                ).get(pk=strategy_simulation.pk)
 
                 response_serializer = self.get_serializer(strategy_simulation)
                 headers = self.get_success_headers(response_serializer.data)
 
-                core_payload = CoreAdapter.strategy_simulation(
-                    request.user.user_id,
-                    strategy_simulation.result_id,
-                    {
-                        **response_serializer.data,
-                        "base_currency": CurrencySerializer(
-                            analysis.base_currency
-                        ).data,
-                        "foreign_currency": CurrencySerializer(
-                            analysis.foreign_currency
-                        ).data,
-                    },
+                core_payload = helper.core_payload(
+                    analysis, strategy_simulation.result_id, response_serializer.data
                 )
 
-                simulation_sent = AWS.sqs.enqueue(
-                    core_payload, message_group_id=core_payload["simulation_id"]
+                result = submit_simulation(
+                    helper.user_simulations(),
+                    strategy_simulation.pk,
+                    core_payload,
+                    message_group_id=core_payload["simulation_id"],
                 )
-                if not simulation_sent:
-                    raise GenericAPIError("Failed to enqueue simulation", code=500)
+                response_data = {**response_serializer.data, **result}
 
                 # Clean up hidden strategy leg from response
-                for index, strategy in enumerate(
-                    response_serializer.data["strategy_instance"]
-                ):
+                for index, strategy in enumerate(response_data["strategy_instance"]):
                     for index, leg in enumerate(strategy["legs"]):
                         leg.pop("hidden_strategy_leg", None)
 
                 return Response(
-                    response_serializer.data,
+                    response_data,
                     status=status.HTTP_201_CREATED,
                     headers=headers,
                 )
@@ -129,7 +143,12 @@ class StrategySimulationListAPIView(
                 )
 
 
-@method_decorator(swagger_auto_schema(tags=["Strategy Simulation"]), "get")
+@method_decorator(
+    swagger_auto_schema(
+        tags=["Strategy Simulation"], manual_parameters=[INCLUDE_SPOT_HISTORY]
+    ),
+    "get",
+)
 @method_decorator(swagger_auto_schema(tags=["Strategy Simulation"]), "put")
 @method_decorator(swagger_auto_schema(tags=["Strategy Simulation"]), "delete")
 @method_decorator(swagger_auto_schema(auto_schema=None), "patch")
@@ -149,7 +168,9 @@ class StrategySimulationRetrieveUpdateDestroyAPIView(
             analysis = Analysis.objects.get(
                 pk=analysis_id, user=self.request.user, is_deleted=False
             )
-            return queryset.filter(analysis=analysis)
+            return StrategySimulationSerializer.setup_eager_loading(
+                queryset.filter(analysis=analysis)
+            )
         except ObjectDoesNotExist:
             raise NotFound(
                 code=status.HTTP_404_NOT_FOUND,
@@ -170,55 +191,56 @@ class StrategySimulationRetrieveUpdateDestroyAPIView(
                 serializer = self.get_serializer(instance, data=request.data)
                 serializer.is_valid(raise_exception=True)
 
-                environment = serializer.validated_data.pop(
-                    "simulation_environment", None
-                )
-                if environment:
-                    simulation_environment = SimulationEnvironmentSerializer(
-                        data=environment
-                    )
-                    simulation_environment.is_valid(raise_exception=True)
-                    for key, value in simulation_environment.validated_data.items():
-                        setattr(instance.simulation_environment, key, value)
-                    instance.simulation_environment.save()
-
-                serializer.validated_data.pop("strategy_instance", None)
-                serializer.save()
                 analysis_id = self.kwargs.get("analysis_id")
                 analysis = Analysis.objects.get(
                     pk=analysis_id, user=self.request.user, is_deleted=False
                 )
+                # Validate the new leg instances before writing anything
+                strategy_instances = helper.build_strategy_instances(request)
 
-                # TODO: We really need to valdiate the new leg instances before we start deleting the old ones
-                old_instances = instance.strategy_instance.all().delete()
-
-                helper.map_strategy_instance(request, instance)
-                core_payload = CoreAdapter.strategy_simulation(
-                    request.user.user_id,
-                    instance.result_id,
-                    {
-                        **serializer.data,
-                        "base_currency": CurrencySerializer(
-                            analysis.base_currency
-                        ).data,
-                        "foreign_currency": CurrencySerializer(
-                            analysis.foreign_currency
-                        ).data,
-                    },
+                environment = serializer.validated_data.pop(
+                    "simulation_environment", None
                 )
+                serializer.validated_data.pop("strategy_instance", None)
 
-                simulation_sent = AWS.sqs.enqueue(
-                    core_payload, message_group_id=core_payload["simulation_id"]
+                if environment:
+                    helper.update_simulation_environment(
+                        instance.simulation_environment, environment
+                    )
+                if helper.sync_strategy_instances(instance, strategy_instances):
+                    # The instances changed, drop the ones prefetched by get_queryset
+                    instance._prefetched_objects_cache = {}
+                for attr, value in serializer.validated_data.items():
+                    setattr(instance, attr, value)
+
+                # Re-simulate when the inputs sent to the core changed or the
+                # last submission failed, so a failed simulation can be retried
+                resubmit = (
+                    instance.simulation_status == "FAILED"
+                    or CoreAdapter.input_hash(
+                        helper.core_payload(
+                            analysis,
+                            instance.result_id,
+                            serializer.to_representation(instance),
+                        )
+                    )
+                    != instance.input_hash
                 )
-                if not simulation_sent:
-                    raise GenericAPIError("Failed to enqueue simulation", code=500)
+                instance.save(new_result=resubmit)
 
-                # Clean up hidden strategy leg from response
-                for index, strategy in enumerate(serializer.data["strategy_instance"]):
-                    for index, leg in enumerate(strategy["legs"]):
-                        leg.pop("hidden_strategy_leg", None)
+                if not resubmit:
+                    return Response(self.clean_response(serializer.data))
 
-                return Response(serializer.data)
+                core_payload = helper.core_payload(
+                    analysis, instance.result_id, serializer.data
+                )
+                result = submit_simulation(
+                    helper.user_simulations(),
+                    instance.pk,
+                    core_payload,
+                    message_group_id=core_payload["simulation_id"],
+                )
+                return Response(self.clean_response({**serializer.data, **result}))
 
             except (ObjectDoesNotExist, Http404):
                 # TODO: More robust error handling
@@ -226,50 +248,183 @@ class StrategySimulationRetrieveUpdateDestroyAPIView(
                     "Object not found", code=status.HTTP_404_NOT_FOUND
                 )
 
+    def clean_response(self, data):
+        # Clean up hidden strategy leg from response
+        for strategy in data["strategy_instance"]:
+            for leg in strategy["legs"]:
+                leg.pop("hidden_strategy_leg", None)
+        return data
+
     def perform_destroy(self, instance):
         instance.delete()
 
 
 class StrategySimulationViewHelper:
+    STRATEGY_INSTANCE_FIELDS = [
+        "premium_override",
+        "leverage_override",
+        "strike_override",
+    ]
+
     def __init__(self, user):
         self.user = user
 
-    def map_strategy_instance(self, request, strategy_simulation):
-        # Create the Strategy Instances
+    def user_simulations(self):
+        # Simulations whose results can be reused for this user
+        return StrategySimulation.objects.filter(
+            analysis__user=self.user, is_deleted=False
+        )
+
+    def core_payload(self, analysis, result_id, data):
+        return CoreAdapter.strategy_simulation(
+            self.user.user_id,
+            result_id,
+            {
+                **data,
+                "base_currency": CurrencySerializer(analysis.base_currency).data,
+                "foreign_currency": CurrencySerializer(analysis.foreign_currency).data,
+            },
+        )
+
+    def update_simulation_environment(self, simulation_environment, environment):
+        """
+        Applies the requested environment, saving it only when a value differs
+        """
+        environment_serializer = SimulationEnvironmentSerializer(data=environment)
+        environment_serializer.is_valid(raise_exception=True)
+        changed = {
+            key: value
+            for key, value in environment_serializer.validated_data.items()
+            if getattr(simulation_environment, key) != value
+        }
+        if not changed:
+            return
+        for key, value in changed.items():
+            setattr(simulation_environment, key, value)
+        simulation_environment.save()
+
+    def sync_strategy_instances(self, strategy_simulation, strategy_instances):
+        """
+        Diffs the requested instances against the stored ones, matched on their
+        instance group and leg. Unchanged rows are left alone, changed overrides
+        are updated in place and only the remaining rows are deleted or inserted.
+        Returns whether any row was written.
+        """
+        stored = {}
+        for strategy_instance in strategy_simulation.strategy_instance.all():
+            key = (strategy_instance.instance_group, strategy_instance.strategy_leg_id)
+            stored.setdefault(key, []).append(strategy_instance)
+
+        to_create, to_update = [], []
+        for strategy_instance in strategy_instances:
+            key = (strategy_instance.instance_group, strategy_instance.strategy_leg_id)
+            matches = stored.get(key)
+            if not matches:
+                to_create.append(strategy_instance)
+                continue
+            existing = matches.pop(0)
+            changed = False
+            for field in self.STRATEGY_INSTANCE_FIELDS:
+                value = getattr(strategy_instance, field)
+                if getattr(existing, field) != value:
+                    setattr(existing, field, value)
+                    changed = True
+            if changed:
+                existing.date_updated = timezone.now()
+                to_update.append(existing)
+
+        to_delete = [
+            strategy_instance.pk
+            for matches in stored.values()
+            for strategy_instance in matches
+        ]
+        if to_delete:
+            StrategyInstance.objects.filter(pk__in=to_delete).delete()
+        if to_update:
+            StrategyInstance.objects.bulk_update(
+                to_update, [*self.STRATEGY_INSTANCE_FIELDS, "date_updated"]
+            )
+        if to_create:
+            self.create_strategy_instances(strategy_simulation, to_create)
+        return bool(to_delete or to_update or to_create)
+
+    def create_strategy_instances(self, strategy_simulation, strategy_instances):
+        # Create the Strategy Instances with a single insert
+        for strategy_instance in strategy_instances:
+            strategy_instance.strategy_simulation = strategy_simulation
+        return StrategyInstance.objects.bulk_create(strategy_instances)
+
+    def build_strategy_instances(self, request):
+        """
+        Validates every requested leg instance and returns them unsaved, without a simulation.
+        The referenced strategies and legs are resolved with one query each before
+        anything is written: a missing strategy raises DoesNotExist and a leg that
+        does not belong to its strategy raises a ValidationError.
+        """
         strategy_instances_data = request.data.get("strategy_instance", [])
 
+        validated_legs = []
         for index, instance_data in enumerate(strategy_instances_data):
-            # Get required strategy data
-            strategy_id = instance_data.get("strategy_id")
-            strategy_leg_list = instance_data.get("legs", [])
-
-            # Iterate the strategy leg instances
-            for leg_data in strategy_leg_list:
-                # leg_id = leg_data.pop("strategy_leg_id")
+            # Ids are compared as UUIDs, whatever their format in the request
+            strategy_id = serializers.UUIDField().run_validation(
+                instance_data.get("strategy_id")
+            )
+            for leg_data in instance_data.get("legs", []):
                 leg_instance_serializer = StrategyInstanceSerializer(data=leg_data)
                 leg_instance_serializer.is_valid(raise_exception=True)
                 leg_instance_serializer.validated_data.pop("hidden_strategy_leg")
                 leg_id = leg_instance_serializer.validated_data.pop(
                     "strategy_leg_id", None
                 )
-
-                # TODO: fix the validation before we start saving things
-                # TODO: In the future, custom strategy will be shared with other users,
-                #       Would need to check permissions another way
-                # TODO! - can we use bulk create here?
-                # Create the leg instance accordingly
-                strategy = Strategy.objects.get(
-                    Q(**{"created_by_user": self.user})
-                    | Q(**{"created_by_user__isnull": True}),
-                    strategy_id=strategy_id,
-                    is_deleted=False,
+                if leg_id is None:
+                    raise serializers.ValidationError(
+                        {"strategy_leg_id": "This field is required."}
+                    )
+                validated_legs.append(
+                    (
+                        index + 1,
+                        strategy_id,
+                        leg_id,
+                        leg_instance_serializer.validated_data,
+                    )
                 )
-                strategy_leg = strategy.strategy_leg.get(
-                    strategy_leg_id=leg_id, is_deleted=False
+
+        # TODO: In the future, custom strategy will be shared with other users,
+        #       Would need to check permissions another way
+        strategy_ids = {strategy_id for _, strategy_id, _, _ in validated_legs}
+        strategies = Strategy.objects.filter(
+            Q(**{"created_by_user": self.user})
+            | Q(**{"created_by_user__isnull": True}),
+            strategy_id__in=strategy_ids,
+            is_deleted=False,
+        ).values_list("strategy_id", flat=True)
+        if len(strategies) != len(strategy_ids):
+            raise Strategy.DoesNotExist("Strategy not found")
+
+        strategy_legs = {
+            (strategy_leg.strategy_id, strategy_leg.pk): strategy_leg
+            for strategy_leg in StrategyLeg.objects.filter(
+                strategy_id__in=strategy_ids,
+                strategy_leg_id__in={leg_id for _, _, leg_id, _ in validated_legs},
+                is_deleted=False,
+            )
+        }
+
+        strategy_instances = []
+        for instance_group, strategy_id, leg_id, validated_data in validated_legs:
+            strategy_leg = strategy_legs.get((strategy_id, leg_id))
+            if strategy_leg is None:
+                raise serializers.ValidationError(
+                    {
+                        "strategy_leg_id": f"Strategy leg {leg_id} not found "
+                        f"in strategy {strategy_id}"
+                    }
                 )
-                StrategyInstance.objects.create(
-                    strategy_simulation=strategy_simulation,
+            strategy_instances.append(
+                StrategyInstance(
                     strategy_leg=strategy_leg,
-                    instance_group=index + 1,
-                    **leg_instance_serializer.validated_data,
+                    instance_group=instance_group,
+                    **validated_data,
                 )
+            )
+        return strategy_instances
@@ -1,6 +1,9 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
+from django.db.models.signals import post_delete, post_migrate, post_save
+from time_series.utils.business_calendar import invalidate_business_calendars
+from time_series.utils.forward_efficiency import invalidate_forward_efficiency
 from time_series.utils.spot_history_data import backfill_spot_history_data
+from time_series.utils.spot_rate_cache import invalidate_spot_rate_cache
 
 
 class TimeSeriesConfig(AppConfig):
@@ -8,3 +11,19 @@ class TimeSeriesConfig(AppConfig):
 
     def ready(self):
         post_migrate.connect(backfill_spot_history_data, sender=self)
+
+        spot_history_data = self.get_model("SpotHistoryData")
+        post_save.connect(invalidate_spot_rate_cache, sender=spot_history_data)
+        post_delete.connect(invalidate_spot_rate_cache, sender=spot_history_data)
+
+        currency_holiday = self.get_model("CurrencyHoliday")
+        post_save.connect(invalidate_business_calendars, sender=currency_holiday)
+        post_delete.connect(invalidate_business_calendars, sender=currency_holiday)
+
+        forward_rate_history_data = self.get_model("ForwardRateHistoryData")
+        post_save.connect(
+            invalidate_forward_efficiency, sender=forward_rate_history_data
+        )
+        post_delete.connect(
+            invalidate_forward_efficiency, sender=forward_rate_history_data
+        )
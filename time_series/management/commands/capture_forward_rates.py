@@ -0,0 +1,70 @@
+import requests
+from dateutil.relativedelta import relativedelta
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from time_series.utils.forward_efficiency import invalidate_forward_efficiency
+
+
+class Command(BaseCommand):
+    help = (
+        "Capture today's FENICS forward quotes for every (pair, duration) of the saved "
+        "forward efficiencies into forward_rate_history_data"
+    )
+
+    def handle(self, *args, **options):
+        from api_gateway.settings import FENICS_CLIENT
+        from market.models import FwdEfficiency
+
+        today = timezone.now().date()
+        tenors = (
+            FwdEfficiency.objects.filter(is_deleted=False)
+            .values_list("base_currency__code", "foreign_currency__code", "duration")
+            .distinct()
+        )
+
+        rows = []
+        for base_currency, foreign_currency, duration in tenors:
+            try:
+                response = FENICS_CLIENT.vanilla_pricing_query(
+                    foreign_currency=foreign_currency,
+                    base_currency=base_currency,
+                    end_date=timezone.now() + relativedelta(months=duration),
+                )
+            except requests.RequestException as e:
+                # A failed tenor must not discard the quotes already fetched
+                response = {"errors": str(e)}
+            if "errors" in response:
+                self.stderr.write(
+                    f"Skipping {base_currency}/{foreign_currency} {duration}M: "
+                    f"{response['errors']}"
+                )
+                continue
+            rows.append(
+                (
+                    today,
+                    base_currency,
+                    foreign_currency,
+                    duration,
+                    response["Spot"],
+                    response["Forward"],
+                )
+            )
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.executemany(
+                """
+                INSERT INTO forward_rate_history_data
+                    (date, base_currency, foreign_currency, duration, spot_rate, forward_rate)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                ON CONFLICT (base_currency, foreign_currency, duration, date)
+                DO UPDATE SET spot_rate = EXCLUDED.spot_rate, forward_rate = EXCLUDED.forward_rate
+                """,
+                rows,
+            )
+
+        invalidate_forward_efficiency()
+        self.stdout.write(
+            self.style.SUCCESS(f"Captured {len(rows)} of {len(tenors)} forward quotes")
+        )
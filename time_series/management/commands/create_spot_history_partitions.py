@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from time_series.utils.partitions import create_year_partition, partition_name
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the yearly spot_history_data partitions from the current year up to "
+        "--years-ahead years ahead, moving rows out of the default partition"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--years-ahead",
+            type=int,
+            default=1,
+            help="Number of future years to create partitions for, defaults to 1",
+        )
+
+    def handle(self, *args, **options):
+        if options["years_ahead"] < 0:
+            raise CommandError("--years-ahead must be zero or positive")
+
+        current_year = timezone.now().year
+        with transaction.atomic(), connection.cursor() as cursor:
+            for year in range(current_year, current_year + options["years_ahead"] + 1):
+                if create_year_partition(cursor, year):
+                    self.stdout.write(
+                        self.style.SUCCESS(f"Created partition {partition_name(year)}")
+                    )
+                else:
+                    self.stdout.write(
+                        f"Partition {partition_name(year)} already exists"
+                    )
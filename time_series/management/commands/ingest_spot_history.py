@@ -0,0 +1,104 @@
+import gzip
+from time import perf_counter
+from urllib.parse import urlparse
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from time_series.utils.spot_rate_cache import spot_rate_cache
+
+STAGING_TABLE = "spot_history_data_staging"
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk load spot history CSV files (date, currency, rate) from local disk or "
+        "S3 into spot_history_data through COPY and upsert on (date, currency)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "sources",
+            nargs="+",
+            help="Local paths or s3://bucket/key URIs of .csv or .csv.gz files",
+        )
+        parser.add_argument(
+            "--delimiter", default=",", help="Column delimiter, defaults to ','"
+        )
+        parser.add_argument(
+            "--header",
+            action="store_true",
+            help="Skip the first line of every file",
+        )
+
+    def handle(self, *args, **options):
+        started = perf_counter()
+        staged = 0
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                CREATE TEMPORARY TABLE {STAGING_TABLE} (
+                    date date NOT NULL,
+                    currency varchar(3) NOT NULL,
+                    rate numeric(18, 6) NOT NULL
+                ) ON COMMIT DROP
+                """
+            )
+            copy_sql = cursor.mogrify(
+                f"COPY {STAGING_TABLE} (date, currency, rate) FROM STDIN "
+                "WITH (FORMAT csv, DELIMITER %s, HEADER %s)",
+                [options["delimiter"], options["header"]],
+            ).decode()
+
+            for source in options["sources"]:
+                with self.open_source(source) as file:
+                    cursor.copy_expert(copy_sql, file)
+                self.stdout.write(f"Staged {cursor.rowcount} rows from {source}")
+                staged += cursor.rowcount
+
+            # Keep one row per (date, currency) so the upsert never touches a row twice
+            cursor.execute(
+                f"""
+                INSERT INTO spot_history_data (date, currency, rate)
+                SELECT DISTINCT ON (date, currency) date, currency, rate
+                FROM (
+                    SELECT date, upper(currency) AS currency, rate
+                    FROM {STAGING_TABLE}
+                ) AS staged
+                WHERE currency IN (SELECT code FROM type_currency)
+                ORDER BY date, currency
+                ON CONFLICT (date, currency) DO UPDATE SET rate = EXCLUDED.rate
+                """
+            )
+            upserted = cursor.rowcount
+
+        spot_rate_cache.invalidate()
+        elapsed = perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Upserted {upserted} of {staged} staged rows in {elapsed:.2f}s "
+                f"({staged / elapsed if elapsed else staged:.0f} rows/s)"
+            )
+        )
+
+    def open_source(self, source: str):
+        """
+        Opens a local or S3 source as a binary stream, decompressing .gz files on the fly
+        """
+        if not source.endswith((".csv", ".csv.gz")):
+            raise CommandError(
+                f"Unsupported file type for {source}, expected .csv or .csv.gz"
+            )
+
+        is_compressed = source.endswith(".gz")
+        if source.startswith("s3://"):
+            from api_gateway.settings import AWS
+
+            location = urlparse(source)
+            file = AWS.s3.open(location.path.lstrip("/"), bucket_name=location.netloc)
+            return gzip.GzipFile(fileobj=file) if is_compressed else file
+
+        try:
+            return gzip.open(source, "rb") if is_compressed else open(source, "rb")
+        except OSError as e:
+            raise CommandError(f"Unable to open {source}: {e}")
@@ -0,0 +1,115 @@
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+# Postgres requires the partition key in every unique constraint, so the primary key
+# becomes (id, date) in the database while Django keeps treating id as the primary key.
+# The unique constraint keeps the name Django generated for unique_together
+PARTITION_SQL = """
+ALTER TABLE spot_history_data RENAME TO spot_history_data_unpartitioned;
+ALTER TABLE spot_history_data_unpartitioned
+    RENAME CONSTRAINT spot_history_data_pkey TO spot_history_data_unpartitioned_pkey;
+ALTER TABLE spot_history_data_unpartitioned
+    RENAME CONSTRAINT spot_history_data_date_currency_cd95c46d_uniq
+    TO spot_history_data_unpartitioned_date_currency_uniq;
+
+CREATE TABLE spot_history_data (
+    id bigint NOT NULL,
+    date date NOT NULL,
+    currency varchar(3) NOT NULL,
+    rate numeric(18, 6) NOT NULL,
+    CONSTRAINT spot_history_data_pkey PRIMARY KEY (id, date),
+    CONSTRAINT spot_history_data_date_currency_cd95c46d_uniq UNIQUE (date, currency)
+) PARTITION BY RANGE (date);
+
+CREATE TABLE spot_history_data_default PARTITION OF spot_history_data DEFAULT;
+
+DO $$
+DECLARE
+    year integer;
+BEGIN
+    FOR year IN
+        SELECT generate_series(
+            COALESCE(EXTRACT(YEAR FROM min(date))::integer, EXTRACT(YEAR FROM current_date)::integer),
+            EXTRACT(YEAR FROM current_date)::integer + 1
+        )
+        FROM spot_history_data_unpartitioned
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE spot_history_data_y%s PARTITION OF spot_history_data FOR VALUES FROM (%L) TO (%L)',
+            year, make_date(year, 1, 1), make_date(year + 1, 1, 1)
+        );
+    END LOOP;
+END $$;
+
+CREATE INDEX spot_history_data_date_brin ON spot_history_data USING brin (date);
+
+INSERT INTO spot_history_data (id, date, currency, rate)
+SELECT id, date, currency, rate FROM spot_history_data_unpartitioned;
+
+DROP TABLE spot_history_data_unpartitioned;
+
+CREATE SEQUENCE spot_history_data_id_seq OWNED BY spot_history_data.id;
+SELECT setval('spot_history_data_id_seq', COALESCE(max(id), 0) + 1, false) FROM spot_history_data;
+ALTER TABLE spot_history_data ALTER COLUMN id SET DEFAULT nextval('spot_history_data_id_seq');
+
+ANALYZE spot_history_data;
+"""
+
+UNPARTITION_SQL = """
+ALTER TABLE spot_history_data RENAME TO spot_history_data_partitioned;
+ALTER SEQUENCE spot_history_data_id_seq RENAME TO spot_history_data_partitioned_id_seq;
+ALTER TABLE spot_history_data_partitioned
+    RENAME CONSTRAINT spot_history_data_pkey TO spot_history_data_partitioned_pkey;
+ALTER TABLE spot_history_data_partitioned
+    RENAME CONSTRAINT spot_history_data_date_currency_cd95c46d_uniq
+    TO spot_history_data_partitioned_date_currency_uniq;
+
+CREATE TABLE spot_history_data (
+    id bigint GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    date date NOT NULL,
+    currency varchar(3) NOT NULL,
+    rate numeric(18, 6) NOT NULL,
+    CONSTRAINT spot_history_data_date_currency_cd95c46d_uniq UNIQUE (date, currency)
+);
+CREATE INDEX spot_histor_date_4e10b5_idx ON spot_history_data (date);
+CREATE INDEX spot_histor_date_655ad1_idx ON spot_history_data (date, currency);
+
+INSERT INTO spot_history_data (id, date, currency, rate)
+SELECT id, date, currency, rate FROM spot_history_data_partitioned;
+
+DROP TABLE spot_history_data_partitioned;
+
+SELECT setval(
+    pg_get_serial_sequence('spot_history_data', 'id'), COALESCE(max(id), 0) + 1, false
+) FROM spot_history_data;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("time_series", "0002_populate_spot_history_data"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(sql=PARTITION_SQL, reverse_sql=UNPARTITION_SQL),
+            ],
+            state_operations=[
+                migrations.RemoveIndex(
+                    model_name="spothistorydata",
+                    name="spot_histor_date_4e10b5_idx",
+                ),
+                migrations.RemoveIndex(
+                    model_name="spothistorydata",
+                    name="spot_histor_date_655ad1_idx",
+                ),
+                migrations.AddIndex(
+                    model_name="spothistorydata",
+                    index=django.contrib.postgres.indexes.BrinIndex(
+                        fields=["date"], name="spot_history_data_date_brin"
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("time_series", "0003_partition_spot_history_data"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CurrencyHoliday",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("currency", models.CharField(max_length=3)),
+                ("name", models.CharField(blank=True, default="", max_length=255)),
+            ],
+            options={
+                "db_table": "currency_holiday",
+                "indexes": [
+                    models.Index(
+                        fields=["currency"], name="currency_ho_currenc_ec2142_idx"
+                    )
+                ],
+                "unique_together": {("date", "currency")},
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:24
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("time_series", "0004_currency_holiday"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ForwardRateHistoryData",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("base_currency", models.CharField(max_length=3)),
+                ("foreign_currency", models.CharField(max_length=3)),
+                ("duration", models.IntegerField()),
+                ("spot_rate", models.DecimalField(decimal_places=6, max_digits=18)),
+                ("forward_rate", models.DecimalField(decimal_places=6, max_digits=18)),
+            ],
+            options={
+                "db_table": "forward_rate_history_data",
+                "indexes": [
+                    django.contrib.postgres.indexes.BrinIndex(
+                        fields=["date"], name="forward_rate_history_date_brin"
+                    )
+                ],
+                "unique_together": {
+                    ("base_currency", "foreign_currency", "duration", "date")
+                },
+            },
+        ),
+    ]
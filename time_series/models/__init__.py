@@ -1 +1,3 @@
 from .spot_history_data import SpotHistoryData
+from .currency_holiday import CurrencyHoliday
+from .forward_rate_history_data import ForwardRateHistoryData
@@ -0,0 +1,18 @@
+from django.db import models
+
+
+class CurrencyHoliday(models.Model):
+    """
+    Non-settlement date of a currency, used to build its business day calendar
+    """
+
+    date = models.DateField()
+    currency = models.CharField(max_length=3)
+    name = models.CharField(max_length=255, blank=True, default="")
+
+    class Meta:
+        db_table = "currency_holiday"
+        unique_together = (("date", "currency"),)
+        indexes = [
+            models.Index(fields=["currency"]),
+        ]
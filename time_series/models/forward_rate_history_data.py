@@ -0,0 +1,22 @@
+from django.contrib.postgres.indexes import BrinIndex
+from django.db import models
+
+
+class ForwardRateHistoryData(models.Model):
+    """
+    Daily forward quote of a pair for a tenor of `duration` months, captured from FENICS
+    """
+
+    date = models.DateField()
+    base_currency = models.CharField(max_length=3)
+    foreign_currency = models.CharField(max_length=3)
+    duration = models.IntegerField()
+    spot_rate = models.DecimalField(max_digits=18, decimal_places=6)
+    forward_rate = models.DecimalField(max_digits=18, decimal_places=6)
+
+    class Meta:
+        db_table = "forward_rate_history_data"
+        unique_together = (("base_currency", "foreign_currency", "duration", "date"),)
+        indexes = [
+            BrinIndex(fields=["date"], name="forward_rate_history_date_brin"),
+        ]
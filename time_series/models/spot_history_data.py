@@ -1,9 +1,16 @@
 import uuid
 
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
 
 
 class SpotHistoryData(models.Model):
+    """
+    Daily USD spot rate of a currency.
+    The table is range partitioned by year on date (see migration 0003), partitions
+    for upcoming years are created with the create_spot_history_partitions command.
+    """
+
     date = models.DateField()
     currency = models.CharField(max_length=3)
     rate = models.DecimalField(max_digits=18, decimal_places=6)
@@ -12,6 +19,5 @@ class SpotHistoryData(models.Model):
         db_table = "spot_history_data"
         unique_together = (("date", "currency"),)
         indexes = [
-            models.Index(fields=["date"]),
-            models.Index(fields=["date", "currency"]),
+            BrinIndex(fields=["date"], name="spot_history_data_date_brin"),
         ]
@@ -1,7 +1,11 @@
 from rest_framework import serializers
 
 from api_gateway.utils.fields import CurrencyField
-from time_series.utils.serialize_spot_history_data import SpotHistoryDataHelper
+from time_series.utils.resample import DAILY, RESOLUTION_CHOICES
+from time_series.utils.serialize_spot_history_data import (
+    SpotHistoryDataHelper,
+    SpotHistoryMatrixHelper,
+)
 
 
 class SpotHistoryDataSerializer(serializers.Serializer):
@@ -9,12 +13,19 @@ class SpotHistoryDataSerializer(serializers.Serializer):
         fields = [
             "date",
             "rate",
+            "open",
+            "high",
+            "low",
         ]
 
     def to_representation(self, instance):
         data = dict()
         data["date"] = instance["date"]
         data["rate"] = instance["rate"]
+        # OHLC values are only present on weekly and monthly buckets
+        for key in ("open", "high", "low"):
+            if key in instance:
+                data[key] = instance[key]
         return data
 
 
@@ -24,6 +35,10 @@ class SpotHistoryDataRequestSerializer(serializers.Serializer):
     start_date = serializers.DateField()
     end_date = serializers.DateField()
     is_base_sold = serializers.BooleanField()
+    resolution = serializers.ChoiceField(
+        choices=RESOLUTION_CHOICES, default=DAILY, required=False
+    )
+    max_points = serializers.IntegerField(min_value=3, required=False, allow_null=True)
     spot_history_data = serializers.SerializerMethodField()
 
     class Meta:
@@ -33,10 +48,15 @@ class SpotHistoryDataRequestSerializer(serializers.Serializer):
             "start_date",
             "end_date",
             "is_base_sold",
+            "resolution",
+            "max_points",
             "spot_history_data",
         ]
 
     def get_spot_history_data(self, obj):
+        return self.get_spot_history_helper(obj).serializer_spot_history_date()
+
+    def get_spot_history_helper(self, obj, **kwargs):
         base_currency = (
             obj["foreign_currency"].code
             if obj["is_base_sold"]
@@ -52,4 +72,46 @@ class SpotHistoryDataRequestSerializer(serializers.Serializer):
             foreign_currency=foreign_currency,
             date_from=obj["start_date"],
             date_to=obj["end_date"],
-        ).serializer_spot_history_date()
+            resolution=obj.get("resolution", DAILY),
+            max_points=obj.get("max_points"),
+            **kwargs
+        )
+
+
+class SpotHistoryPairSerializer(serializers.Serializer):
+    base_currency = CurrencyField()
+    foreign_currency = CurrencyField()
+
+    class Meta:
+        fields = [
+            "base_currency",
+            "foreign_currency",
+        ]
+
+
+class SpotHistoryMatrixRequestSerializer(serializers.Serializer):
+    pairs = SpotHistoryPairSerializer(many=True, allow_empty=False)
+    start_date = serializers.DateField()
+    end_date = serializers.DateField()
+    spot_history_matrix = serializers.SerializerMethodField()
+
+    class Meta:
+        fields = [
+            "pairs",
+            "start_date",
+            "end_date",
+            "spot_history_matrix",
+        ]
+
+    def get_spot_history_matrix(self, obj):
+        """
+        Returns the shared date axis and one row of rates per date, with one column per requested pair
+        """
+        return SpotHistoryMatrixHelper(
+            pairs=[
+                (pair["base_currency"].code, pair["foreign_currency"].code)
+                for pair in obj["pairs"]
+            ],
+            date_from=obj["start_date"],
+            date_to=obj["end_date"],
+        ).spot_history_matrix()
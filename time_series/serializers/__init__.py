@@ -1,4 +1,6 @@
 from .SpotHistoryDataSerializer import (
     SpotHistoryDataSerializer,
     SpotHistoryDataRequestSerializer,
+    SpotHistoryMatrixRequestSerializer,
+    SpotHistoryPairSerializer,
 )
@@ -0,0 +1,9 @@
+from .spot_rate_cache_test import SpotRateCacheTest
+from .resample_spot_history_test import ResampleSpotHistoryTest
+from .ingest_spot_history_test import IngestSpotHistoryTest
+from .stream_spot_history_test import StreamSpotHistoryTest
+from .columnar_spot_history_test import ColumnarSpotHistoryTest
+from .spot_history_partitions_test import SpotHistoryPartitionsTest
+from .business_calendar_test import BusinessCalendarTest
+from .spot_history_matrix_test import SpotHistoryMatrixTest
+from .capture_forward_rates_test import CaptureForwardRatesTest
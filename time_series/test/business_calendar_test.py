@@ -0,0 +1,77 @@
+from datetime import date
+
+import numpy as np
+from django.test import TestCase
+
+from time_series.models import CurrencyHoliday
+from time_series.utils.business_calendar import (
+    calendar_for,
+    invalidate_business_calendars,
+)
+from time_series.utils.spot_history_data import count_work_days, get_next_work_day
+
+
+class BusinessCalendarTest(TestCase):
+    """
+    Test case for the vectorized business day calendar.
+    It is designed to check weekends and per-currency holidays are skipped for single dates and arrays
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating a EUR holiday on Monday 2024-01-01
+        2. Dropping the holiday sets loaded by previous tests
+        """
+        CurrencyHoliday.objects.create(
+            date=date(2024, 1, 1), currency="EUR", name="New Year's Day"
+        )
+        invalidate_business_calendars()
+
+    def test_next_work_day_skips_weekend(self):
+        """
+        Test Friday, Saturday and Sunday all move to the following Monday
+        """
+        for day in [date(2024, 1, 5), date(2024, 1, 6), date(2024, 1, 7)]:
+            self.assertEqual(get_next_work_day(day), date(2024, 1, 8))
+        self.assertEqual(get_next_work_day(date(2024, 1, 8)), date(2024, 1, 9))
+
+    def test_count_work_days_with_holidays(self):
+        """
+        Test the inclusive work day count only removes the holidays of the given currencies
+        """
+        self.assertEqual(count_work_days(date(2024, 1, 1), date(2024, 1, 14)), 10)
+        self.assertEqual(
+            count_work_days(date(2024, 1, 1), date(2024, 1, 14), "EUR", "USD"), 9
+        )
+        self.assertEqual(count_work_days(date(2024, 1, 8), date(2024, 1, 5)), 0)
+        self.assertEqual(get_next_work_day(date(2023, 12, 29), "EUR"), date(2024, 1, 2))
+
+    def test_array_operations(self):
+        """
+        Test a whole schedule is rolled and counted in one call
+        """
+        calendar = calendar_for("EUR")
+        dates = np.array(
+            ["2023-12-30", "2024-01-01", "2024-01-03"], dtype="datetime64[D]"
+        )
+
+        np.testing.assert_array_equal(
+            calendar.offset(dates, 0),
+            np.array(["2024-01-02", "2024-01-02", "2024-01-03"], dtype="datetime64[D]"),
+        )
+        np.testing.assert_array_equal(
+            calendar.is_business_day(dates), [False, False, True]
+        )
+        self.assertEqual(
+            calendar.business_days(date(2023, 12, 29), date(2024, 1, 3)).tolist(),
+            [date(2023, 12, 29), date(2024, 1, 2), date(2024, 1, 3)],
+        )
+
+    def test_saved_holiday_invalidates_calendar(self):
+        """
+        Test saving a holiday is reflected in the calendars loaded before it
+        """
+        self.assertTrue(calendar_for("USD").is_business_day(date(2024, 1, 15)))
+        CurrencyHoliday.objects.create(date=date(2024, 1, 15), currency="USD")
+        self.assertFalse(calendar_for("USD").is_business_day(date(2024, 1, 15)))
@@ -0,0 +1,60 @@
+from io import StringIO
+from unittest import mock
+
+import requests
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from api_gateway.models import TypeCurrency
+from authentication.factory import UserFactory
+from market.factory import FwdEfficiencyFactory
+from market.models import FwdEfficiency
+
+
+class CaptureForwardRatesTest(TestCase):
+    """
+    Test case for capturing the daily FENICS forward quotes.
+    It is designed to check that a tenor failing over HTTP is skipped without losing the others
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating a verified user instance
+        2. Create forward efficiencies on one pair for a 1 and a 3 month tenor
+        """
+        user = UserFactory()
+        # Every new user is seeded with a default forward efficiency
+        FwdEfficiency.objects.filter(user=user).delete()
+        self.base_currency, self.foreign_currency = TypeCurrency.objects.order_by(
+            "code"
+        )[:2]
+        for duration in (1, 3):
+            FwdEfficiencyFactory(
+                user=user,
+                base_currency=self.base_currency,
+                foreign_currency=self.foreign_currency,
+                duration=duration,
+            )
+
+    def test_http_error_skips_tenor(self):
+        """
+        Test an HTTP error on one tenor is reported and the other tenor is still stored
+        """
+        responses = [
+            {"Spot": "1.1", "Forward": "1.2"},
+            requests.HTTPError("503 Server Error"),
+        ]
+        stdout, stderr = StringIO(), StringIO()
+        with mock.patch(
+            "api_gateway.settings.FENICS_CLIENT.vanilla_pricing_query",
+            side_effect=responses,
+        ):
+            call_command("capture_forward_rates", stdout=stdout, stderr=stderr)
+
+        self.assertIn("Captured 1 of 2 forward quotes", stdout.getvalue())
+        self.assertIn("503 Server Error", stderr.getvalue())
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM forward_rate_history_data")
+            self.assertEqual(cursor.fetchone()[0], 1)
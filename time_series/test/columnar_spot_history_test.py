@@ -0,0 +1,82 @@
+from datetime import date, timedelta
+
+import numpy as np
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from api_gateway.models import TypeCurrency
+from api_gateway.utils.renderers import parse_columnar
+from authentication.factory import UserFactory
+from time_series.models import SpotHistoryData
+from time_series.utils.spot_rate_cache import spot_rate_cache
+
+
+class ColumnarSpotHistoryTest(APITestCase):
+    """
+    Test case for the packed columnar encoding of the spot history API view.
+    It is designed to check the binary payload round trips to the same dates and rates
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Create a verified user instance
+        2. Creating five days of USD and EUR spot history
+        """
+        spot_rate_cache.invalidate()
+        self.user = UserFactory()
+        self.start_date = date(2024, 1, 1)
+        rows = []
+        for day in range(5):
+            current_date = self.start_date + timedelta(days=day)
+            rows.append(SpotHistoryData(date=current_date, currency="USD", rate=1))
+            rows.append(
+                SpotHistoryData(date=current_date, currency="EUR", rate=day + 0.5)
+            )
+        SpotHistoryData.objects.bulk_create(rows)
+
+    def test_columnar_round_trip(self):
+        """
+        Test the Accept header selects the columnar payload with ascending dates
+        """
+        response = self._post(HTTP_ACCEPT="application/vnd.timeseries.columnar")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response["Content-Type"], "application/vnd.timeseries.columnar"
+        )
+        self.assertEqual(len(response.content), 8 + 5 * (4 + 8))
+        dates, rates = parse_columnar(response.content)
+        self.assertEqual(dates[0].tolist(), self.start_date)
+        np.testing.assert_allclose(rates, [0.5, 1.5, 2.5, 3.5, 4.5])
+
+    def test_columnar_validation_error(self):
+        """
+        Test validation errors are still returned as JSON with ?format=columnar
+        """
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            reverse("spot-history-data") + "?format=columnar", {}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(b"baseCurrency", response.content)
+
+    def _post(self, **headers):
+        self.client.force_authenticate(user=self.user)
+        return self.client.post(
+            reverse("spot-history-data"),
+            {
+                "base_currency": self._currency("USD"),
+                "foreign_currency": self._currency("EUR"),
+                "start_date": self.start_date,
+                "end_date": self.start_date + timedelta(days=4),
+                "is_base_sold": False,
+            },
+            format="json",
+            **headers,
+        )
+
+    def _currency(self, code):
+        currency = TypeCurrency.objects.filter(code=code).first()
+        return {"code": currency.code, "country_name": currency.country_name}
@@ -0,0 +1,80 @@
+import gzip
+import os
+import tempfile
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from time_series.models import SpotHistoryData
+
+
+class IngestSpotHistoryTest(TestCase):
+    """
+    Test case for the ingest_spot_history management command.
+    It is designed to check files are copied into spot_history_data and upserted on (date, currency)
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating an existing EUR spot history row that the import overrides
+        2. Creating a temporary directory for the import files
+        """
+        SpotHistoryData.objects.create(date=date(2024, 1, 1), currency="EUR", rate=1)
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write(self, name, content, compress=False):
+        path = os.path.join(self.directory.name, name)
+        with gzip.open(path, "wt") if compress else open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def test_ingest_upserts_rows(self):
+        """
+        Test rows are inserted, existing rows are updated and unknown currencies are skipped
+        """
+        path = self._write(
+            "spot.csv",
+            "date,currency,rate\n"
+            "2024-01-01,EUR,0.91\n"
+            "2024-01-02,eur,0.92\n"
+            "2024-01-02,XXX,5\n",
+        )
+        output = StringIO()
+        call_command("ingest_spot_history", path, "--header", stdout=output)
+
+        self.assertIn("Upserted 2 of 3 staged rows", output.getvalue())
+        self.assertEqual(
+            list(SpotHistoryData.objects.order_by("date").values_list("date", "rate")),
+            [
+                (date(2024, 1, 1), Decimal("0.910000")),
+                (date(2024, 1, 2), Decimal("0.920000")),
+            ],
+        )
+
+    def test_ingest_gzip_file(self):
+        """
+        Test compressed files are decompressed while copying
+        """
+        path = self._write("spot.csv.gz", "2024-01-03,GBP,0.8\n", compress=True)
+        call_command("ingest_spot_history", path, stdout=StringIO())
+
+        self.assertTrue(
+            SpotHistoryData.objects.filter(
+                date=date(2024, 1, 3), currency="GBP"
+            ).exists()
+        )
+
+    def test_ingest_unsupported_file(self):
+        """
+        Test files other than csv are rejected
+        """
+        with self.assertRaises(CommandError):
+            call_command("ingest_spot_history", "spot.parquet", stdout=StringIO())
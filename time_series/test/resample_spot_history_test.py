@@ -0,0 +1,81 @@
+from datetime import date, timedelta
+
+from django.test import TestCase
+
+from time_series.models import SpotHistoryData
+from time_series.utils import SpotHistoryDataHelper
+from time_series.utils.resample import MONTHLY, WEEKLY
+from time_series.utils.spot_rate_cache import spot_rate_cache
+
+
+class ResampleSpotHistoryTest(TestCase):
+    """
+    Test case for the server-side resampling of spot history.
+    It is designed to check weekly/monthly OHLC buckets and the max_points downsampling
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Clearing the spot rate cache
+        2. Creating sixty days of USD and EUR spot history starting on Monday 2024-01-01
+        """
+        spot_rate_cache.invalidate()
+        self.start_date = date(2024, 1, 1)
+        self.end_date = self.start_date + timedelta(days=59)
+        rows = []
+        for day in range(60):
+            current_date = self.start_date + timedelta(days=day)
+            rows.append(SpotHistoryData(date=current_date, currency="USD", rate=1))
+            rows.append(SpotHistoryData(date=current_date, currency="EUR", rate=day))
+        SpotHistoryData.objects.bulk_create(rows)
+
+    def helper(self, **kwargs):
+        return SpotHistoryDataHelper(
+            base_currency="USD",
+            foreign_currency="EUR",
+            date_from=self.start_date,
+            date_to=self.end_date,
+            **kwargs
+        )
+
+    def test_weekly_ohlc_buckets(self):
+        """
+        Test weekly buckets start on Monday and carry the open, high, low and last rate of the week
+        """
+        rates = self.helper(resolution=WEEKLY).resampled_spot_rates()
+
+        self.assertEqual(len(rates), 9)
+        self.assertEqual(rates[-1]["date"], self.start_date)
+        self.assertEqual(
+            (rates[-1]["open"], rates[-1]["high"], rates[-1]["low"], rates[-1]["rate"]),
+            (0.0, 6.0, 0.0, 6.0),
+        )
+        self.assertEqual(rates[0]["date"], date(2024, 2, 26))
+        self.assertEqual(rates[0]["rate"], 59.0)
+
+    def test_monthly_buckets_match_queried_path(self):
+        """
+        Test the cached and queried paths produce the same monthly buckets
+        """
+        cached = self.helper(resolution=MONTHLY).resampled_spot_rates()
+        queried = self.helper(
+            resolution=MONTHLY, use_cache=False
+        ).resampled_spot_rates()
+
+        self.assertEqual(cached, queried)
+        self.assertEqual(
+            [rate["date"] for rate in cached], [date(2024, 2, 1), date(2024, 1, 1)]
+        )
+        self.assertEqual(cached[1]["rate"], 30.0)
+
+    def test_max_points_keeps_endpoints(self):
+        """
+        Test max_points bounds the daily series while keeping the first and last dates
+        """
+        rates = self.helper(max_points=10).serializer_spot_history_date()
+
+        self.assertEqual(len(rates), 10)
+        self.assertEqual(rates[0]["date"], self.end_date)
+        self.assertEqual(rates[-1]["date"], self.start_date)
+        self.assertNotIn("open", rates[0])
@@ -0,0 +1,91 @@
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from api_gateway.models import TypeCurrency
+from authentication.factory import UserFactory
+from time_series.models import SpotHistoryData
+from time_series.utils.spot_rate_cache import spot_rate_cache
+
+
+class SpotHistoryMatrixTest(APITestCase):
+    """
+    Test case for the batch multi-pair spot history API view.
+    It is designed to check several pairs are returned aligned on one date axis from a single query
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Create a verified user instance
+        2. Creating five days of USD, EUR and GBP spot history where GBP misses the last day
+        """
+        spot_rate_cache.invalidate()
+        self.user = UserFactory()
+        self.start_date = date(2024, 1, 1)
+        rows = []
+        for day in range(5):
+            current_date = self.start_date + timedelta(days=day)
+            rows.append(SpotHistoryData(date=current_date, currency="USD", rate=1))
+            rows.append(SpotHistoryData(date=current_date, currency="EUR", rate=2))
+            if day != 4:
+                rows.append(SpotHistoryData(date=current_date, currency="GBP", rate=4))
+        SpotHistoryData.objects.bulk_create(rows)
+
+    def test_matrix_aligns_pairs(self):
+        """
+        Test the matrix has one row per date, one column per pair and null for unquoted dates
+        """
+        self.client.force_authenticate(user=self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse("spot-history-data-batch"),
+                {
+                    "pairs": [
+                        self._pair("USD", "EUR"),
+                        self._pair("EUR", "GBP"),
+                        self._pair("GBP", "USD"),
+                    ],
+                    "start_date": self.start_date,
+                    "end_date": self.start_date + timedelta(days=4),
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        matrix = response.data["spot_history_matrix"]
+        self.assertEqual(matrix["dates"][0], self.start_date + timedelta(days=4))
+        self.assertEqual(len(matrix["dates"]), 5)
+        self.assertEqual(matrix["rates"][0], [2.0, None, None])
+        self.assertEqual(matrix["rates"][-1], [2.0, 2.0, 0.25])
+
+        spot_history_queries = [
+            query for query in queries if '"spot_history_data"."rate"' in query["sql"]
+        ]
+        self.assertEqual(len(spot_history_queries), 1)
+
+    def test_matrix_requires_pairs(self):
+        """
+        Test an empty pair list is rejected
+        """
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            reverse("spot-history-data-batch"),
+            {"pairs": [], "start_date": self.start_date, "end_date": self.start_date},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def _pair(self, base_currency, foreign_currency):
+        return {
+            "base_currency": self._currency(base_currency),
+            "foreign_currency": self._currency(foreign_currency),
+        }
+
+    def _currency(self, code):
+        currency = TypeCurrency.objects.filter(code=code).first()
+        return {"code": currency.code, "country_name": currency.country_name}
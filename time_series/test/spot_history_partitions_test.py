@@ -0,0 +1,57 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from time_series.models import SpotHistoryData
+from time_series.utils.partitions import (
+    DEFAULT_PARTITION,
+    existing_partitions,
+    partition_name,
+)
+
+
+class SpotHistoryPartitionsTest(TestCase):
+    """
+    Test case for the yearly partitions of spot_history_data.
+    It is designed to check the maintenance command creates future partitions and moves their rows
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Creating a spot history row three years ahead that lands in the default partition
+        """
+        self.future_year = timezone.now().year + 3
+        SpotHistoryData.objects.create(
+            date=date(self.future_year, 6, 1), currency="EUR", rate=1
+        )
+
+    def test_create_partitions_moves_default_rows(self):
+        """
+        Test the command creates the missing partitions and moves rows out of the default partition
+        """
+        output = StringIO()
+        call_command("create_spot_history_partitions", years_ahead=3, stdout=output)
+
+        with connection.cursor() as cursor:
+            self.assertIn(partition_name(self.future_year), existing_partitions(cursor))
+            cursor.execute(f"SELECT count(*) FROM {DEFAULT_PARTITION}")
+            self.assertEqual(cursor.fetchone()[0], 0)
+            cursor.execute(f"SELECT count(*) FROM {partition_name(self.future_year)}")
+            self.assertEqual(cursor.fetchone()[0], 1)
+        self.assertEqual(
+            SpotHistoryData.objects.filter(date__year=self.future_year).count(), 1
+        )
+
+    def test_existing_partitions_are_skipped(self):
+        """
+        Test running the command twice leaves the existing partitions untouched
+        """
+        call_command("create_spot_history_partitions", stdout=StringIO())
+        output = StringIO()
+        call_command("create_spot_history_partitions", stdout=output)
+        self.assertIn("already exists", output.getvalue())
@@ -0,0 +1,86 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+
+from time_series.models import SpotHistoryData
+from time_series.utils import SpotHistoryDataHelper
+from time_series.utils.spot_rate_cache import spot_rate_cache
+
+
+class SpotRateCacheTest(TestCase):
+    """
+    Test case for the in-process spot rate cache behind SpotHistoryDataHelper.
+    It is designed to check the cached cross rates match the rates computed from the database rows
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Clearing the spot rate cache
+        2. Creating ten days of USD, EUR and GBP spot history where GBP misses one day
+        """
+        spot_rate_cache.invalidate()
+        self.start_date = date(2024, 1, 1)
+        rows = []
+        for day in range(10):
+            current_date = self.start_date + timedelta(days=day)
+            rows.append(SpotHistoryData(date=current_date, currency="USD", rate=1))
+            rows.append(
+                SpotHistoryData(
+                    date=current_date, currency="EUR", rate=Decimal("0.9") + day
+                )
+            )
+            if day != 5:
+                rows.append(
+                    SpotHistoryData(
+                        date=current_date, currency="GBP", rate=Decimal("0.8") + day
+                    )
+                )
+        SpotHistoryData.objects.bulk_create(rows)
+
+    def test_cached_rates_match_queried_rates(self):
+        """
+        Test the cached and queried helper paths return the same dates and rates
+        """
+        for base_currency, foreign_currency in [
+            ("USD", "EUR"),
+            ("EUR", "USD"),
+            ("EUR", "GBP"),
+        ]:
+            helper = SpotHistoryDataHelper(
+                base_currency=base_currency,
+                foreign_currency=foreign_currency,
+                date_from=self.start_date + timedelta(days=2),
+                date_to=self.start_date + timedelta(days=7),
+            )
+            cached = helper.cached_spot_rates()
+            queried = list(helper.queried_spot_rates())
+
+            self.assertEqual(
+                [rate["date"] for rate in cached], [rate["date"] for rate in queried]
+            )
+            for cached_rate, queried_rate in zip(cached, queried):
+                self.assertAlmostEqual(cached_rate["rate"], float(queried_rate["rate"]))
+
+    def test_cross_rates_skip_missing_dates(self):
+        """
+        Test a date quoted for only one of the currencies is left out of the window
+        """
+        dates, rates = spot_rate_cache.cross_rates(
+            "EUR", "GBP", self.start_date, self.start_date + timedelta(days=9)
+        )
+        self.assertEqual(len(dates), 9)
+        self.assertNotIn(self.start_date + timedelta(days=5), dates.tolist())
+
+    def test_saved_row_invalidates_currency(self):
+        """
+        Test saving a spot history row is reflected without clearing the cache manually
+        """
+        spot_rate_cache.history("EUR")
+        new_date = self.start_date + timedelta(days=10)
+        SpotHistoryData.objects.create(date=new_date, currency="EUR", rate=2)
+
+        dates, rates = spot_rate_cache.history("EUR")
+        self.assertEqual(dates[-1].tolist(), new_date)
+        self.assertEqual(rates[-1], 2.0)
@@ -0,0 +1,88 @@
+import json
+from datetime import date, timedelta
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from api_gateway.models import TypeCurrency
+from authentication.factory import UserFactory
+from time_series.models import SpotHistoryData
+from time_series.utils.spot_rate_cache import spot_rate_cache
+
+
+class StreamSpotHistoryTest(APITestCase):
+    """
+    Test case for the streaming NDJSON and CSV modes of the spot history API view.
+    It is designed to check the rows are streamed in the negotiated format
+    """
+
+    def setUp(self):
+        """
+        Set up the test environment by:
+        1. Create a verified user instance
+        2. Creating five days of USD and EUR spot history
+        """
+        spot_rate_cache.invalidate()
+        self.user = UserFactory()
+        self.start_date = date(2024, 1, 1)
+        rows = []
+        for day in range(5):
+            current_date = self.start_date + timedelta(days=day)
+            rows.append(SpotHistoryData(date=current_date, currency="USD", rate=1))
+            rows.append(SpotHistoryData(date=current_date, currency="EUR", rate=day))
+        SpotHistoryData.objects.bulk_create(rows)
+
+    def test_stream_ndjson_with_accept_header(self):
+        """
+        Test the Accept header selects newline delimited JSON, newest date first
+        """
+        response = self._post(HTTP_ACCEPT="application/x-ndjson")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertTrue(response["Content-Type"].startswith("application/x-ndjson"))
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(json.loads(lines[0]), {"date": "2024-01-05", "rate": 4.0})
+
+    def test_stream_csv_with_format_param(self):
+        """
+        Test ?format=csv streams a header row followed by one row per date
+        """
+        response = self._post(query="?format=csv")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], "date,rate")
+        self.assertEqual(lines[-1], "2024-01-01,0.0")
+        self.assertEqual(len(lines), 6)
+
+    def test_json_response_is_unchanged(self):
+        """
+        Test requests without a streaming format still get the regular JSON payload
+        """
+        response = self._post()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.streaming)
+        self.assertEqual(len(response.data["spot_history_data"]), 5)
+
+    def _post(self, query="", **headers):
+        self.client.force_authenticate(user=self.user)
+        return self.client.post(
+            reverse("spot-history-data") + query,
+            {
+                "base_currency": self._currency("USD"),
+                "foreign_currency": self._currency("EUR"),
+                "start_date": self.start_date,
+                "end_date": self.start_date + timedelta(days=4),
+                "is_base_sold": False,
+            },
+            format="json",
+            **headers,
+        )
+
+    def _currency(self, code):
+        currency = TypeCurrency.objects.filter(code=code).first()
+        return {"code": currency.code, "country_name": currency.country_name}
@@ -9,4 +9,9 @@ urlpatterns = [
         SpotHistoryDataAPIView.as_view(),
         name="spot-history-data",
     ),
+    path(
+        "spot-history/batch/",
+        SpotHistoryMatrixAPIView.as_view(),
+        name="spot-history-data-batch",
+    ),
 ]
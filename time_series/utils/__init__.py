@@ -1 +1,5 @@
-from .serialize_spot_history_data import SpotHistoryDataHelper
+from .serialize_spot_history_data import (
+    SpotHistoryDataHelper,
+    SpotHistoryMatrixHelper,
+    spot_history_window,
+)
@@ -0,0 +1,105 @@
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+WEEKMASK = "Mon Tue Wed Thu Fri"
+
+
+class BusinessCalendar:
+    """
+    Vectorized business day calendar over numpy.busdaycalendar.
+
+    Every method accepts a single date or an array-like of dates and returns a
+    scalar or an array accordingly, so whole schedules are rolled or counted in one call.
+    """
+
+    def __init__(self, holidays=(), weekmask: str = WEEKMASK):
+        self.holidays = np.unique(np.asarray(list(holidays), dtype="datetime64[D]"))
+        self.calendar = np.busdaycalendar(weekmask=weekmask, holidays=self.holidays)
+
+    def is_business_day(self, dates):
+        return _to_python(np.is_busday(_to_days(dates), busdaycal=self.calendar))
+
+    def count(self, start_dates, end_dates):
+        """
+        Number of business days between start and end dates, both inclusive
+        """
+        counts = np.busday_count(
+            _to_days(start_dates),
+            _to_days(end_dates) + np.timedelta64(1, "D"),
+            busdaycal=self.calendar,
+        )
+        return _to_python(np.maximum(counts, 0))
+
+    def offset(self, dates, days, roll: str = "following"):
+        """
+        Moves dates by a number of business days after rolling non business days
+        with the given convention (following, preceding, modifiedfollowing, ...)
+        """
+        return _to_python(
+            np.busday_offset(_to_days(dates), days, roll=roll, busdaycal=self.calendar)
+        )
+
+    def next_business_day(self, dates):
+        """
+        First business day strictly after each date
+        """
+        return _to_python(
+            np.busday_offset(
+                _to_days(dates) + np.timedelta64(1, "D"),
+                0,
+                roll="following",
+                busdaycal=self.calendar,
+            )
+        )
+
+    def business_days(self, start_date: date, end_date: date) -> np.ndarray:
+        """
+        datetime64[D] array of the business days between start and end date, both inclusive
+        """
+        days = np.arange(
+            np.datetime64(start_date, "D"),
+            np.datetime64(end_date, "D") + np.timedelta64(1, "D"),
+        )
+        return days[np.is_busday(days, busdaycal=self.calendar)]
+
+
+def _to_days(dates):
+    return np.asarray(dates, dtype="datetime64[D]")
+
+
+def _to_python(values: np.ndarray):
+    # Scalars are returned as date/bool/int like the rest of the code base expects
+    return values.item() if values.ndim == 0 else values
+
+
+@lru_cache(maxsize=None)
+def _holidays(currency: str) -> tuple:
+    from time_series.models import CurrencyHoliday
+
+    return tuple(
+        CurrencyHoliday.objects.filter(currency=currency).values_list("date", flat=True)
+    )
+
+
+@lru_cache(maxsize=None)
+def _calendar(currencies: tuple) -> BusinessCalendar:
+    holidays = [day for currency in currencies for day in _holidays(currency)]
+    return BusinessCalendar(holidays)
+
+
+def calendar_for(*currencies: str) -> BusinessCalendar:
+    """
+    Returns the joint business day calendar of the currencies: a day is a business day
+    only if it is a weekday and not a holiday of any of them. Holidays are loaded once per process.
+    """
+    return _calendar(tuple(sorted(set(currencies))))
+
+
+def invalidate_business_calendars(sender=None, **kwargs):
+    """
+    Signal receiver dropping the loaded holiday sets when a holiday is saved or deleted
+    """
+    _holidays.cache_clear()
+    _calendar.cache_clear()
@@ -0,0 +1,156 @@
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+from .business_calendar import calendar_for
+from .spot_rate_cache import spot_rate_cache
+
+_forward_history_generation = 0
+
+
+def add_months(dates: np.ndarray, months: int) -> np.ndarray:
+    """
+    Adds a number of months to datetime64[D] dates, clipping to the last day of shorter months
+    """
+    start_months = dates.astype("datetime64[M]")
+    day_of_month = dates - start_months.astype("datetime64[D]")
+    target_months = start_months + np.timedelta64(months, "M")
+    month_length = (target_months + np.timedelta64(1, "M")).astype(
+        "datetime64[D]"
+    ) - target_months.astype("datetime64[D]")
+    return target_months.astype("datetime64[D]") + np.minimum(
+        day_of_month, month_length - np.timedelta64(1, "D")
+    )
+
+
+def forward_efficiency(
+    base_currency: str, foreign_currency: str, duration: int
+) -> dict:
+    """
+    Compares every captured forward quote of the pair for a `duration` months tenor with the
+    spot rate realized at its maturity. Results are cached per (pair, duration) until the spot or
+    forward history changes, and at most for the current day.
+    """
+    return _cached_forward_efficiency(
+        base_currency,
+        foreign_currency,
+        duration,
+        date.today(),
+        spot_rate_cache.current_generation(),
+        _forward_history_generation,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _cached_forward_efficiency(
+    base_currency, foreign_currency, duration, today, spot_generation, generation
+):
+    dates, spot_rates, forward_rates = forward_history(
+        base_currency, foreign_currency, duration
+    )
+    return compute_forward_efficiency(
+        base_currency, foreign_currency, duration, dates, spot_rates, forward_rates
+    )
+
+
+def forward_history(base_currency: str, foreign_currency: str, duration: int):
+    """
+    Returns the (dates, spot rates, forward rates) arrays of the captured quotes, ascending
+    """
+    from time_series.models import ForwardRateHistoryData
+
+    rows = list(
+        ForwardRateHistoryData.objects.filter(
+            base_currency=base_currency,
+            foreign_currency=foreign_currency,
+            duration=duration,
+        )
+        .order_by("date")
+        .values_list("date", "spot_rate", "forward_rate")
+    )
+    return (
+        np.array([row[0] for row in rows], dtype="datetime64[D]"),
+        np.array([row[1] for row in rows], dtype=np.float64),
+        np.array([row[2] for row in rows], dtype=np.float64),
+    )
+
+
+def compute_forward_efficiency(
+    base_currency: str,
+    foreign_currency: str,
+    duration: int,
+    dates: np.ndarray,
+    spot_rates: np.ndarray,
+    forward_rates: np.ndarray,
+) -> dict:
+    """
+    For every start date the maturity is rolled to the next business day of both currencies and
+    matched with the last spot quote on or before it. Quotes not matured yet are left out.
+    - forward_points: forward rate minus the spot rate at the start date
+    - realized_move: spot rate at maturity minus the spot rate at the start date
+    - difference_percent: spot rate at maturity against the forward rate, in percent
+    """
+    result = {
+        "observations": 0,
+        "mean_difference_percent": None,
+        "above_forward_ratio": None,
+        "series": [],
+    }
+    if not len(dates):
+        return result
+
+    maturities = calendar_for(base_currency, foreign_currency).offset(
+        add_months(dates, duration), 0
+    )
+    maturities = np.atleast_1d(maturities)
+    spot_dates, realized_rates = spot_rate_cache.cross_rates(
+        base_currency, foreign_currency, dates[0], maturities[-1]
+    )
+    if not len(spot_dates):
+        return result
+
+    index = np.searchsorted(spot_dates, maturities, side="right") - 1
+    matured = (index >= 0) & (maturities <= spot_dates[-1])
+    if not matured.any():
+        return result
+
+    realized = realized_rates[index[matured]]
+    forwards = forward_rates[matured]
+    spots = spot_rates[matured]
+    difference_percent = (realized / forwards - 1) * 100
+
+    result.update(
+        observations=int(matured.sum()),
+        mean_difference_percent=float(difference_percent.mean()),
+        above_forward_ratio=float((realized > forwards).mean()),
+        series=[
+            {
+                "date": start,
+                "maturity": maturity,
+                "spot_rate": spot,
+                "forward_rate": forward,
+                "realized_rate": realized_rate,
+                "forward_points": forward - spot,
+                "realized_move": realized_rate - spot,
+                "difference_percent": difference,
+            }
+            for start, maturity, spot, forward, realized_rate, difference in zip(
+                dates[matured].tolist(),
+                maturities[matured].tolist(),
+                spots.tolist(),
+                forwards.tolist(),
+                realized.tolist(),
+                difference_percent.tolist(),
+            )
+        ],
+    )
+    return result
+
+
+def invalidate_forward_efficiency(sender=None, **kwargs):
+    """
+    Signal receiver dropping the cached efficiency results when forward history changes
+    """
+    global _forward_history_generation
+    _forward_history_generation += 1
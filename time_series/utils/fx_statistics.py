@@ -0,0 +1,67 @@
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+from .spot_rate_cache import spot_rate_cache
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def spot_rate_statistics(
+    base_currency: str, foreign_currency: str, duration: int, as_of: date
+) -> dict:
+    """
+    Movement statistics of a pair over the `duration` months ending on `as_of`.
+    Results are memoized per (pair, duration, as-of date) until the spot rate cache is invalidated.
+    """
+    return dict(
+        _memoized_statistics(
+            base_currency,
+            foreign_currency,
+            duration,
+            as_of,
+            spot_rate_cache.current_generation(),
+        )
+    )
+
+
+@lru_cache(maxsize=4096)
+def _memoized_statistics(base_currency, foreign_currency, duration, as_of, generation):
+    _, rates = spot_rate_cache.cross_rates(
+        base_currency, foreign_currency, as_of - relativedelta(months=duration), as_of
+    )
+    return compute_statistics(rates)
+
+
+def compute_statistics(rates: np.ndarray) -> dict:
+    """
+    Computes from an ascending rate series:
+    - percent_change: change between the first and last rate, in percent
+    - annualized_volatility: standard deviation of daily log returns scaled to a year, in percent
+    - max_drawdown: largest fall from a running peak, in percent (zero or negative)
+    - z_score: distance of the last rate from the window mean in standard deviations
+    """
+    statistics = {
+        "observations": len(rates),
+        "percent_change": None,
+        "annualized_volatility": None,
+        "max_drawdown": None,
+        "z_score": None,
+    }
+    if len(rates) < 2:
+        return statistics
+
+    returns = np.diff(np.log(rates))
+    deviation = rates.std(ddof=1)
+    statistics.update(
+        percent_change=float((rates[-1] / rates[0] - 1) * 100),
+        max_drawdown=float((rates / np.maximum.accumulate(rates) - 1).min() * 100),
+        z_score=float((rates[-1] - rates.mean()) / deviation) if deviation else 0.0,
+    )
+    if len(returns) > 1:
+        statistics["annualized_volatility"] = float(
+            returns.std(ddof=1) * np.sqrt(TRADING_DAYS_PER_YEAR) * 100
+        )
+    return statistics
@@ -0,0 +1,56 @@
+from datetime import date
+
+PARTITIONED_TABLE = "spot_history_data"
+DEFAULT_PARTITION = "spot_history_data_default"
+
+
+def partition_name(year: int) -> str:
+    return f"{PARTITIONED_TABLE}_y{year}"
+
+
+def existing_partitions(cursor) -> set[str]:
+    """
+    Returns the names of the partitions attached to spot_history_data
+    """
+    cursor.execute(
+        """
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = %s
+        """,
+        [PARTITIONED_TABLE],
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+
+def create_year_partition(cursor, year: int) -> bool:
+    """
+    Creates and attaches the partition holding the dates of a year.
+    Rows of that year that already landed in the default partition are moved into it first,
+    otherwise attaching would fail. Returns False if the partition already exists.
+    """
+    name = partition_name(year)
+    if name in existing_partitions(cursor):
+        return False
+
+    bounds = [date(year, 1, 1), date(year + 1, 1, 1)]
+    cursor.execute(f"CREATE TABLE {name} (LIKE {PARTITIONED_TABLE} INCLUDING DEFAULTS)")
+    cursor.execute(
+        f"""
+        WITH moved AS (
+            DELETE FROM {DEFAULT_PARTITION}
+            WHERE date >= %s AND date < %s
+            RETURNING *
+        )
+        INSERT INTO {name} SELECT * FROM moved
+        """,
+        bounds,
+    )
+    cursor.execute(
+        f"ALTER TABLE {PARTITIONED_TABLE} ATTACH PARTITION {name} "
+        "FOR VALUES FROM (%s) TO (%s)",
+        bounds,
+    )
+    return True
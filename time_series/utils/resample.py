@@ -0,0 +1,80 @@
+import numpy as np
+
+DAILY = "daily"
+WEEKLY = "weekly"
+MONTHLY = "monthly"
+RESOLUTION_CHOICES = [DAILY, WEEKLY, MONTHLY]
+
+# 1970-01-01 was a Thursday, shift day numbers so weeks start on Monday like date_trunc
+_EPOCH_WEEKDAY = 3
+
+
+def bucket_starts(dates: np.ndarray, resolution: str) -> np.ndarray:
+    """
+    Truncates datetime64[D] dates to the first day of their week (Monday) or month
+    """
+    if resolution == WEEKLY:
+        days = dates.astype(np.int64)
+        return (days - (days + _EPOCH_WEEKDAY) % 7).astype("datetime64[D]")
+    if resolution == MONTHLY:
+        return dates.astype("datetime64[M]").astype("datetime64[D]")
+    return dates
+
+
+def resample_ohlc(dates: np.ndarray, rates: np.ndarray, resolution: str) -> dict:
+    """
+    Aggregates an ascending daily series into open/high/low/close values per bucket.
+    Buckets are labelled with their first day and the close is the last rate of the bucket.
+    """
+    if resolution == DAILY or len(dates) == 0:
+        return {
+            "date": dates,
+            "open": rates,
+            "high": rates,
+            "low": rates,
+            "close": rates,
+        }
+
+    buckets, starts = np.unique(bucket_starts(dates, resolution), return_index=True)
+    ends = np.append(starts[1:], len(rates)) - 1
+    return {
+        "date": buckets,
+        "open": rates[starts],
+        "high": np.maximum.reduceat(rates, starts),
+        "low": np.minimum.reduceat(rates, starts),
+        "close": rates[ends],
+    }
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    Returns the indices of at most `threshold` points that best preserve the shape of the series,
+    always keeping the first and last point.
+    """
+    size = len(x)
+    if threshold >= size or threshold < 3:
+        return np.arange(size)
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    edges = np.linspace(1, size - 1, threshold - 1).astype(np.int64)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = size - 1
+
+    selected = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        # Average of the next bucket, or the last point for the final bucket
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else size
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+
+        areas = np.abs(
+            (x[selected] - next_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (next_y - y[selected])
+        )
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+    return indices
@@ -1,66 +1,200 @@
-from django.db.models import Q
+from functools import lru_cache
+
+import numpy as np
+from django.db.models import F, FloatField, Max, Q, Value
+from django.db.models.functions import Cast
+
+from .resample import DAILY, lttb_indices, resample_ohlc
+from .spot_rate_cache import spot_rate_cache
 
 
 class SpotHistoryDataHelper:
     def __init__(
-        self, base_currency, foreign_currency, date_from, date_to, *args, **kwargs
+        self,
+        base_currency,
+        foreign_currency,
+        date_from,
+        date_to,
+        *args,
+        use_cache=True,
+        resolution=DAILY,
+        max_points=None,
+        **kwargs
     ):
         self.base_currency = base_currency
         self.foreign_currency = foreign_currency
         self.date_from = date_from
         self.date_to = date_to
+        self.use_cache = use_cache
+        self.resolution = resolution
+        self.max_points = max_points
 
     def serializer_spot_history_date(self):
-        from time_series.models import SpotHistoryData
         from time_series.serializers import SpotHistoryDataSerializer
 
-        spot_history_data = SpotHistoryData.objects.filter(
-            Q(currency=self.base_currency) | Q(currency=self.foreign_currency),
-            date__range=[self.date_from, self.date_to],
-        ).order_by("-date")
-
-        combined_data = self.combine_data(list(spot_history_data))
-        rates = []
-        for data in combined_data:
-            rates.append({"date": data["date"], "rate": self.calculate_spot_rate(data)})
-        return SpotHistoryDataSerializer(rates, many=True).data
-
-    def combine_data(self, queryset):
-        # Combine the data into one row based on date
-        combined_data = []
-        temp_data = {}
-        for item in queryset:
-            if item.date not in temp_data:
-                # Initialize the data structure for this date
-                temp_data[item.date] = {
-                    "date": item.date,
-                    "base_currency": None,
-                    "base_rate": None,
-                    "foreign_currency": None,
-                    "foreign_rate": None,
-                }
-
-            # Assign base or foreign currency and rate
-            if item.currency == self.base_currency:
-                temp_data[item.date]["base_currency"] = item.currency
-                temp_data[item.date]["base_rate"] = item.rate
-            else:
-                temp_data[item.date]["foreign_currency"] = item.currency
-                temp_data[item.date]["foreign_rate"] = item.rate
-
-            # Check if both base and foreign currency are filled for the date
-            if (
-                temp_data[item.date]["base_currency"]
-                and temp_data[item.date]["foreign_currency"]
-            ):
-                combined_data.append(temp_data.pop(item.date))
-        return combined_data
-
-    def calculate_spot_rate(self, data):
+        return SpotHistoryDataSerializer(self.spot_rates(), many=True).data
+
+    def spot_rates(self):
+        """
+        Returns the rows of the window without serializing them, newest date first.
+        Daily windows bypassing the cache are streamed from a server-side cursor.
+        """
+        if self.resolution != DAILY or self.max_points:
+            return self.resampled_spot_rates()
+        elif self.use_cache:
+            return self.cached_spot_rates()
+        return self.queried_spot_rates()
+
+    def cached_spot_rates(self):
+        # Served from the in-process spot rate arrays, newest date first
+        dates, rates = spot_rate_cache.cross_rates(
+            self.base_currency, self.foreign_currency, self.date_from, self.date_to
+        )
+        return [
+            {"date": day, "rate": rate}
+            for day, rate in zip(dates[::-1].tolist(), rates[::-1].tolist())
+        ]
+
+    def resampled_spot_rates(self):
+        """
+        Aggregates the window into open/high/low/close buckets for the requested resolution
+        and downsamples the closes with LTTB when there are more than max_points buckets.
+        The close is returned as the bucket rate, newest bucket first.
+        """
+        buckets = self.resampled_buckets()
+        columns = [buckets[key][::-1].tolist() for key in buckets]
+        if self.resolution == DAILY:
+            return [
+                {"date": day, "rate": close} for day, _, _, _, close in zip(*columns)
+            ]
+        return [
+            {"date": day, "rate": close, "open": opening, "high": high, "low": low}
+            for day, opening, high, low, close in zip(*columns)
+        ]
+
+    def resampled_buckets(self):
+        """
+        Returns the date/open/high/low/close arrays of the resampled window, ascending
+        """
+        dates, rates = self.spot_rate_arrays()
+        buckets = resample_ohlc(dates, rates, self.resolution)
+        if self.max_points:
+            keep = lttb_indices(
+                buckets["date"].astype(np.int64), buckets["close"], self.max_points
+            )
+            buckets = {key: values[keep] for key, values in buckets.items()}
+        return buckets
+
+    def spot_rate_series(self):
+        """
+        Returns the (dates, rates) arrays of the window after resampling, ascending.
+        Used by encoders that write the columns directly instead of one dict per date.
+        """
+        if self.resolution != DAILY or self.max_points:
+            buckets = self.resampled_buckets()
+            return buckets["date"], buckets["close"]
+        return self.spot_rate_arrays()
+
+    def spot_rate_arrays(self):
+        """
+        Returns the (dates, rates) arrays of the window sorted by ascending date
+        """
+        if self.use_cache:
+            return spot_rate_cache.cross_rates(
+                self.base_currency, self.foreign_currency, self.date_from, self.date_to
+            )
+        rows = list(self.spot_rate_queryset().reverse())
+        dates = np.array([row[0] for row in rows], dtype="datetime64[D]")
+        rates = np.array([row[1] for row in rows], dtype=np.float64)
+        return dates, rates
+
+    def queried_spot_rates(self):
+        # Streamed from Postgres, newest date first
+        return (
+            {"date": day, "rate": rate}
+            for day, rate in self.spot_rate_queryset().iterator()
+        )
+
+    def spot_rate_queryset(self):
+        """
+        Returns (date, rate) pairs for the window with both currencies pivoted
+        onto one row per date and the cross rate triangulated through USD in SQL
+        """
+        from time_series.models import SpotHistoryData
+
+        queryset = (
+            SpotHistoryData.objects.filter(
+                currency__in=[self.base_currency, self.foreign_currency],
+                date__range=[self.date_from, self.date_to],
+            )
+            .values("date")
+            .annotate(
+                base_rate=Max("rate", filter=Q(currency=self.base_currency)),
+                foreign_rate=Max("rate", filter=Q(currency=self.foreign_currency)),
+            )
+            .filter(base_rate__isnull=False, foreign_rate__isnull=False)
+        )
+        return (
+            queryset.annotate(rate=Cast(self.spot_rate_expression(), FloatField()))
+            .order_by("-date")
+            .values_list("date", "rate")
+        )
+
+    def spot_rate_expression(self):
         if self.base_currency == "USD":
-            spot_rate = data["foreign_rate"]
+            return F("foreign_rate")
         elif self.foreign_currency == "USD":
-            spot_rate = 1 / data["base_rate"]
-        else:
-            spot_rate = data["foreign_rate"] / data["base_rate"]
-        return spot_rate
+            return Value(1) / F("base_rate")
+        return F("foreign_rate") / F("base_rate")
+
+
+class SpotHistoryMatrixHelper:
+    """
+    Spot history of several pairs aligned on one date axis, with the history of
+    every currency involved loaded in a single query
+    """
+
+    def __init__(self, pairs, date_from, date_to):
+        self.pairs = pairs
+        self.date_from = date_from
+        self.date_to = date_to
+
+    def spot_history_matrix(self):
+        # Newest date first like the single pair series, missing quotes as None
+        dates, matrix = spot_rate_cache.cross_rate_matrix(
+            self.pairs, self.date_from, self.date_to
+        )
+        matrix = matrix[::-1]
+        rates = np.where(np.isnan(matrix), None, matrix).tolist()
+        return {"dates": dates[::-1].tolist(), "rates": rates}
+
+
+def spot_history_window(base_currency, foreign_currency, date_from, date_to):
+    """
+    Serialized spot history of a window, memoized until the spot rate cache is invalidated.
+    Used where the same window is embedded in many responses, e.g. every simulation of a pair
+    starting on the same date.
+    """
+    return list(
+        _spot_history_window(
+            base_currency,
+            foreign_currency,
+            date_from,
+            date_to,
+            spot_rate_cache.current_generation(),
+        )
+    )
+
+
+@lru_cache(maxsize=1024)
+def _spot_history_window(
+    base_currency, foreign_currency, date_from, date_to, generation
+):
+    return tuple(
+        SpotHistoryDataHelper(
+            base_currency=base_currency,
+            foreign_currency=foreign_currency,
+            date_from=date_from,
+            date_to=date_to,
+        ).serializer_spot_history_date()
+    )
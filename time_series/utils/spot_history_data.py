@@ -1,8 +1,10 @@
 import os
-from datetime import date, timedelta
+from datetime import date
 from django.db import connection
 from django.db.utils import OperationalError, ProgrammingError
 from api_gateway.settings.config import DJANGO_DEBUG, DJANGO_TESTING
+from time_series.utils.business_calendar import calendar_for
+from time_series.utils.spot_rate_cache import spot_rate_cache
 
 
 def backfill_spot_history_data(sender, **kwargs):
@@ -17,58 +19,36 @@ def backfill_spot_history_data(sender, **kwargs):
                 "SELECT MAX(date), AVG(rate), currency FROM spot_history_data GROUP BY currency"
             )
             rows_inserted = 0
-            for item in cursor.fetchall():
-                if count_work_days(item[0], date.today()) > 0:
-                    sql = ""
-                    next_day = get_next_work_day(item[0])
-                    while next_day <= date.today():
-                        sql = (
-                            sql
-                            + f"INSERT INTO public.spot_history_data(date, currency, rate) VALUES ('{next_day}', '{item[2]}', {item[1]});"
-                        )
-                        next_day = get_next_work_day(next_day)
-                        rows_inserted += 1
-                    cursor.execute(sql)
+            for last_date, average_rate, currency in cursor.fetchall():
+                calendar = calendar_for(currency)
+                missing_days = calendar.business_days(
+                    calendar.next_business_day(last_date), date.today()
+                )
+                if len(missing_days):
+                    cursor.execute(
+                        "INSERT INTO public.spot_history_data(date, currency, rate) "
+                        "SELECT unnest(%s::date[]), %s, %s",
+                        [missing_days.tolist(), currency, average_rate],
+                    )
+                    rows_inserted += len(missing_days)
             print(f"Rows inserted {rows_inserted}")
+            if rows_inserted:
+                spot_rate_cache.invalidate()
 
     except (OperationalError, ProgrammingError) as e:
         print("Table does not exist or another error: ", e)
 
 
-def count_work_days(start_date: date, end_date: date):
-    WEEKDAY_FRIDAY = 4
+def count_work_days(start_date: date, end_date: date, *currencies: str):
     """
-    Math function to get workdays between 2 dates.
-    Can be used only as fallback as it doesn't know
-    about specific country holidays or extra working days.
+    Number of business days between 2 dates, both inclusive,
+    skipping the holidays of the given currencies.
     """
-    # if the start date is on a weekend, forward the date to next Monday
+    return calendar_for(*currencies).count(start_date, end_date)
 
-    if start_date.weekday() > WEEKDAY_FRIDAY:
-        start_date = start_date + timedelta(days=7 - start_date.weekday())
 
-    # if the end date is on a weekend, rewind the date to the previous Friday
-    if end_date.weekday() > WEEKDAY_FRIDAY:
-        end_date = end_date - timedelta(days=end_date.weekday() - WEEKDAY_FRIDAY)
-
-    if start_date > end_date:
-        return 0
-    # that makes the difference easy, no remainders etc
-    diff_days = (end_date - start_date).days + 1
-    weeks = int(diff_days / 7)
-
-    remainder = end_date.weekday() - start_date.weekday() + 1
-
-    if remainder != 0 and end_date.weekday() < start_date.weekday():
-        remainder = 5 + remainder
-
-    return weeks * 5 + remainder
-
-
-def get_next_work_day(date: date):
-    if date.weekday() == 4:
-        return date + timedelta(days=3)
-    elif date.weekday == 5:
-        return date + timedelta(days=2)
-    else:
-        return date + timedelta(days=1)
+def get_next_work_day(date: date, *currencies: str):
+    """
+    First business day after the date, skipping the holidays of the given currencies
+    """
+    return calendar_for(*currencies).next_business_day(date)
@@ -0,0 +1,180 @@
+import threading
+from datetime import date
+from time import monotonic
+
+import numpy as np
+
+from api_gateway.settings.config import SPOT_RATE_CACHE_TTL
+
+
+class SpotRateCache:
+    """
+    Per-process columnar cache of spot_history_data.
+
+    Each currency's history is held as two sorted arrays (dates as datetime64[D]
+    and rates as float64) that are filled lazily on first access. Cross-rate
+    windows are then answered with array slicing and vectorized division
+    instead of a database round trip per request.
+
+    The cache is dropped when rows are saved or deleted in this process and,
+    at most every `ttl` seconds, when the latest ingested date in the table
+    changes (e.g. after a backfill or bulk ingestion in another process).
+    """
+
+    def __init__(self, ttl: int = SPOT_RATE_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._history = {}
+        self._latest_date = None
+        self._checked_at = None
+        # Bumped whenever cached history is dropped so derived results can be memoized against it
+        self.generation = 0
+
+    def invalidate(self, currency: str | None = None):
+        """
+        Drop the cached history for a currency, or for every currency if none is given
+        """
+        with self._lock:
+            self.generation += 1
+            if currency is None:
+                self._history.clear()
+                self._checked_at = None
+            else:
+                self._history.pop(currency, None)
+
+    def current_generation(self) -> int:
+        """
+        Returns the generation after checking for newly ingested dates, for use in memoization keys
+        """
+        self._revalidate()
+        return self.generation
+
+    def history(self, currency: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the (dates, rates) arrays for a currency sorted by ascending date
+        """
+        self._revalidate()
+        with self._lock:
+            if currency not in self._history:
+                self._history[currency] = self._load(currency)
+            return self._history[currency]
+
+    def prefetch(self, currencies):
+        """
+        Loads the history of every currency not cached yet with a single query
+        """
+        self._revalidate()
+        with self._lock:
+            missing = sorted(set(currencies) - set(self._history))
+            if missing:
+                self._history.update(self._load_many(missing))
+
+    def cross_rate_matrix(
+        self, pairs: list[tuple[str, str]], date_from: date, date_to: date
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the cross rates of several (base, foreign) pairs aligned on a shared date axis:
+        an ascending datetime64[D] array of every date quoted for at least one pair
+        and a float64 matrix with one row per date and one column per pair, NaN where a pair is not quoted.
+        """
+        self.prefetch({currency for pair in pairs for currency in pair})
+        series = [
+            self.cross_rates(base, foreign, date_from, date_to)
+            for base, foreign in pairs
+        ]
+        dates = np.unique(
+            np.concatenate(
+                [pair_dates for pair_dates, _ in series]
+                or [np.array([], dtype="datetime64[D]")]
+            )
+        )
+        matrix = np.full((len(dates), len(pairs)), np.nan)
+        for column, (pair_dates, rates) in enumerate(series):
+            matrix[np.searchsorted(dates, pair_dates), column] = rates
+        return dates, matrix
+
+    def cross_rates(
+        self,
+        base_currency: str,
+        foreign_currency: str,
+        date_from: date,
+        date_to: date,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the (dates, rates) arrays of the base/foreign cross rate between
+        date_from and date_to (inclusive) sorted by ascending date.
+        Rates are triangulated through USD and only dates quoted for both currencies are returned.
+        """
+        base_dates, base_rates = self._window(base_currency, date_from, date_to)
+        foreign_dates, foreign_rates = self._window(
+            foreign_currency, date_from, date_to
+        )
+        dates, base_index, foreign_index = np.intersect1d(
+            base_dates, foreign_dates, assume_unique=True, return_indices=True
+        )
+
+        if base_currency == "USD":
+            rates = foreign_rates[foreign_index]
+        elif foreign_currency == "USD":
+            rates = 1 / base_rates[base_index]
+        else:
+            rates = foreign_rates[foreign_index] / base_rates[base_index]
+        return dates, rates
+
+    def _window(
+        self, currency: str, date_from: date, date_to: date
+    ) -> tuple[np.ndarray, np.ndarray]:
+        dates, rates = self.history(currency)
+        start = np.searchsorted(dates, np.datetime64(date_from, "D"), side="left")
+        end = np.searchsorted(dates, np.datetime64(date_to, "D"), side="right")
+        return dates[start:end], rates[start:end]
+
+    def _load(self, currency: str) -> tuple[np.ndarray, np.ndarray]:
+        return self._load_many([currency])[currency]
+
+    def _load_many(self, currencies: list[str]) -> dict:
+        from time_series.models import SpotHistoryData
+
+        rows = list(
+            SpotHistoryData.objects.filter(currency__in=currencies)
+            .order_by("currency", "date")
+            .values_list("currency", "date", "rate")
+        )
+        codes = np.array([row[0] for row in rows], dtype="U3")
+        dates = np.array([row[1] for row in rows], dtype="datetime64[D]")
+        rates = np.array([row[2] for row in rows], dtype=np.float64)
+
+        history = {}
+        for currency in currencies:
+            rows_of_currency = codes == currency
+            history[currency] = dates[rows_of_currency], rates[rows_of_currency]
+        return history
+
+    def _revalidate(self):
+        """
+        Drops the whole cache if new dates were ingested since it was filled
+        """
+        now = monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.ttl:
+            return
+
+        from django.db.models import Max
+        from time_series.models import SpotHistoryData
+
+        latest_date = SpotHistoryData.objects.aggregate(latest=Max("date"))["latest"]
+        with self._lock:
+            if latest_date != self._latest_date:
+                self._history.clear()
+                self.generation += 1
+                self._latest_date = latest_date
+            self._checked_at = now
+
+
+spot_rate_cache = SpotRateCache()
+
+
+def invalidate_spot_rate_cache(sender, instance=None, **kwargs):
+    """
+    Signal receiver dropping the cached history of the saved or deleted row's currency
+    """
+    spot_rate_cache.invalidate(instance.currency if instance is not None else None)
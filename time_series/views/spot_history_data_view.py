@@ -1,10 +1,23 @@
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils.decorators import method_decorator
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 from rest_framework import status
-from time_series.serializers import SpotHistoryDataRequestSerializer
+
+from api_gateway.utils.renderers import (
+    ColumnarRenderer,
+    CSVRenderer,
+    NDJSONRenderer,
+    StreamingRenderer,
+)
+from time_series.serializers import (
+    SpotHistoryDataRequestSerializer,
+    SpotHistoryDataSerializer,
+    SpotHistoryMatrixRequestSerializer,
+)
 
 
 @method_decorator(
@@ -16,7 +29,64 @@ from time_series.serializers import SpotHistoryDataRequestSerializer
     "post",
 )
 class SpotHistoryDataAPIView(APIView):
+    renderer_classes = [
+        *api_settings.DEFAULT_RENDERER_CLASSES,
+        NDJSONRenderer,
+        CSVRenderer,
+        ColumnarRenderer,
+    ]
+
     def post(self, request):
         serializer = SpotHistoryDataRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        if isinstance(request.accepted_renderer, StreamingRenderer):
+            return self.stream(serializer, request.accepted_renderer)
+        if isinstance(request.accepted_renderer, ColumnarRenderer):
+            return self.columnar(serializer, request.accepted_renderer)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    def stream(self, serializer, renderer):
+        """
+        Streams the spot history rows one at a time (Accept: application/x-ndjson or text/csv,
+        or ?format=ndjson|csv) straight from a server-side cursor instead of the in-memory cache
+        """
+        helper = serializer.get_spot_history_helper(
+            serializer.validated_data, use_cache=False
+        )
+        rows = (
+            SpotHistoryDataSerializer().to_representation(row)
+            for row in helper.spot_rates()
+        )
+        return StreamingHttpResponse(
+            renderer.stream(rows),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+
+    def columnar(self, serializer, renderer):
+        """
+        Returns the spot history as packed date and rate columns
+        (Accept: application/vnd.timeseries.columnar or ?format=columnar)
+        written straight from the cached arrays
+        """
+        helper = serializer.get_spot_history_helper(serializer.validated_data)
+        dates, rates = helper.spot_rate_series()
+        return HttpResponse(
+            renderer.render_arrays(dates, rates), content_type=renderer.media_type
+        )
+
+
+@method_decorator(
+    swagger_auto_schema(
+        tags=["Time Series"],
+        responses={200: SpotHistoryMatrixRequestSerializer()},
+        request_body=SpotHistoryMatrixRequestSerializer,
+    ),
+    "post",
+)
+class SpotHistoryMatrixAPIView(APIView):
+    """API view returning the spot history of several pairs aligned on one date axis"""
+
+    def post(self, request):
+        serializer = SpotHistoryMatrixRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
         return Response(serializer.data, status=status.HTTP_200_OK)